@@ -11,6 +11,7 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from scipy import stats
+import math
 import time
 
 class GeneradorPseudoaleatorio:
@@ -44,28 +45,109 @@ class DistribucionDiscreta:
     
     @staticmethod
     def binomial(n, p, size, generador):
-        """Genera variables aleatorias con distribución Binomial"""
+        """Genera variables aleatorias con distribución Binomial (costo por variable independiente de n)"""
+        # Por simetría se trabaja con p <= 1/2 y se refleja el resultado
+        q = min(p, 1 - p)
         resultados = []
         for _ in range(size):
-            exitos = sum(1 for _ in range(n) if generador.siguiente() < p)
-            resultados.append(exitos)
+            if q == 0:
+                exitos = 0
+            elif n * q < 10:
+                exitos = DistribucionDiscreta._binomial_inversion(n, q, generador)
+            else:
+                exitos = DistribucionDiscreta._binomial_btrs(n, q, generador)
+            resultados.append(n - exitos if p > 0.5 else exitos)
         return resultados
     
+    @staticmethod
+    def _binomial_inversion(n, p, generador):
+        """Binomial por inversión secuencial (para n*p < 10, en promedio n*p + 1 pasos)"""
+        u = generador.siguiente()
+        k = 0
+        prob = (1 - p) ** n
+        acumulada = prob
+        razon = p / (1 - p)
+        while u >= acumulada and k < n:
+            k += 1
+            prob *= razon * (n - k + 1) / k
+            acumulada += prob
+        return k
+    
+    @staticmethod
+    def _binomial_btrs(n, p, generador):
+        """Binomial por rechazo BTRS de Hörmann (para n*p >= 10 y p <= 1/2)"""
+        q = 1 - p
+        spq = math.sqrt(n * p * q)
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        c = n * p + 0.5
+        v_r = 0.92 - 4.2 / b
+        alpha = (2.83 + 5.1 / b) * spq
+        lpq = math.log(p / q)
+        m = math.floor((n + 1) * p)
+        h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+        while True:
+            u = generador.siguiente() - 0.5
+            v = generador.siguiente()
+            us = 0.5 - abs(u)
+            if us == 0:
+                continue
+            k = math.floor((2 * a / us + b) * u + c)
+            if k < 0 or k > n:
+                continue
+            if us >= 0.07 and v <= v_r:
+                return k
+            if v > 0 and math.log(v * alpha / (a / (us * us) + b)) <= (
+                    h - math.lgamma(k + 1) - math.lgamma(n - k + 1) + (k - m) * lpq):
+                return k
+    
     @staticmethod
     def poisson(lam, size, generador):
-        """Genera variables aleatorias con distribución Poisson usando el algoritmo de Knuth"""
+        """Genera variables aleatorias con distribución Poisson (inversión para λ < 10, PTRS en otro caso)"""
         resultados = []
-        L = np.exp(-lam)
-        
         for _ in range(size):
-            k = 0
-            p = 1.0
-            while p > L:
-                k += 1
-                p *= generador.siguiente()
-            resultados.append(k - 1)
-        
+            if lam < 10:
+                resultados.append(DistribucionDiscreta._poisson_inversion(lam, generador))
+            else:
+                resultados.append(DistribucionDiscreta._poisson_ptrs(lam, generador))
         return resultados
+    
+    @staticmethod
+    def _poisson_inversion(lam, generador):
+        """Poisson por inversión secuencial (en promedio λ + 1 pasos)"""
+        u = generador.siguiente()
+        k = 0
+        prob = math.exp(-lam)
+        acumulada = prob
+        while u >= acumulada and prob > 0:
+            k += 1
+            prob *= lam / k
+            acumulada += prob
+        return k
+    
+    @staticmethod
+    def _poisson_ptrs(lam, generador):
+        """Poisson por rechazo PTRS de Hörmann (para λ >= 10, costo independiente de λ)"""
+        slam = math.sqrt(lam)
+        log_lam = math.log(lam)
+        b = 0.931 + 2.53 * slam
+        a = -0.059 + 0.02483 * b
+        inv_alpha = 1.1239 + 1.1328 / (b - 3.4)
+        v_r = 0.9277 - 3.6224 / (b - 2)
+        while True:
+            u = generador.siguiente() - 0.5
+            v = generador.siguiente()
+            us = 0.5 - abs(u)
+            if us == 0:
+                continue
+            k = math.floor((2 * a / us + b) * u + lam + 0.43)
+            if us >= 0.07 and v <= v_r:
+                return k
+            if k < 0 or (us < 0.013 and v > us):
+                continue
+            if v > 0 and math.log(v * inv_alpha / (a / (us * us) + b)) <= (
+                    -lam + k * log_lam - math.lgamma(k + 1)):
+                return k
 
 
 class DistribucionContinua:
@@ -3,15 +3,26 @@ Módulo core - Núcleo de la aplicación de simulación
 Contiene la lógica principal de generación, distribuciones y análisis
 """
 
-from .generadores import GeneradorPseudoaleatorio
-from .distribuciones import DistribucionDiscreta, DistribucionContinua
+from .generadores import (GeneradorPseudoaleatorio, GeneradorMersenneTwister, GeneradorPhilox,
+                          GeneradorPCG64, GeneradorXoshiro256, GestorFlujos,
+                          SecuenciaSobol, SecuenciaHalton, PoolGeneradores)
+from .distribuciones import DistribucionDiscreta, DistribucionContinua, DistribucionEmpirica
 from .pruebas_bondad import PruebasBondad
 from .monte_carlo import MonteCarlo
 
 __all__ = [
     'GeneradorPseudoaleatorio',
+    'GeneradorMersenneTwister',
+    'GeneradorPhilox',
+    'GeneradorPCG64',
+    'GeneradorXoshiro256',
+    'GestorFlujos',
+    'PoolGeneradores',
+    'SecuenciaSobol',
+    'SecuenciaHalton',
     'DistribucionDiscreta', 
     'DistribucionContinua',
+    'DistribucionEmpirica',
     'PruebasBondad',
     'MonteCarlo'
 ]
\ No newline at end of file
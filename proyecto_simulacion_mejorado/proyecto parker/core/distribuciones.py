@@ -6,8 +6,242 @@ Fecha: Octubre 2024
 
 import numpy as np
 import math
-from typing import List, Tuple, Optional, Union
-from .generadores import GeneradorPseudoaleatorio
+from functools import lru_cache
+from scipy import stats
+from typing import List, Tuple, Optional, Sequence, Union
+from .generadores import GeneradorPseudoaleatorio, TablaAlias, obtener_generador
+from .pruebas_bondad import PruebasBondad
+
+
+# log(k!) exacto (suma acumulada) para k < 256; Stirling para valores mayores
+_LOG_FACTORIAL_TABLA = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, 256)))])
+
+
+def _log_factorial(k: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Calcula log(k!) de forma vectorizada
+    
+    Args:
+        k: Enteros no negativos (escalar o arreglo)
+        
+    Returns:
+        Arreglo float64 con log(k!)
+    """
+    k = np.asarray(k, dtype=np.float64)
+    resultado = np.empty_like(k)
+    chicos = k < len(_LOG_FACTORIAL_TABLA)
+    resultado[chicos] = _LOG_FACTORIAL_TABLA[k[chicos].astype(np.intp)]
+    x = k[~chicos] + 1
+    # Serie de Stirling para log Γ(x); el término siguiente es < 1e-20 con x >= 256
+    resultado[~chicos] = ((x - 0.5) * np.log(x) - x + 0.5 * math.log(2 * math.pi) +
+                          1 / (12 * x) - 1 / (360 * x**3) + 1 / (1260 * x**5))
+    return resultado
+
+
+def _aceptar_por_lotes(n: int, proponer, tasa_aceptacion: float) -> np.ndarray:
+    """
+    Reúne n valores aceptados por un método de rechazo en lotes vectorizados
+    
+    Args:
+        n: Valores requeridos
+        proponer: Función que recibe m y devuelve (candidatos, aceptados)
+        tasa_aceptacion: Estimación de la fracción aceptada (dimensiona los lotes)
+        
+    Returns:
+        Arreglo con n valores aceptados
+    """
+    partes = []
+    faltan = n
+    while faltan > 0:
+        m = int(faltan / tasa_aceptacion * 1.05) + 16
+        candidatos, aceptados = proponer(m)
+        validos = candidatos[aceptados][:faltan]
+        partes.append(validos)
+        faltan -= len(validos)
+    return np.concatenate(partes) if partes else np.empty(0)
+
+
+# Tablas del Ziggurat normal; se construyen en el primer uso
+_ZIGGURAT = {}
+
+
+def _tablas_ziggurat() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Construye (o recupera) las tablas del Ziggurat normal de 256 capas
+    
+    Sigue a Marsaglia y Tsang (2000) para la densidad exp(-x²/2) en x >= 0:
+    x[0] es el ancho de la franja base (que incluye el área de la cola),
+    x[1] = r y x[i+1] se obtiene de igualar el área v de todas las capas;
+    x[256] = 0.
+    
+    Returns:
+        Tupla (x, k, f, x_con_signo): bordes de las capas, cocientes
+        x[i+1]/x[i] para la aceptación rápida, la densidad sin normalizar en
+        cada borde y los 256 anchos seguidos de sus negativos
+    """
+    if not _ZIGGURAT:
+        r, v = 3.6541528853610088, 4.92867323399e-3
+        densidad = lambda t: math.exp(-0.5 * t * t)
+        
+        x = np.empty(257)
+        x[0] = v / densidad(r)
+        x[1] = r
+        for i in range(1, 255):
+            x[i + 1] = math.sqrt(-2 * math.log(v / x[i] + densidad(x[i])))
+        x[256] = 0.0
+        f = np.array([densidad(t) for t in x])
+        _ZIGGURAT['tablas'] = (x, x[1:] / x[:-1], f, np.concatenate([x[:256], -x[:256]]))
+    return _ZIGGURAT['tablas']
+
+
+def _capas_ziggurat(m: int, generador: GeneradorPseudoaleatorio):
+    """
+    Propone m normales estándar del Ziggurat y marca las aceptadas
+    
+    Cada propuesta usa una palabra de 32 bits para la abscisa y 9 bits de
+    otra palabra (compartida entre tres propuestas) para la capa y el signo.
+    En más del 98% de los casos basta con una consulta a la tabla y una
+    comparación; la cuña y la cola se resuelven aparte.
+    
+    Args:
+        m: Número de propuestas
+        generador: Generador pseudoaleatorio
+        
+    Returns:
+        Tupla (valores, aceptados)
+    """
+    x, k, f, x_con_signo = _tablas_ziggurat()
+    r = x[1]
+    
+    extra = (m + 2) // 3
+    w = generador.bloque_palabras(m + extra)
+    u = w[:m] * 2.0**-32
+    w = w[m:]
+    indices = np.concatenate([w & 0x1FF, (w >> 9) & 0x1FF, (w >> 18) & 0x1FF])[:m]
+    # La tabla tiene 512 entradas: la segunda mitad lleva el signo negativo
+    valores = u * x_con_signo[indices]
+    aceptados = u < k[indices & 0xFF]
+    
+    lentos = np.flatnonzero(~aceptados)
+    if lentos.size:
+        capa_lenta = indices[lentos] & 0xFF
+        cola = lentos[capa_lenta == 0]
+        if cola.size:
+            # Cola normal más allá de r (Marsaglia, 1964)
+            def proponer(t: int):
+                e = -np.log1p(-generador.bloque(2 * t))
+                a, b = e[0::2] / r, e[1::2]
+                return r + a, 2 * b > a * a
+            
+            valores[cola] = np.copysign(_aceptar_por_lotes(cola.size, proponer, 0.9),
+                                        valores[cola])
+            aceptados[cola] = True
+        
+        cuna = lentos[capa_lenta != 0]
+        if cuna.size:
+            c = indices[cuna] & 0xFF
+            y = f[c] + generador.bloque(cuna.size) * (f[c + 1] - f[c])
+            aceptados[cuna] = y < np.exp(-0.5 * valores[cuna] ** 2)
+    
+    return valores, aceptados
+
+
+def _ziggurat(n: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
+    """
+    Genera n variables Normal(0, 1) por el método Ziggurat
+    
+    Args:
+        n: Número de muestras
+        generador: Generador pseudoaleatorio
+        
+    Returns:
+        Arreglo float64 de tamaño n
+    """
+    resultado, aceptados = _capas_ziggurat(n, generador)
+    # Los rechazos (menos del 2%) se vuelven a proponer hasta completar
+    pendientes = np.flatnonzero(~aceptados)
+    while pendientes.size:
+        valores, aceptados = _capas_ziggurat(pendientes.size, generador)
+        resultado[pendientes[aceptados]] = valores[aceptados]
+        pendientes = pendientes[~aceptados]
+    return resultado
+
+
+def _familia_scipy(distribucion: str):
+    """
+    Resuelve el nombre de una familia continua de scipy.stats
+    
+    Acepta los nombres de PruebasBondad ('normal', 'exponencial', 'uniforme')
+    y cualquier nombre de distribución continua de scipy.stats ('gamma',
+    'beta', 'weibull_min', ...).
+    """
+    if distribucion in PruebasBondad.FAMILIAS:
+        return PruebasBondad.FAMILIAS[distribucion]
+    familia = getattr(stats, distribucion, None)
+    if not isinstance(familia, stats.rv_continuous):
+        raise ValueError(f"Distribución {distribucion} no soportada")
+    return familia
+
+
+@lru_cache(maxsize=32)
+def _tabla_inversa(distribucion: str, params: Tuple[float, ...],
+                   tolerancia: float) -> Tuple[np.ndarray, ...]:
+    """
+    Construye una tabla de la inversa de la función de distribución
+    
+    Entre nodos u_i se interpola x = F⁻¹(u) con un polinomio cúbico de Hermite
+    (pendientes 1/f(x_i)). Los intervalos se parten por la mitad hasta que el
+    error en u, |F(x̂(u)) - u|, es menor que la tolerancia en el punto medio
+    de cada uno. Las colas no acotadas se truncan en tolerancia y
+    1 - tolerancia. Una tabla guía (Chen y Asau) sobre una rejilla uniforme
+    en u da directamente el intervalo de casi todas las muestras. La caché
+    conserva las tablas usadas más recientemente.
+    
+    Args:
+        distribucion: Nombre de la familia (ver _familia_scipy)
+        params: Parámetros posicionales de la familia (forma, loc, scale)
+        tolerancia: Error máximo admitido en u
+        
+    Returns:
+        Tupla (nodos, guia, inv_ancho, c0, c1, c2, c3): nodos en u, tabla
+        guía, inverso del ancho de cada intervalo y coeficientes del polinomio
+        en t = (u - u_i)/ancho
+    """
+    dist = _familia_scipy(distribucion)(*params)
+    inferior, superior = dist.support()
+    u = np.linspace(0.0 if np.isfinite(inferior) else tolerancia,
+                    1.0 if np.isfinite(superior) else 1 - tolerancia, 65)
+    x = dist.ppf(u)
+    
+    def coeficientes(u: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, ...]:
+        h = np.diff(u)
+        with np.errstate(divide='ignore'):
+            m = 1 / dist.pdf(x)
+        # Donde la densidad se anula (bordes del soporte) se usa la secante
+        secante = np.diff(x) / h
+        malas = ~np.isfinite(m)
+        m[malas] = np.concatenate([secante, secante[-1:]])[malas]
+        delta = np.diff(x)
+        m0, m1 = h * m[:-1], h * m[1:]
+        return (1 / h, x[:-1], m0, 3 * delta - 2 * m0 - m1, m0 + m1 - 2 * delta)
+    
+    for _ in range(60):
+        inv_h, c0, c1, c2, c3 = coeficientes(u, x)
+        medios = (u[:-1] + u[1:]) / 2
+        estimado = ((0.125 * c3 + 0.25 * c2) + 0.5 * c1) + c0
+        malos = np.flatnonzero(np.abs(dist.cdf(estimado) - medios) > tolerancia)
+        if malos.size == 0:
+            break
+        # Se insertan los puntos medios de los intervalos que no cumplen
+        u = np.insert(u, malos + 1, medios[malos])
+        x = np.insert(x, malos + 1, dist.ppf(medios[malos]))
+    
+    # guia[j] es el intervalo que contiene a j/M; con M = 32 veces el número
+    # de intervalos, a lo sumo ~3% de las celdas contienen un nodo
+    celdas = 32 * len(inv_h)
+    guia = np.searchsorted(u, np.arange(celdas + 1) / celdas, side='right') - 1
+    np.clip(guia, 0, len(inv_h) - 1, out=guia)
+    return u, guia, inv_h, c0, c1, c2, c3
 
 
 class DistribucionDiscreta:
@@ -29,13 +263,18 @@ class DistribucionDiscreta:
         if not 0 <= p <= 1:
             raise ValueError("p debe estar en [0, 1]")
         
-        return [1 if generador.siguiente() < p else 0 for _ in range(size)]
+        return (generador.bloque(size) < p).astype(int).tolist()
     
     @staticmethod
-    def binomial(n: int, p: float, size: int, generador: GeneradorPseudoaleatorio) -> List[int]:
+    def binomial(n: int, p: float, size: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
         """
         Genera variables Binomial(n, p)
         
+        El costo por variable no depende de n: con n·min(p, 1-p) < 10 se usa
+        inversión sobre la tabla de la función de distribución, y en otro caso
+        el rechazo BTRS de Hörmann (transformada con rechazo y compresión),
+        ambos vectorizados sobre la muestra.
+        
         Args:
             n: Número de ensayos
             p: Probabilidad de éxito
@@ -43,53 +282,189 @@ class DistribucionDiscreta:
             generador: Generador pseudoaleatorio
             
         Returns:
-            Lista de variables Binomial
+            Arreglo int64 de variables Binomial
         """
         if n <= 0:
             raise ValueError("n debe ser positivo")
         if not 0 <= p <= 1:
             raise ValueError("p debe estar en [0, 1]")
         
-        # Método directo: suma de Bernoullis
-        resultados = []
-        for _ in range(size):
-            exitos = sum(1 for _ in range(n) if generador.siguiente() < p)
-            resultados.append(exitos)
-        return resultados
+        size = GeneradorPseudoaleatorio._validar_tamano(size)
+        # Por simetría se trabaja con p <= 1/2 y se refleja al final
+        q = min(p, 1 - p)
+        if q == 0:
+            exitos = np.zeros(size, dtype=np.int64)
+        elif n * q < 10:
+            exitos = DistribucionDiscreta._binomial_inversion(n, q, size, generador)
+        else:
+            exitos = DistribucionDiscreta._binomial_btrs(n, q, size, generador)
+        return n - exitos if p > 0.5 else exitos
+    
+    @staticmethod
+    def _binomial_inversion(n: int, p: float, size: int,
+                            generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Binomial por inversión de la tabla acumulada (para n·p pequeño)"""
+        # Más allá de n·p + 20·sqrt(n·p·q) + 30 la cola es menor que 1e-20
+        k_max = int(min(n, n * p + 20 * math.sqrt(n * p * (1 - p)) + 30))
+        k = np.arange(k_max + 1)
+        log_pmf = (_log_factorial(n) - _log_factorial(k) - _log_factorial(n - k) +
+                   k * math.log(p) + (n - k) * math.log1p(-p))
+        acumulada = np.cumsum(np.exp(log_pmf))
+        indices = np.searchsorted(acumulada, generador.bloque(size), side='right')
+        return np.minimum(indices, k_max).astype(np.int64)
     
     @staticmethod
-    def poisson(lam: float, size: int, generador: GeneradorPseudoaleatorio) -> List[int]:
+    def _binomial_btrs(n: int, p: float, size: int,
+                       generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Binomial por BTRS (Hörmann, 1993) para n·p >= 10 y p <= 1/2"""
+        q = 1 - p
+        spq = math.sqrt(n * p * q)
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        c = n * p + 0.5
+        v_r = 0.92 - 4.2 / b
+        alpha = (2.83 + 5.1 / b) * spq
+        lpq = math.log(p / q)
+        m = math.floor((n + 1) * p)
+        h = float(_log_factorial(m) + _log_factorial(n - m))
+        
+        def proponer(tam: int):
+            uv = generador.bloque(2 * tam)
+            u, v = uv[0::2] - 0.5, uv[1::2]
+            us = 0.5 - np.abs(u)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = np.floor((2 * a / us + b) * u + c)
+                validos = (k >= 0) & (k <= n)
+                # Aceptación rápida en la zona central de la envolvente
+                aceptados = validos & (us >= 0.07) & (v <= v_r)
+                dudosos = validos & ~aceptados
+                kd = k[dudosos]
+                usd = us[dudosos]
+                cota = (h - _log_factorial(kd) - _log_factorial(n - kd) + (kd - m) * lpq)
+                aceptados[dudosos] = np.log(v[dudosos] * alpha / (a / usd**2 + b)) <= cota
+            return k, aceptados
+        
+        # BTRS acepta en promedio más del 85% de las propuestas
+        return _aceptar_por_lotes(size, proponer, 0.85).astype(np.int64)
+    
+    @staticmethod
+    def poisson(lam: Union[float, np.ndarray], size: int,
+                generador: GeneradorPseudoaleatorio) -> np.ndarray:
         """
-        Genera variables Poisson(λ) usando el algoritmo de Knuth
+        Genera variables Poisson(λ)
+        
+        Con λ < 10 se usa inversión sobre la tabla de la función de
+        distribución; con λ >= 10, el rechazo PTRS de Hörmann (transformada con
+        rechazo), cuyo costo no crece con λ. Ambos están vectorizados sobre la
+        muestra y no dependen de exp(-λ), que se anula para λ > 745.
         
         Args:
-            lam: Parámetro de tasa
+            lam: Parámetro de tasa (escalar o arreglo de tamaño size)
             size: Número de muestras
             generador: Generador pseudoaleatorio
             
         Returns:
-            Lista de variables Poisson
+            Arreglo int64 de variables Poisson
         """
-        if lam <= 0:
+        lam = np.asarray(lam, dtype=np.float64)
+        if np.any(lam <= 0):
             raise ValueError("λ debe ser positivo")
         
-        resultados = []
-        L = math.exp(-lam)
-        
-        for _ in range(size):
-            k = 0
-            p = 1.0
-            while p > L:
-                k += 1
-                p *= generador.siguiente()
-            resultados.append(k - 1)
-        
-        return resultados
+        size = GeneradorPseudoaleatorio._validar_tamano(size)
+        return DistribucionDiscreta._poisson(lam, size, generador)
+    
+    @staticmethod
+    def _poisson(lam: np.ndarray, size: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Elige el método de Poisson para λ escalar o por posición (sin validar)"""
+        if lam.ndim == 0:
+            if lam < 10:
+                return DistribucionDiscreta._poisson_inversion(float(lam), size, generador)
+            return DistribucionDiscreta._poisson_ptrs(lam, size, generador)
+        
+        lam = np.broadcast_to(lam, (size,))
+        resultado = np.empty(size, dtype=np.int64)
+        chicos = np.flatnonzero(lam < 10)
+        grandes = np.flatnonzero(lam >= 10)
+        resultado[chicos] = DistribucionDiscreta._poisson_secuencial(lam[chicos], generador)
+        resultado[grandes] = DistribucionDiscreta._poisson_ptrs(lam[grandes], grandes.size,
+                                                                 generador)
+        return resultado
+    
+    @staticmethod
+    def _poisson_inversion(lam: float, size: int,
+                           generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Poisson por inversión de la tabla acumulada (para λ < 10)"""
+        # Más allá de λ + 20·sqrt(λ) + 30 la cola es menor que 1e-20
+        k_max = int(lam + 20 * math.sqrt(lam) + 30)
+        k = np.arange(k_max + 1)
+        acumulada = np.cumsum(np.exp(k * math.log(lam) - lam - _log_factorial(k)))
+        indices = np.searchsorted(acumulada, generador.bloque(size), side='right')
+        return np.minimum(indices, k_max).astype(np.int64)
+    
+    @staticmethod
+    def _poisson_secuencial(lam: np.ndarray, generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Poisson por inversión secuencial con un λ < 10 distinto por posición"""
+        u = generador.bloque(len(lam))
+        k = np.zeros(len(lam), dtype=np.int64)
+        prob = np.exp(-lam)
+        acumulada = prob.copy()
+        activos = np.flatnonzero(u >= acumulada)
+        paso = 0
+        # Cada paso avanza un valor en todas las posiciones aún no resueltas
+        while activos.size:
+            paso += 1
+            prob[activos] *= lam[activos] / paso
+            acumulada[activos] += prob[activos]
+            k[activos] = paso
+            activos = activos[(u[activos] >= acumulada[activos]) & (prob[activos] > 0)]
+        return k
+    
+    @staticmethod
+    def _poisson_ptrs(lam: np.ndarray, size: int,
+                      generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """Poisson por PTRS (Hörmann, 1993) para λ >= 10, escalar o por posición"""
+        slam = np.sqrt(lam)
+        b = 0.931 + 2.53 * slam
+        # Constantes en filas: (λ, log λ, a, b, 1/α, v_r)
+        constantes = np.array([lam, np.log(lam), -0.059 + 0.02483 * b, b,
+                               1.1239 + 1.1328 / (b - 3.4), 0.9277 - 3.6224 / (b - 2)])
+        
+        def proponer(m: int, constantes: np.ndarray):
+            lam, log_lam, a, b, inv_alpha, v_r = constantes
+            uv = generador.bloque(2 * m)
+            u, v = uv[0::2] - 0.5, uv[1::2]
+            us = 0.5 - np.abs(u)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                k = np.floor((2 * a / us + b) * u + lam + 0.43)
+                # Aceptación rápida en la zona central de la envolvente
+                aceptados = (us >= 0.07) & (v <= v_r)
+                dudosos = np.flatnonzero(~aceptados & (k >= 0) & ((us >= 0.013) | (v <= us)))
+                if constantes.ndim > 1:
+                    lam, log_lam, a, b, inv_alpha = constantes[:5, dudosos]
+                kd = k[dudosos]
+                usd = us[dudosos]
+                cota = -lam + kd * log_lam - _log_factorial(kd)
+                aceptados[dudosos] = (np.log(v[dudosos] * inv_alpha / (a / usd**2 + b))
+                                      <= cota)
+            return k, aceptados
+        
+        # Solo se vuelven a proponer las posiciones rechazadas (menos del 15%)
+        valores, aceptados = proponer(size, constantes)
+        pendientes = np.flatnonzero(~aceptados)
+        while pendientes.size:
+            nuevos, aceptados = proponer(pendientes.size, constantes[:, pendientes]
+                                         if constantes.ndim > 1 else constantes)
+            valores[pendientes[aceptados]] = nuevos[aceptados]
+            pendientes = pendientes[~aceptados]
+        return valores.astype(np.int64)
     
     @staticmethod
-    def geometrica(p: float, size: int, generador: GeneradorPseudoaleatorio) -> List[int]:
+    def geometrica(p: float, size: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
         """
-        Genera variables Geométrica(p)
+        Genera variables Geométrica(p) (número de ensayos hasta el primer éxito)
+        
+        Usa la transformada inversa en forma cerrada,
+        X = 1 + floor(ln(1 - U) / ln(1 - p)), con costo independiente de p.
         
         Args:
             p: Probabilidad de éxito
@@ -97,24 +472,29 @@ class DistribucionDiscreta:
             generador: Generador pseudoaleatorio
             
         Returns:
-            Lista de variables Geométricas
+            Arreglo int64 de variables Geométricas
         """
         if not 0 < p <= 1:
             raise ValueError("p debe estar en (0, 1]")
         
-        resultados = []
-        for _ in range(size):
-            intentos = 1
-            while generador.siguiente() > p:
-                intentos += 1
-            resultados.append(intentos)
+        size = GeneradorPseudoaleatorio._validar_tamano(size)
+        if p == 1:
+            return np.ones(size, dtype=np.int64)
         
-        return resultados
+        u = generador.bloque(size)
+        # 1 - U está en (0, 1], así que el logaritmo es finito
+        np.log1p(np.negative(u, out=u), out=u)
+        u /= math.log1p(-p)
+        return np.floor(u, out=u).astype(np.int64) + 1
     
     @staticmethod
-    def binomial_negativa(r: int, p: float, size: int, generador: GeneradorPseudoaleatorio) -> List[int]:
+    def binomial_negativa(r: int, p: float, size: int,
+                          generador: GeneradorPseudoaleatorio) -> np.ndarray:
         """
-        Genera variables Binomial Negativa(r, p)
+        Genera variables Binomial Negativa(r, p) (número de ensayos hasta r éxitos)
+        
+        Usa la mezcla Gamma-Poisson: los fracasos son Poisson(Λ) con
+        Λ ~ Gamma(r, (1 - p)/p), de modo que el costo no depende de r ni de p.
         
         Args:
             r: Número de éxitos requeridos
@@ -123,32 +503,115 @@ class DistribucionDiscreta:
             generador: Generador pseudoaleatorio
             
         Returns:
-            Lista de variables Binomial Negativa
+            Arreglo int64 de variables Binomial Negativa
         """
         if r <= 0:
             raise ValueError("r debe ser positivo")
         if not 0 < p <= 1:
             raise ValueError("p debe estar en (0, 1]")
         
-        resultados = []
-        for _ in range(size):
-            exitos = 0
-            intentos = 0
-            while exitos < r:
-                intentos += 1
-                if generador.siguiente() < p:
-                    exitos += 1
-            resultados.append(intentos)
-        
-        return resultados
+        size = GeneradorPseudoaleatorio._validar_tamano(size)
+        if p == 1:
+            return np.full(size, r, dtype=np.int64)
+        
+        # gamma divide por β: Gamma(r, β = p/(1-p)) tiene escala (1-p)/p
+        lam = DistribucionContinua.gamma(r, p / (1 - p), size, generador)
+        np.maximum(lam, np.finfo(np.float64).tiny, out=lam)
+        return r + DistribucionDiscreta._poisson(lam, size, generador)
+
+
+class DistribucionEmpirica:
+    """
+    Distribución discreta arbitraria sobre un conjunto finito de valores
+    
+    Construye una tabla de alias (Walker/Vose) en O(k) a partir de una función
+    de probabilidad o de datos observados; cada variable cuesta después O(1)
+    y el muestreo es vectorizado, sin importar el número de resultados.
+    """
+    
+    def __init__(self, valores: Sequence[float], probabilidades: Optional[Sequence[float]] = None):
+        """
+        Construye la distribución
+        
+        Args:
+            valores: Resultados posibles
+            probabilidades: Pesos no negativos de cada resultado (no necesitan
+                sumar 1); si se omiten, los resultados son equiprobables
+        """
+        self.valores = np.asarray(valores)
+        if self.valores.ndim != 1 or len(self.valores) == 0:
+            raise ValueError("Los valores deben ser un vector no vacío")
+        if probabilidades is None:
+            probabilidades = np.ones(len(self.valores))
+        if len(probabilidades) != len(self.valores):
+            raise ValueError("valores y probabilidades deben tener la misma longitud")
+        
+        self.tabla = TablaAlias(probabilidades)
+        self.probabilidades = self.tabla.probabilidades
+    
+    @classmethod
+    def desde_datos(cls, datos: Sequence[float]) -> 'DistribucionEmpirica':
+        """
+        Construye la distribución empírica de una muestra observada
+        
+        Args:
+            datos: Observaciones
+            
+        Returns:
+            DistribucionEmpirica con las frecuencias relativas de cada valor
+        """
+        valores, conteos = np.unique(np.asarray(datos), return_counts=True)
+        return cls(valores, conteos)
+    
+    def muestrear(self, size: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """
+        Genera variables de la distribución
+        
+        Args:
+            size: Número de muestras
+            generador: Generador pseudoaleatorio
+            
+        Returns:
+            Arreglo con valores muestreados
+        """
+        return self.valores[self.tabla.muestrear(size, generador)]
+    
+    def media(self) -> float:
+        """Media teórica de la distribución"""
+        return float(np.dot(self.probabilidades, self.valores))
+    
+    def varianza(self) -> float:
+        """Varianza teórica de la distribución"""
+        return float(np.dot(self.probabilidades, (self.valores - self.media()) ** 2))
 
 
 class DistribucionContinua:
-    """Clase para generar variables aleatorias de distribuciones continuas"""
+    """
+    Clase para generar variables aleatorias de distribuciones continuas
+    
+    Todos los métodos devuelven arreglos de NumPy y se calculan en bloque:
+    los parámetros pueden ser escalares o arreglos compatibles (broadcasting)
+    con la forma de la muestra, y out= permite escribir en un arreglo float64
+    existente sin reservar memoria para el resultado.
+    """
+    
+    @staticmethod
+    def _salida(size: Optional[int], out: Optional[np.ndarray]) -> np.ndarray:
+        """Devuelve el arreglo destino: out (validado) o uno nuevo de tamaño size"""
+        if out is None:
+            if size is None:
+                raise ValueError("Se requiere size o out")
+            return np.empty(GeneradorPseudoaleatorio._validar_tamano(size))
+        if out.dtype != np.float64:
+            raise ValueError("out debe ser un arreglo float64")
+        if size is not None and out.size != size:
+            raise ValueError("out debe tener exactamente size elementos")
+        return out
     
     @staticmethod
     def uniforme(low: float = 0.0, high: float = 1.0, size: int = 1, 
-                generador: GeneradorPseudoaleatorio = None) -> List[float]:
+                generador: GeneradorPseudoaleatorio = None,
+                out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Genera variables Uniforme(low, high)
         
@@ -157,17 +620,22 @@ class DistribucionContinua:
             high: Límite superior
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Uniformes
+            Arreglo de variables Uniformes
         """
-        if generador is None:
-            generador = GeneradorPseudoaleatorio()
+        generador = obtener_generador(generador)
+        destino = DistribucionContinua._salida(size, out)
         
-        return generador.uniform(low, high, size)
+        generador.llenar(destino)
+        destino *= np.subtract(high, low)
+        destino += low
+        return destino
     
     @staticmethod
-    def exponencial(lam: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def exponencial(lam: Union[float, np.ndarray], size: int, generador: GeneradorPseudoaleatorio,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Genera variables Exponencial(λ) usando transformada inversa
         
@@ -175,152 +643,260 @@ class DistribucionContinua:
             lam: Parámetro de tasa
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Exponenciales
+            Arreglo de variables Exponenciales
         """
-        if lam <= 0:
+        if np.any(np.asarray(lam) <= 0):
             raise ValueError("λ debe ser positivo")
         
-        resultados = []
-        for _ in range(size):
-            u = generador.siguiente()
-            # Método de la transformada inversa
-            x = -math.log(u) / lam
-            resultados.append(x)
-        return resultados
+        destino = DistribucionContinua._salida(size, out)
+        generador.llenar(destino)
+        # Método de la transformada inversa: -ln(1 - U), finito para U en [0, 1).
+        # Vectorizado es más rápido que un Ziggurat exponencial, cuyo costo lo
+        # domina la generación de palabras
+        np.log1p(np.negative(destino, out=destino), out=destino)
+        np.negative(destino, out=destino)
+        destino /= lam
+        return destino
+    
+    @staticmethod
+    def _normales_estandar(destino: np.ndarray, generador: GeneradorPseudoaleatorio):
+        """Llena destino con normales estándar por Ziggurat"""
+        destino[...] = _ziggurat(destino.size, generador).reshape(destino.shape)
     
     @staticmethod
-    def normal(mu: float, sigma: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def _normales_box_muller(destino: np.ndarray, generador: GeneradorPseudoaleatorio):
+        """Llena destino con normales estándar por Box-Muller"""
+        plano = destino.reshape(-1)
+        n = plano.size
+        pares = (n + 1) // 2
+        u = generador.bloque(2 * pares)
+        u1, u2 = u[0::2], u[1::2]
+        
+        # Transformación Box-Muller
+        radio = np.sqrt(-2 * np.log1p(-u1))
+        angulo = u2 * (2 * math.pi)
+        plano[0::2] = radio[:(n + 1) // 2] * np.cos(angulo[:(n + 1) // 2])
+        plano[1::2] = radio[:n // 2] * np.sin(angulo[:n // 2])
+        if not np.shares_memory(plano, destino):
+            destino[...] = plano.reshape(destino.shape)
+    
+    @staticmethod
+    def normal(mu: Union[float, np.ndarray], sigma: Union[float, np.ndarray], size: int,
+               generador: GeneradorPseudoaleatorio, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Genera variables Normal(μ, σ) usando Box-Muller
+        Genera variables Normal(μ, σ) usando el método Ziggurat
         
         Args:
             mu: Media
             sigma: Desviación estándar
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Normales
+            Arreglo de variables Normales
         """
-        if sigma <= 0:
+        if np.any(np.asarray(sigma) <= 0):
             raise ValueError("σ debe ser positivo")
         
-        resultados = []
-        pairs_needed = (size + 1) // 2
+        destino = DistribucionContinua._salida(size, out)
+        DistribucionContinua._normales_estandar(destino, generador)
+        destino *= sigma
+        destino += mu
+        return destino
+    
+    @staticmethod
+    def normal_box_muller(mu: Union[float, np.ndarray], sigma: Union[float, np.ndarray], size: int,
+                          generador: GeneradorPseudoaleatorio,
+                          out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Genera variables Normal(μ, σ) usando Box-Muller
         
-        for _ in range(pairs_needed):
-            u1 = generador.siguiente()
-            u2 = generador.siguiente()
-            
-            # Transformación Box-Muller
-            z0 = math.sqrt(-2 * math.log(u1)) * math.cos(2 * math.pi * u2)
-            z1 = math.sqrt(-2 * math.log(u1)) * math.sin(2 * math.pi * u2)
+        Args:
+            mu: Media
+            sigma: Desviación estándar
+            size: Número de muestras
+            generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
-            resultados.append(mu + sigma * z0)
-            if len(resultados) < size:
-                resultados.append(mu + sigma * z1)
+        Returns:
+            Arreglo de variables Normales
+        """
+        if np.any(np.asarray(sigma) <= 0):
+            raise ValueError("σ debe ser positivo")
         
-        return resultados[:size]
+        destino = DistribucionContinua._salida(size, out)
+        DistribucionContinua._normales_box_muller(destino, generador)
+        destino *= sigma
+        destino += mu
+        return destino
     
     @staticmethod
-    def normal_polar(mu: float, sigma: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def normal_polar(mu: Union[float, np.ndarray], sigma: Union[float, np.ndarray], size: int,
+                     generador: GeneradorPseudoaleatorio,
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Genera variables Normal(μ, σ) usando método polar (más eficiente)
+        Genera variables Normal(μ, σ) usando método polar (sin funciones trigonométricas)
+        
+        Los pares (u1, u2) fuera del disco unidad se descartan por lotes
+        (se acepta π/4 de los puntos).
         
         Args:
             mu: Media
             sigma: Desviación estándar
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Normales
+            Arreglo de variables Normales
         """
-        if sigma <= 0:
+        if np.any(np.asarray(sigma) <= 0):
             raise ValueError("σ debe ser positivo")
         
-        resultados = []
-        pairs_needed = (size + 1) // 2
-        
-        for _ in range(pairs_needed):
-            while True:
-                u1 = generador.siguiente() * 2 - 1  # [-1, 1]
-                u2 = generador.siguiente() * 2 - 1
-                s = u1*u1 + u2*u2
-                
-                if 0 < s < 1:
-                    break
-            
-            # Transformación polar
-            z0 = u1 * math.sqrt(-2 * math.log(s) / s)
-            z1 = u2 * math.sqrt(-2 * math.log(s) / s)
-            
-            resultados.append(mu + sigma * z0)
-            if len(resultados) < size:
-                resultados.append(mu + sigma * z1)
-        
-        return resultados[:size]
+        destino = DistribucionContinua._salida(size, out)
+        n = destino.size
+        
+        def proponer(m: int):
+            u = generador.bloque(2 * m) * 2 - 1  # [-1, 1]
+            pares = u.reshape(m, 2)
+            s = np.einsum('ij,ij->i', pares, pares)
+            return np.column_stack([pares, s]), (s > 0) & (s < 1)
+        
+        puntos = _aceptar_por_lotes((n + 1) // 2, proponer, math.pi / 4)
+        s = puntos[:, 2]
+        # Transformación polar
+        factor = np.sqrt(-2 * np.log(s) / s)
+        z = (puntos[:, :2] * factor[:, None]).reshape(-1)[:n]
+        
+        destino[...] = z.reshape(destino.shape)
+        destino *= sigma
+        destino += mu
+        return destino
     
     @staticmethod
-    def gamma(alpha: float, beta: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def gamma(alpha: Union[float, np.ndarray], beta: Union[float, np.ndarray], size: int,
+              generador: GeneradorPseudoaleatorio, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Genera variables Gamma(α, β) usando método de aceptación-rechazo
         
+        Usa el algoritmo de Marsaglia y Tsang (2000) por lotes: se proponen
+        d·(1 + c·Z)³ con Z normal (Ziggurat), se aceptan con una máscara y solo
+        se vuelven a proponer las posiciones rechazadas. Para α < 1 se genera
+        Gamma(α + 1) y se multiplica por U^(1/α). El resultado se divide por β.
+        
         Args:
-            alpha: Parámetro de forma
+            alpha: Parámetro de forma (escalar o arreglo compatible)
             beta: Parámetro de escala
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Gamma
+            Arreglo de variables Gamma
         """
-        if alpha <= 0 or beta <= 0:
+        alpha = np.asarray(alpha, dtype=np.float64)
+        if np.any(alpha <= 0) or np.any(np.asarray(beta) <= 0):
             raise ValueError("α y β deben ser positivos")
         
-        resultados = []
-        for _ in range(size):
-            # Algoritmo simple para alpha > 1
-            if alpha > 1:
-                a = 1 / math.sqrt(2 * alpha - 1)
-                b = alpha - math.log(4)
-                c = alpha + 1 / a
-                
-                while True:
-                    u1 = generador.siguiente()
-                    u2 = generador.siguiente()
-                    
-                    v = a * math.log(u1 / (1 - u1))
-                    y = alpha * math.exp(v)
-                    z = u1 * u1 * u2
-                    w = b + c * v - y
-                    
-                    if w + 1 - math.log(4) >= 0 or w >= math.log(z):
-                        resultados.append(y / beta)
-                        break
+        destino = DistribucionContinua._salida(size, out)
+        n = destino.size
+        if alpha.ndim:
+            alpha = np.broadcast_to(alpha, destino.shape).reshape(-1)
+        
+        # Constantes calculadas una sola vez (por posición si α es un arreglo)
+        d = np.where(alpha < 1, alpha + 1, alpha) - 1 / 3
+        c = 1 / np.sqrt(9 * d)
+        
+        def proponer(m: int, d: np.ndarray, c: np.ndarray):
+            z = _ziggurat(m, generador)
+            u = generador.bloque(m)
+            v = 1 + c * z
+            v = v * v * v
+            z2 = z * z
+            # Aceptación rápida (compresión); la prueba exacta solo donde falla
+            aceptados = u < 1 - 0.0331 * z2 * z2
+            aceptados &= v > 0
+            dudosos = np.flatnonzero(~aceptados & (v > 0))
+            if dudosos.size:
+                dd = d[dudosos] if np.ndim(d) else d
+                vd = v[dudosos]
+                with np.errstate(divide='ignore'):
+                    aceptados[dudosos] = (np.log(u[dudosos]) <
+                                          0.5 * z2[dudosos] + dd * (1 - vd + np.log(vd)))
+            v *= d
+            return v, aceptados
+        
+        valores, aceptados = proponer(n, d, c)
+        pendientes = np.flatnonzero(~aceptados)
+        while pendientes.size:
+            if alpha.ndim:
+                nuevos, aceptados = proponer(pendientes.size, d[pendientes], c[pendientes])
             else:
-                # Para alpha <= 1
-                while True:
-                    u = generador.siguiente()
-                    v = generador.siguiente()
-                    
-                    if u <= math.e / (math.e + alpha):
-                        x = ( (math.e + alpha) * u / math.e ) ** (1 / alpha)
-                        if v <= math.exp(-x):
-                            resultados.append(x / beta)
-                            break
-                    else:
-                        x = -math.log( (math.e + alpha) * (1 - u) / (alpha * math.e) )
-                        if v <= x ** (alpha - 1):
-                            resultados.append(x / beta)
-                            break
-        
-        return resultados
+                nuevos, aceptados = proponer(pendientes.size, d, c)
+            valores[pendientes[aceptados]] = nuevos[aceptados]
+            pendientes = pendientes[~aceptados]
+        
+        if np.any(alpha < 1):
+            chicos = np.flatnonzero(np.broadcast_to(alpha < 1, (n,)))
+            a_chicos = alpha[chicos] if alpha.ndim else alpha
+            # Refuerzo U^(1/α), con U en (0, 1]
+            valores[chicos] *= np.exp(np.log1p(-generador.bloque(chicos.size)) / a_chicos)
+        
+        destino[...] = valores.reshape(destino.shape)
+        destino /= beta
+        return destino
     
     @staticmethod
-    def lognormal(mu: float, sigma: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def inversa_tabulada(distribucion: str, params: Tuple, size: int,
+                         generador: GeneradorPseudoaleatorio, tolerancia: float = 1e-10,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Genera variables de una familia continua de scipy.stats por transformada inversa
+        
+        La inversa de la función de distribución se tabula una vez por
+        (familia, parámetros, tolerancia) y se guarda en una caché LRU; cada
+        muestra cuesta después una consulta a la tabla guía (búsqueda binaria
+        en pocos casos) y un polinomio cúbico, sin llamadas a ppf.
+        
+        Args:
+            distribucion: Familia de PruebasBondad ('normal', 'exponencial',
+                'uniforme') o nombre de una distribución continua de scipy.stats
+            params: Parámetros en el orden de scipy.stats (forma, loc, scale)
+            size: Número de muestras
+            generador: Generador pseudoaleatorio
+            tolerancia: Error máximo en u de la inversa tabulada
+            out: Arreglo destino opcional
+            
+        Returns:
+            Arreglo de variables de la distribución
+        """
+        if not 0 < tolerancia < 0.01:
+            raise ValueError("La tolerancia debe estar en (0, 0.01)")
+        
+        nodos, guia, inv_h, c0, c1, c2, c3 = _tabla_inversa(
+            distribucion, tuple(float(p) for p in params), float(tolerancia))
+        destino = DistribucionContinua._salida(size, out)
+        
+        u = generador.bloque(destino.size)
+        celda = (u * (len(guia) - 1)).astype(np.intp)
+        i = guia[celda]
+        # Solo las celdas que contienen un nodo requieren búsqueda binaria
+        ambiguos = np.flatnonzero(guia[celda + 1] != i)
+        i[ambiguos] = np.searchsorted(nodos, u[ambiguos], side='right') - 1
+        np.clip(i, 0, len(inv_h) - 1, out=i)
+        t = (u - nodos[i]) * inv_h[i]
+        # En las colas truncadas t queda fuera de [0, 1]
+        np.clip(t, 0.0, 1.0, out=t)
+        destino[...] = (((c3[i] * t + c2[i]) * t + c1[i]) * t + c0[i]).reshape(destino.shape)
+        return destino
+    
+    @staticmethod
+    def lognormal(mu: Union[float, np.ndarray], sigma: Union[float, np.ndarray], size: int,
+                  generador: GeneradorPseudoaleatorio, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Genera variables Log-Normal(μ, σ)
         
@@ -329,15 +905,17 @@ class DistribucionContinua:
             sigma: Desviación estándar del logaritmo
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Log-Normales
+            Arreglo de variables Log-Normales
         """
-        normales = DistribucionContinua.normal(mu, sigma, size, generador)
-        return [math.exp(x) for x in normales]
+        destino = DistribucionContinua.normal(mu, sigma, size, generador, out)
+        return np.exp(destino, out=destino)
     
     @staticmethod
-    def weibull(alpha: float, beta: float, size: int, generador: GeneradorPseudoaleatorio) -> List[float]:
+    def weibull(alpha: Union[float, np.ndarray], beta: Union[float, np.ndarray], size: int,
+                generador: GeneradorPseudoaleatorio, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Genera variables Weibull(α, β)
         
@@ -346,20 +924,21 @@ class DistribucionContinua:
             beta: Parámetro de escala
             size: Número de muestras
             generador: Generador pseudoaleatorio
+            out: Arreglo destino opcional
             
         Returns:
-            Lista de variables Weibull
+            Arreglo de variables Weibull
         """
-        if alpha <= 0 or beta <= 0:
+        if np.any(np.asarray(alpha) <= 0) or np.any(np.asarray(beta) <= 0):
             raise ValueError("α y β deben ser positivos")
         
-        resultados = []
-        for _ in range(size):
-            u = generador.siguiente()
-            x = beta * (-math.log(u)) ** (1 / alpha)
-            resultados.append(x)
-        
-        return resultados
+        destino = DistribucionContinua._salida(size, out)
+        generador.llenar(destino)
+        np.log1p(np.negative(destino, out=destino), out=destino)
+        np.negative(destino, out=destino)
+        np.power(destino, np.divide(1, alpha), out=destino)
+        destino *= beta
+        return destino
 
 
 class Estadisticos:
@@ -376,7 +955,7 @@ class Estadisticos:
         Returns:
             Diccionario con estadísticos
         """
-        if not datos:
+        if len(datos) == 0:
             raise ValueError("La lista de datos no puede estar vacía")
         
         arr = np.array(datos)
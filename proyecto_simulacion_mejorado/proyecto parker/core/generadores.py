@@ -4,9 +4,670 @@ Autor: [Tu Nombre]
 Fecha: Octubre 2024
 """
 
+import math
+import os
+import struct
 import time
+import tempfile
+import weakref
 import numpy as np
-from typing import List, Union, Optional
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from scipy import stats
+from typing import Callable, Dict, Iterator, List, Sequence, Union, Optional, Tuple
+
+
+# Tamaño de las tablas de coeficientes afines usadas en la generación por bloques
+TAM_TABLA_AFIN = 1 << 14
+
+# Formato binario de obtener_estado()/restaurar_estado()
+_MAGIA_ESTADO = b'GPSA'
+VERSION_ESTADO = 1
+
+# Polinomios primitivos y números de dirección iniciales de Joe y Kuo
+# (new-joe-kuo-6.21201) para las dimensiones 2 a 32 de la secuencia de Sobol;
+# la dimensión 1 es la secuencia de van der Corput en base 2
+_SOBOL_DIRECCIONES = (
+    (3, (1,)),
+    (7, (1, 3)),
+    (11, (1, 3, 1)),
+    (13, (1, 1, 1)),
+    (19, (1, 1, 3, 3)),
+    (25, (1, 3, 5, 13)),
+    (37, (1, 1, 5, 5, 17)),
+    (41, (1, 1, 5, 5, 5)),
+    (47, (1, 1, 7, 11, 19)),
+    (55, (1, 1, 5, 1, 1)),
+    (59, (1, 1, 1, 3, 11)),
+    (61, (1, 3, 5, 5, 31)),
+    (67, (1, 3, 3, 9, 7, 49)),
+    (91, (1, 1, 1, 15, 21, 21)),
+    (97, (1, 3, 1, 13, 27, 49)),
+    (103, (1, 1, 1, 15, 7, 5)),
+    (109, (1, 3, 1, 15, 13, 25)),
+    (115, (1, 1, 5, 5, 19, 61)),
+    (131, (1, 3, 7, 11, 23, 15, 103)),
+    (137, (1, 3, 7, 13, 13, 15, 69)),
+    (143, (1, 1, 3, 13, 7, 35, 63)),
+    (145, (1, 3, 5, 9, 1, 25, 53)),
+    (157, (1, 3, 1, 13, 9, 35, 107)),
+    (167, (1, 3, 1, 5, 27, 61, 31)),
+    (171, (1, 1, 5, 11, 19, 41, 61)),
+    (185, (1, 3, 5, 3, 3, 13, 69)),
+    (191, (1, 1, 7, 13, 1, 19, 1)),
+    (193, (1, 3, 7, 5, 13, 19, 59)),
+    (203, (1, 1, 3, 9, 25, 29, 41)),
+    (211, (1, 3, 5, 13, 23, 1, 55)),
+    (213, (1, 3, 7, 3, 13, 59, 17)),
+)
+_SOBOL_BITS = 32
+
+# Elementos por tramo en las pruebas de aleatoriedad (acota la memoria temporal)
+_TRAMO_PRUEBAS = 1 << 22
+
+
+@lru_cache(maxsize=16)
+def _tabla_afin(a: int, c: int, m: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula los coeficientes de la recurrencia x -> (a*x + c) mod m aplicada 1..k veces
+    
+    La entrada j de las tablas contiene (A, C) tales que el estado tras j+1 pasos
+    es (A * x0 + C) mod m. Se construyen por duplicación, componiendo los mapas
+    afines ya calculados, sin ningún ciclo elemento a elemento.
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo (a lo sumo 2**32 para operar en uint64 sin desbordes)
+        k: Número de pasos tabulados
+        
+    Returns:
+        Tupla (A, C) de arreglos uint64 de solo lectura
+    """
+    A = np.empty(k, dtype=np.uint64)
+    C = np.empty(k, dtype=np.uint64)
+    m64 = np.uint64(m)
+    A[0] = a % m
+    C[0] = c % m
+    largo = 1
+    while largo < k:
+        tramo = min(largo, k - largo)
+        a_ult = A[largo - 1]
+        c_ult = C[largo - 1]
+        # Mapa de (largo + j + 1) pasos = mapa de (j + 1) pasos tras el de 'largo' pasos
+        A[largo:largo + tramo] = (A[:tramo] * a_ult) % m64
+        C[largo:largo + tramo] = ((A[:tramo] * c_ult) % m64 + C[:tramo]) % m64
+        largo += tramo
+    A.setflags(write=False)
+    C.setflags(write=False)
+    return A, C
+
+
+def _potencia_afin(a: int, c: int, m: int, k: int) -> Tuple[int, int]:
+    """
+    Eleva el mapa afín x -> (a*x + c) mod m a la potencia k en O(log k)
+    
+    Args:
+        a: Multiplicador
+        c: Incremento
+        m: Módulo
+        k: Número de pasos
+        
+    Returns:
+        Tupla (A, C) tal que aplicar k pasos equivale a x -> (A*x + C) mod m
+    """
+    A, C = 1, 0
+    a_pot, c_pot = a % m, c % m
+    while k > 0:
+        if k & 1:
+            A, C = (a_pot * A) % m, (a_pot * C + c_pot) % m
+        c_pot = (a_pot * c_pot + c_pot) % m
+        a_pot = (a_pot * a_pot) % m
+        k >>= 1
+    return A, C
+
+
+def _empaquetar_enteros(*valores: int) -> bytes:
+    """Codifica enteros no negativos de cualquier tamaño como (longitud, bytes)"""
+    partes = []
+    for valor in valores:
+        crudo = valor.to_bytes(max(1, (valor.bit_length() + 7) // 8), 'little')
+        partes.append(struct.pack('<H', len(crudo)) + crudo)
+    return b''.join(partes)
+
+
+def _desempaquetar_enteros(datos: bytes, cantidad: int) -> Tuple[List[int], bytes]:
+    """
+    Decodifica 'cantidad' enteros escritos con _empaquetar_enteros
+    
+    Returns:
+        Tupla (lista de enteros, bytes restantes)
+    """
+    valores = []
+    for _ in range(cantidad):
+        (largo,) = struct.unpack_from('<H', datos)
+        valores.append(int.from_bytes(datos[2:2 + largo], 'little'))
+        datos = datos[2 + largo:]
+    return valores, datos
+
+
+_PRIMO_MERSENNE_31 = np.uint64(2**31 - 1)
+
+
+def _reducir_modulo(valores: np.ndarray, m: np.uint64):
+    """
+    Reduce in-place un arreglo uint64 (valores < 2**64) módulo m
+    
+    Para el primo de Mersenne 2**31 - 1 (Park-Miller) evita la división
+    entera: x mod (2^31 - 1) se obtiene sumando los bits altos a los bajos.
+    """
+    if m != _PRIMO_MERSENNE_31:
+        valores %= m
+        return
+    treinta_y_uno = np.uint64(31)
+    for _ in range(2):
+        # Tras dos pliegues x < 2^32 y luego x <= 2^31
+        valores[...] = (valores & m) + (valores >> treinta_y_uno)
+    valores -= m * (valores >= m)
+
+
+def _xorshift_bloque(palabras: np.ndarray) -> np.ndarray:
+    """Aplica en bloque la misma mezcla XOR-shift de 32 bits que _mezclar_bits"""
+    temp = palabras.astype(np.uint32, copy=False)
+    temp ^= temp << np.uint32(13)
+    temp ^= temp >> np.uint32(17)
+    temp ^= temp << np.uint32(5)
+    return temp
+
+
+# Constantes del Mersenne Twister MT19937
+MT_N = 624
+MT_M = 397
+_MT_MATRIZ_A = np.uint32(0x9908B0DF)
+_MT_SUPERIOR = np.uint32(0x80000000)
+_MT_INFERIOR = np.uint32(0x7FFFFFFF)
+
+
+@lru_cache(maxsize=64)
+def _estado_inicial_mt(semilla: int) -> np.ndarray:
+    """
+    Calcula el estado inicial de MT19937 (init_genrand) para una semilla
+    
+    La recurrencia de inicialización es secuencial; el resultado se guarda en
+    caché para que construir o reiniciar generadores con la misma semilla no
+    repita el ciclo de 624 pasos.
+    
+    Args:
+        semilla: Semilla de 32 bits
+        
+    Returns:
+        Arreglo uint32 de 624 palabras, de solo lectura
+    """
+    estado = [0] * MT_N
+    estado[0] = semilla & 0xFFFFFFFF
+    for i in range(1, MT_N):
+        previo = estado[i - 1]
+        estado[i] = (1812433253 * (previo ^ (previo >> 30)) + i) & 0xFFFFFFFF
+    arreglo = np.array(estado, dtype=np.uint32)
+    arreglo.setflags(write=False)
+    return arreglo
+
+
+def _torcer_mt(estado: np.ndarray, generaciones: int) -> np.ndarray:
+    """
+    Aplica 'generaciones' torsiones completas de MT19937 de forma vectorizada
+    
+    Trata la salida cruda como la recurrencia lineal
+    x[k+624] = x[k+397] ^ f(x[k], x[k+1]), que puede evaluarse en tramos de
+    hasta 227 (= 624 - 397) elementos independientes por operación NumPy.
+    
+    Args:
+        estado: Las 624 palabras de la generación actual
+        generaciones: Número de generaciones nuevas a calcular
+        
+    Returns:
+        Arreglo uint32 con las 624 * generaciones palabras nuevas (sin templar)
+    """
+    total = MT_N * generaciones
+    crudo = np.empty(MT_N + total, dtype=np.uint32)
+    crudo[:MT_N] = estado
+    paso = MT_N - MT_M
+    for k in range(0, total, paso):
+        fin = min(k + paso, total)
+        y = (crudo[k:fin] & _MT_SUPERIOR) | (crudo[k + 1:fin + 1] & _MT_INFERIOR)
+        nuevo = crudo[k + MT_M:fin + MT_M] ^ (y >> np.uint32(1))
+        nuevo ^= (y & np.uint32(1)) * _MT_MATRIZ_A
+        crudo[k + MT_N:fin + MT_N] = nuevo
+    return crudo[MT_N:]
+
+
+def _templar_mt(palabras: np.ndarray) -> np.ndarray:
+    """Aplica en bloque la transformación de templado de MT19937"""
+    y = palabras.copy()
+    y ^= y >> np.uint32(11)
+    y ^= (y << np.uint32(7)) & np.uint32(0x9D2C5680)
+    y ^= (y << np.uint32(15)) & np.uint32(0xEFC60000)
+    y ^= y >> np.uint32(18)
+    return y
+
+
+# Constantes de Philox4x32-10 (Salmon et al., 2011)
+_PHILOX_M0 = np.uint64(0xD2511F53)
+_PHILOX_M1 = np.uint64(0xCD9E8D57)
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_RONDAS = 10
+_PHILOX_TRAMO = 1 << 14
+
+
+def _philox4x32(contadores: np.ndarray, clave: Tuple[int, int]) -> np.ndarray:
+    """
+    Aplica la función Philox4x32-10 a un arreglo de contadores de 128 bits
+    
+    Cada fila es independiente de las demás: la salida depende solo de
+    (clave, contador), por lo que cualquier tramo del flujo se calcula sin
+    estado compartido.
+    
+    Args:
+        contadores: Arreglo (n, 4) de palabras de 32 bits (en uint64)
+        clave: Par de palabras de 32 bits
+        
+    Returns:
+        Arreglo uint32 de forma (n, 4)
+    """
+    mascara = np.uint64(0xFFFFFFFF)
+    c0, c1, c2, c3 = (contadores[:, i].astype(np.uint64) for i in range(4))
+    k0, k1 = clave
+    for ronda in range(_PHILOX_RONDAS):
+        if ronda > 0:
+            k0 = (k0 + _PHILOX_W0) & 0xFFFFFFFF
+            k1 = (k1 + _PHILOX_W1) & 0xFFFFFFFF
+        producto0 = _PHILOX_M0 * c0
+        producto1 = _PHILOX_M1 * c2
+        c0 = ((producto1 >> np.uint64(32)) ^ c1 ^ np.uint64(k0))
+        c1 = producto1 & mascara
+        c2 = ((producto0 >> np.uint64(32)) ^ c3 ^ np.uint64(k1))
+        c3 = producto0 & mascara
+    return np.stack([c0, c1, c2, c3], axis=1).astype(np.uint32)
+
+
+_MASCARA_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _mulhi64(a: np.ndarray, b: Union[np.ndarray, np.uint64]) -> np.ndarray:
+    """Parte alta (64 bits) del producto de 128 bits a*b, en uint64 vectorizado"""
+    mascara = np.uint64(0xFFFFFFFF)
+    treinta_y_dos = np.uint64(32)
+    a_lo, a_hi = a & mascara, a >> treinta_y_dos
+    b_lo, b_hi = b & mascara, b >> treinta_y_dos
+    lo_lo = a_lo * b_lo
+    hi_lo = a_hi * b_lo
+    lo_hi = a_lo * b_hi
+    medio = (lo_lo >> treinta_y_dos) + (hi_lo & mascara) + (lo_hi & mascara)
+    return a_hi * b_hi + (hi_lo >> treinta_y_dos) + (lo_hi >> treinta_y_dos) + (medio >> treinta_y_dos)
+
+
+def _rotl64(x: np.ndarray, k: int) -> np.ndarray:
+    """Rotación a la izquierda de palabras uint64"""
+    return (x << np.uint64(k)) | (x >> np.uint64(64 - k))
+
+
+def _splitmix64(indices: np.ndarray, semilla: int) -> np.ndarray:
+    """
+    Salidas de SplitMix64 en las posiciones dadas (1 = primera salida)
+    
+    Se usa para sembrar generadores de 64 bits a partir de una semilla entera.
+    """
+    z = np.uint64(semilla & _MASCARA_64) + indices.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _producto_128(alto: np.ndarray, bajo: np.ndarray, escalar: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(alto, bajo) * escalar módulo 2**128, con los valores partidos en palabras uint64"""
+    e_alto, e_bajo = np.uint64(escalar >> 64), np.uint64(escalar & _MASCARA_64)
+    return _mulhi64(bajo, e_bajo) + bajo * e_alto + alto * e_bajo, bajo * e_bajo
+
+
+@lru_cache(maxsize=4)
+def _tabla_potencias_128(a: int, k: int) -> Tuple[np.ndarray, ...]:
+    """
+    Partes de la tabla afín módulo 2**128 que no dependen del incremento
+    
+    A[j] = a^(j+1) y S[j] = 1 + a + ... + a^j, de modo que el término
+    constante tras j+1 pasos es c * S[j]. Se construyen por duplicación
+    (log2(k) operaciones vectorizadas): a^(h+j+1) = a^h * a^(j+1) y
+    S[h+j] = S[h-1] + a^h * S[j].
+    
+    Returns:
+        Tupla (A_alto, A_bajo, S_alto, S_bajo) de arreglos uint64
+    """
+    A_alto = np.array([a >> 64], dtype=np.uint64)
+    A_bajo = np.array([a & _MASCARA_64], dtype=np.uint64)
+    S_alto = np.zeros(1, dtype=np.uint64)
+    S_bajo = np.ones(1, dtype=np.uint64)
+    while len(A_bajo) < k:
+        a_h = (int(A_alto[-1]) << 64) | int(A_bajo[-1])
+        s_alto, s_bajo = S_alto[-1], S_bajo[-1]
+        nuevo_A_alto, nuevo_A_bajo = _producto_128(A_alto, A_bajo, a_h)
+        p_alto, p_bajo = _producto_128(S_alto, S_bajo, a_h)
+        nuevo_S_bajo = p_bajo + s_bajo
+        nuevo_S_alto = p_alto + s_alto + (nuevo_S_bajo < p_bajo).astype(np.uint64)
+        A_alto = np.concatenate([A_alto, nuevo_A_alto])
+        A_bajo = np.concatenate([A_bajo, nuevo_A_bajo])
+        S_alto = np.concatenate([S_alto, nuevo_S_alto])
+        S_bajo = np.concatenate([S_bajo, nuevo_S_bajo])
+    tablas = tuple(tabla[:k].copy() for tabla in (A_alto, A_bajo, S_alto, S_bajo))
+    for tabla in tablas:
+        tabla.setflags(write=False)
+    return tablas
+
+
+@lru_cache(maxsize=16)
+def _tabla_afin_128(a: int, c: int, k: int) -> Tuple[np.ndarray, ...]:
+    """
+    Versión de _tabla_afin para módulo 2**128, partida en palabras altas y bajas
+    
+    Solo el término constante C[j] = c * S[j] depende del incremento (es
+    decir, del flujo); se deriva en bloque de _tabla_potencias_128.
+    
+    Returns:
+        Tupla (A_alto, A_bajo, C_alto, C_bajo) de arreglos uint64
+    """
+    A_alto, A_bajo, S_alto, S_bajo = _tabla_potencias_128(a, k)
+    C_alto, C_bajo = _producto_128(S_alto, S_bajo, c)
+    C_alto.setflags(write=False)
+    C_bajo.setflags(write=False)
+    return A_alto, A_bajo, C_alto, C_bajo
+
+
+def _paso_xoshiro(s0: np.ndarray, s1: np.ndarray, s2: np.ndarray, s3: np.ndarray) -> np.ndarray:
+    """Un paso de xoshiro256** sobre arreglos de estado (in-place); devuelve la salida"""
+    resultado = _rotl64(s1 * np.uint64(5), 7) * np.uint64(9)
+    t = s1 << np.uint64(17)
+    s2 ^= s0
+    s3 ^= s1
+    s1 ^= s2
+    s0 ^= s3
+    s2 ^= t
+    s3[...] = _rotl64(s3, 45)
+    return resultado
+
+
+_XOSHIRO_SALTO = (0x180EC6D33CFD0ABA, 0xD5A61266F0C9392C, 0xA9582618E03FC9AA, 0x39ABDC4529B1661C)
+
+
+def _saltar_xoshiro(estado: np.ndarray) -> np.ndarray:
+    """
+    Aplica jump() de xoshiro256** (2^128 pasos) a las columnas de un estado (4, L)
+    
+    Returns:
+        Nuevo arreglo (4, L) con los estados avanzados
+    """
+    s = estado.copy()
+    acumulado = np.zeros_like(s)
+    for constante in _XOSHIRO_SALTO:
+        for bit in range(64):
+            if (constante >> bit) & 1:
+                acumulado ^= s
+            _paso_xoshiro(s[0], s[1], s[2], s[3])
+    return acumulado
+
+
+def _a_bits(estado: np.ndarray) -> np.ndarray:
+    """Convierte estados (4, L) uint64 a una matriz de bits (256, L)"""
+    columnas = np.ascontiguousarray(estado.T).view(np.uint8)
+    return np.unpackbits(columnas, axis=1, bitorder='little').T
+
+
+def _desde_bits(bits: np.ndarray) -> np.ndarray:
+    """Inversa de _a_bits"""
+    columnas = np.packbits(np.ascontiguousarray(bits.T), axis=1, bitorder='little')
+    return np.ascontiguousarray(columnas).view(np.uint64).T.copy()
+
+
+@lru_cache(maxsize=32)
+def _matriz_salto_xoshiro(potencia: int = 0) -> np.ndarray:
+    """
+    Matriz 256x256 sobre GF(2) de 2^potencia aplicaciones de jump() de xoshiro256**
+    
+    Args:
+        potencia: Exponente de la potencia de dos
+        
+    Returns:
+        Matriz de ceros y unos en float64 (para usar productos BLAS)
+    """
+    if potencia == 0:
+        base = _desde_bits(np.eye(256, dtype=np.uint8))
+        return _a_bits(_saltar_xoshiro(base)).astype(np.float64)
+    previa = _matriz_salto_xoshiro(potencia - 1)
+    return (previa @ previa) % 2
+
+
+def _estados_carriles_xoshiro(estado: np.ndarray, carriles: int) -> np.ndarray:
+    """
+    Calcula 'carriles' estados separados 2^128 pasos entre sí
+    
+    El carril j es el estado inicial tras j llamadas a jump(). Se obtienen por
+    duplicación con productos de matrices sobre GF(2), en O(log carriles)
+    operaciones vectorizadas.
+    
+    Args:
+        estado: Estado inicial (4,) uint64
+        carriles: Número de carriles
+        
+    Returns:
+        Arreglo (4, carriles) uint64
+    """
+    bits = _a_bits(estado.reshape(4, 1)).astype(np.float64)
+    potencia = 0
+    while bits.shape[1] < carriles:
+        # bits contiene los carriles [0, L); el salto J^L da los carriles [L, 2L)
+        nuevos = (_matriz_salto_xoshiro(potencia) @ bits) % 2
+        bits = np.concatenate([bits, nuevos], axis=1)
+        potencia += 1
+    return _desde_bits(bits[:, :carriles].astype(np.uint8))
+
+
+class HistorialNulo:
+    """
+    Política de historial desactivada: no conserva ningún estado
+    Es la política por defecto para corridas de producción
+    """
+    
+    def agregar(self, estado: int):
+        """Registra un estado (se descarta)"""
+        pass
+    
+    def agregar_bloque(self, estados: np.ndarray):
+        """Registra un bloque de estados (se descarta)"""
+        pass
+    
+    def reiniciar(self, semilla: int):
+        """Vacía el historial y registra la semilla como primer estado"""
+        pass
+    
+    def valores(self) -> np.ndarray:
+        """
+        Devuelve los estados conservados, del más antiguo al más reciente
+        
+        Returns:
+            Arreglo uint64 con los estados
+        """
+        return np.empty(0, dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return len(self.valores())
+    
+    def __iter__(self):
+        return iter(self.valores().tolist())
+    
+    def __getitem__(self, indice):
+        return self.valores().tolist()[indice]
+
+
+class HistorialCompleto(HistorialNulo):
+    """
+    Conserva todos los estados en una lista (comportamiento original)
+    La memoria crece sin límite; útil solo para corridas cortas de verificación
+    """
+    
+    def __init__(self, semilla: int):
+        self._estados = [semilla]
+    
+    def agregar(self, estado: int):
+        self._estados.append(estado)
+    
+    def agregar_bloque(self, estados: np.ndarray):
+        self._estados.extend(estados.tolist())
+    
+    def reiniciar(self, semilla: int):
+        self._estados = [semilla]
+    
+    def valores(self) -> np.ndarray:
+        return np.array(self._estados, dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return len(self._estados)
+    
+    def __getitem__(self, indice):
+        return self._estados[indice]
+
+
+class HistorialAnillo(HistorialNulo):
+    """
+    Conserva los últimos 'capacidad' estados en un buffer circular de NumPy
+    La memoria es fija: capacidad * 8 bytes
+    """
+    
+    def __init__(self, semilla: int, capacidad: int = 10000):
+        if capacidad <= 0:
+            raise ValueError("La capacidad del historial debe ser positiva")
+        self.capacidad = capacidad
+        self._buffer = np.zeros(capacidad, dtype=np.uint64)
+        self.reiniciar(semilla)
+    
+    def agregar(self, estado: int):
+        self._buffer[self._total % self.capacidad] = estado
+        self._total += 1
+    
+    def agregar_bloque(self, estados: np.ndarray):
+        n = len(estados)
+        if n >= self.capacidad:
+            # Solo sobreviven los últimos 'capacidad' estados
+            self._total += n - self.capacidad
+            estados = estados[n - self.capacidad:]
+            n = self.capacidad
+        inicio = self._total % self.capacidad
+        primero = min(n, self.capacidad - inicio)
+        self._buffer[inicio:inicio + primero] = estados[:primero]
+        self._buffer[:n - primero] = estados[primero:]
+        self._total += n
+    
+    def reiniciar(self, semilla: int):
+        self._total = 0
+        self.agregar(semilla)
+    
+    def valores(self) -> np.ndarray:
+        if self._total <= self.capacidad:
+            return self._buffer[:self._total].copy()
+        inicio = self._total % self.capacidad
+        return np.concatenate([self._buffer[inicio:], self._buffer[:inicio]])
+
+
+class HistorialDisco(HistorialNulo):
+    """
+    Vuelca todos los estados a un archivo mapeado en memoria (np.memmap)
+    La memoria residente queda acotada por el sistema operativo; el archivo
+    crece duplicando su capacidad cuando se llena
+    """
+    
+    def __init__(self, semilla: int, ruta: Optional[str] = None, capacidad: int = 1 << 20):
+        if capacidad <= 0:
+            raise ValueError("La capacidad del historial debe ser positiva")
+        if ruta is None:
+            descriptor, ruta = tempfile.mkstemp(suffix='.historial')
+            os.close(descriptor)
+            # El archivo temporal se elimina cuando el historial deja de usarse
+            weakref.finalize(self, HistorialDisco._eliminar_archivo, ruta)
+        self.ruta = ruta
+        self._capacidad = capacidad
+        self._mapa = np.memmap(ruta, dtype=np.uint64, mode='w+', shape=(capacidad,))
+        self.reiniciar(semilla)
+    
+    @staticmethod
+    def _eliminar_archivo(ruta: str):
+        """Elimina el archivo temporal del historial si aún existe"""
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+    
+    def _asegurar_capacidad(self, requerida: int):
+        """Agranda el archivo mapeado hasta contener al menos 'requerida' estados"""
+        if requerida <= self._capacidad:
+            return
+        nueva = self._capacidad
+        while nueva < requerida:
+            nueva *= 2
+        self._mapa.flush()
+        del self._mapa
+        with open(self.ruta, 'r+b') as archivo:
+            archivo.truncate(nueva * 8)
+        self._capacidad = nueva
+        self._mapa = np.memmap(self.ruta, dtype=np.uint64, mode='r+', shape=(nueva,))
+    
+    def agregar(self, estado: int):
+        self._asegurar_capacidad(self._total + 1)
+        self._mapa[self._total] = estado
+        self._total += 1
+    
+    def agregar_bloque(self, estados: np.ndarray):
+        n = len(estados)
+        self._asegurar_capacidad(self._total + n)
+        self._mapa[self._total:self._total + n] = estados
+        self._total += n
+    
+    def reiniciar(self, semilla: int):
+        self._total = 0
+        self.agregar(semilla)
+    
+    def valores(self) -> np.ndarray:
+        return self._mapa[:self._total]
+    
+    def __len__(self) -> int:
+        return self._total
+    
+    def guardar(self):
+        """Fuerza la escritura a disco de los estados registrados"""
+        self._mapa.flush()
+
+
+def crear_historial(politica: str, semilla: int, capacidad: Optional[int] = None,
+                    ruta: Optional[str] = None) -> HistorialNulo:
+    """
+    Crea el objeto de historial correspondiente a una política
+    
+    Args:
+        politica: 'ninguno', 'completo', 'anillo' o 'disco'
+        semilla: Primer estado a registrar
+        capacidad: Tamaño del anillo o capacidad inicial del archivo
+        ruta: Archivo para la política 'disco' (temporal si es None)
+        
+    Returns:
+        Objeto de historial
+    """
+    if politica == 'ninguno':
+        return HistorialNulo()
+    elif politica == 'completo':
+        return HistorialCompleto(semilla)
+    elif politica == 'anillo':
+        return HistorialAnillo(semilla, capacidad or 10000)
+    elif politica == 'disco':
+        return HistorialDisco(semilla, ruta, capacidad or 1 << 20)
+    else:
+        raise ValueError(f"Política de historial '{politica}' no soportada")
 
 
 class GeneradorPseudoaleatorio:
@@ -15,12 +676,25 @@ class GeneradorPseudoaleatorio:
     Implementa LCG (Linear Congruential Generator) y Mersenne Twister mejorado
     """
     
-    def __init__(self, semilla: Optional[int] = None):
+    def __init__(self, semilla: Optional[int] = None, historial: str = 'ninguno',
+                 capacidad_historial: Optional[int] = None,
+                 ruta_historial: Optional[str] = None, tam_buffer: int = 4096):
         """
         Inicializa el generador con una semilla
         
         Args:
             semilla: Semilla para el generador. Si es None, se genera automáticamente
+            historial: Política de historial de estados: 'ninguno' (por defecto),
+                'completo', 'anillo' (últimos N estados) o 'disco' (memmap).
+                Tras la semilla se registra una entrada por número entregado:
+                el estado en LCG y GCM, la palabra cruda (sin templar) en
+                MT19937 y la posición del contador en Philox; saltar(k) agrega
+                una sola entrada, la del último número saltado. PCG64,
+                Xoshiro256 y el adaptador de NumPy solo registran la semilla
+            capacidad_historial: Tamaño del anillo o capacidad inicial del archivo
+            ruta_historial: Archivo para la política 'disco'
+            tam_buffer: Cantidad de uniformes que siguiente() precalcula en bloque
+                (0 desactiva el buffer; no se usa si el historial conserva estados)
         """
         if semilla is None:
             # Generar semilla automática usando tiempo y procesos del sistema
@@ -28,17 +702,24 @@ class GeneradorPseudoaleatorio:
         else:
             self.semilla = semilla
         
-        self.estado = self.semilla
+        # Buffer de uniformes precalculados que consume siguiente()
+        self.tam_buffer = tam_buffer
+        self._buffer = np.empty(0, dtype=np.float64)
+        self._pos_buffer = 0
+        self._captura_buffer = None
+        
+        self._estado = self.semilla
         # Parámetros optimizados para LCG (valores de Numerical Recipes)
         self.a = 1664525
         self.c = 1013904223
         self.m = 2**32
         
-        # Estado para Mersenne Twister alternativo
-        self._inicializar_mt()
+        # Estado propio del motor (Mersenne Twister alternativo en esta clase)
+        self._inicializar_motor()
         
         # Historial para verificación
-        self.historial = [self.semilla]
+        self.historial = crear_historial(historial, self.semilla,
+                                         capacidad_historial, ruta_historial)
     
     def _generar_semilla_automatica(self) -> int:
         """
@@ -51,30 +732,170 @@ class GeneradorPseudoaleatorio:
         pid = hash(str(time.process_time()))
         return (tiempo_actual ^ pid) % (2**31)
     
+    def _inicializar_motor(self):
+        """Prepara el estado propio del motor a partir de la semilla (constructor y reset)"""
+        self._inicializar_mt()
+    
     def _inicializar_mt(self):
-        """Inicializa el estado para el generador tipo Mersenne Twister"""
-        self.mt_index = 0
-        self.mt_state = [0] * 624
-        self.mt_state[0] = self.semilla
+        """
+        Inicializa el estado para el generador tipo Mersenne Twister
         
-        for i in range(1, 624):
-            self.mt_state[i] = (1812433253 * 
-                              (self.mt_state[i-1] ^ (self.mt_state[i-1] >> 30)) + i) & 0xFFFFFFFF
+        El LCG no usa este estado, por lo que mt_state se calcula solo cuando
+        se consulta (ver GeneradorMersenneTwister para el motor completo).
+        """
+        self.mt_index = 0
+    
+    @property
+    def mt_state(self) -> np.ndarray:
+        """Estado de 624 palabras de MT19937 derivado de la semilla"""
+        return _estado_inicial_mt(self.semilla)
+    
+    @property
+    def estado(self) -> int:
+        """Estado del motor en el punto de consumo actual del flujo"""
+        self.sincronizar()
+        return self._estado
+    
+    @estado.setter
+    def estado(self, valor: int):
+        self._descartar_buffer()
+        self._estado = valor
     
     def siguiente(self) -> float:
         """
         Genera el siguiente número pseudoaleatorio entre 0 y 1
         
+        Los números se precalculan en bloques de tam_buffer con la ruta
+        vectorizada; el flujo es idéntico al que se obtiene sin buffer. Si el
+        historial conserva estados no se precalcula, para que solo registre
+        los números efectivamente entregados.
+        
+        Returns:
+            Número pseudoaleatorio en [0, 1)
+        """
+        if self._pos_buffer >= len(self._buffer):
+            if self.tam_buffer <= 0 or self._registra_historial():
+                return self._siguiente_motor()
+            self._captura_buffer = self._capturar_motor()
+            self._buffer = self._generar_bloque(self.tam_buffer)
+            self._pos_buffer = 0
+        valor = self._buffer[self._pos_buffer]
+        self._pos_buffer += 1
+        return float(valor)
+    
+    def _tomar_del_buffer(self, n: int) -> np.ndarray:
+        """Extrae hasta n uniformes ya precalculados en el buffer"""
+        pendientes = self._buffer[self._pos_buffer:self._pos_buffer + n]
+        self._pos_buffer += len(pendientes)
+        return pendientes
+    
+    def _descartar_buffer(self):
+        """Vacía el buffer sin reposicionar el motor"""
+        self._buffer = np.empty(0, dtype=np.float64)
+        self._pos_buffer = 0
+        self._captura_buffer = None
+    
+    def sincronizar(self):
+        """
+        Descarta los números precalculados y deja el motor en el punto de consumo
+        
+        Después de llamarlo, el estado interno del motor corresponde exactamente
+        a los números entregados hasta ahora.
+        """
+        if self._pos_buffer >= len(self._buffer):
+            self._descartar_buffer()
+            return
+        consumidos = self._pos_buffer
+        captura = self._captura_buffer
+        self._descartar_buffer()
+        self._restaurar_motor(captura)
+        self._saltar_motor(consumidos)
+    
+    def _capturar_motor(self):
+        """Devuelve una copia del estado del motor (para sincronizar el buffer)"""
+        return self._estado
+    
+    def _restaurar_motor(self, captura):
+        """Restaura un estado devuelto por _capturar_motor()"""
+        self._estado = captura
+    
+    def obtener_estado(self) -> bytes:
+        """
+        Serializa el estado del generador en un bloque binario compacto
+        
+        El formato es versionado: cabecera 'GPSA', versión, nombre de la clase,
+        semilla y el estado propio del motor. Se toma en el punto de consumo
+        (los números precalculados en el buffer no se guardan). El historial
+        no forma parte del estado.
+        
+        Returns:
+            Bytes que acepta restaurar_estado()
+        """
+        self.sincronizar()
+        nombre = type(self).__name__.encode('ascii')
+        return (struct.pack('<4sBB', _MAGIA_ESTADO, VERSION_ESTADO, len(nombre)) + nombre +
+                _empaquetar_enteros(self.semilla) + self._empaquetar_motor())
+    
+    def restaurar_estado(self, datos: bytes):
+        """
+        Restaura un estado producido por obtener_estado()
+        
+        El flujo continúa exactamente desde el número en que se tomó el estado.
+        
+        Args:
+            datos: Bytes devueltos por obtener_estado() en un generador de la misma clase
+        """
+        datos = bytes(datos)
+        magia, version, largo = struct.unpack_from('<4sBB', datos)
+        if magia != _MAGIA_ESTADO:
+            raise ValueError("Los datos no corresponden a un estado de generador")
+        if version > VERSION_ESTADO:
+            raise ValueError(f"Versión de estado {version} no soportada")
+        nombre = datos[6:6 + largo].decode('ascii')
+        if nombre != type(self).__name__:
+            raise ValueError(f"El estado pertenece a {nombre}, no a {type(self).__name__}")
+        (semilla,), resto = _desempaquetar_enteros(datos[6 + largo:], 1)
+        self._descartar_buffer()
+        self.semilla = semilla
+        self._desempaquetar_motor(resto)
+    
+    def __getstate__(self) -> dict:
+        """
+        Estado para pickle (por ejemplo, al enviar el generador a otro proceso)
+        
+        Se toma en el punto de consumo; el buffer y el historial no se copian
+        (el generador reconstruido usa la política 'ninguno').
+        """
+        self.sincronizar()
+        estado = self.__dict__.copy()
+        estado['_buffer'] = np.empty(0, dtype=np.float64)
+        estado['_pos_buffer'] = 0
+        estado['_captura_buffer'] = None
+        estado['historial'] = HistorialNulo()
+        return estado
+    
+    def _empaquetar_motor(self) -> bytes:
+        """Codifica el estado del motor LCG"""
+        return _empaquetar_enteros(self._estado, self.a, self.c, self.m)
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        """Decodifica el estado escrito por _empaquetar_motor()"""
+        (self._estado, self.a, self.c, self.m), _ = _desempaquetar_enteros(datos, 4)
+    
+    def _siguiente_motor(self) -> float:
+        """
+        Genera el siguiente número del motor LCG, sin pasar por el buffer
+        
         Returns:
             Número pseudoaleatorio en [0, 1)
         """
         # Método LCG mejorado
-        self.estado = (self.a * self.estado + self.c) % self.m
-        numero = self.estado / self.m
+        self._estado = (self.a * self._estado + self.c) % self.m
+        numero = self._estado / self.m
         
         # Mezclar con método alternativo para mejor distribución
         numero_mezclado = self._mezclar_bits(numero)
-        self.historial.append(self.estado)
+        self.historial.agregar(self._estado)
         
         return numero_mezclado
     
@@ -95,88 +916,437 @@ class GeneradorPseudoaleatorio:
         temp ^= (temp << 5) & 0xFFFFFFFF
         return temp / (2**32)
     
-    def uniform(self, low: float = 0.0, high: float = 1.0, size: int = 1) -> List[float]:
+    def bloque(self, n: int) -> np.ndarray:
         """
-        Genera números uniformes en el rango [low, high]
+        Genera un bloque de n números pseudoaleatorios en [0, 1)
+        
+        El resultado es idéntico bit a bit a llamar n veces a siguiente(),
+        pero se calcula de forma vectorizada con NumPy.
         
         Args:
-            low: Límite inferior
-            high: Límite superior
-            size: Número de muestras
+            n: Cantidad de números a generar
             
         Returns:
-            Lista de números uniformes
+            Arreglo float64 de tamaño n
         """
-        return [low + (high - low) * self.siguiente() for _ in range(size)]
+        n = self._validar_tamano(n)
+        if self._solo_escalar():
+            return np.fromiter((self.siguiente() for _ in range(n)), dtype=np.float64, count=n)
+        pendientes = self._tomar_del_buffer(n)
+        if len(pendientes) == n:
+            return pendientes.copy()
+        return np.concatenate([pendientes, self._generar_bloque(n - len(pendientes))])
     
-    def enteros(self, low: int, high: int, size: int = 1) -> List[int]:
+    def bloque_palabras(self, n: int) -> np.ndarray:
         """
-        Genera enteros uniformes en [low, high] inclusive
+        Genera un bloque de n palabras de 32 bits del flujo
+        
+        Cada palabra w corresponde al número w / 2**32 que entregaría siguiente().
         
         Args:
-            low: Límite inferior
-            high: Límite superior
-            size: Número de muestras
+            n: Cantidad de palabras a generar
             
         Returns:
-            Lista de enteros
+            Arreglo uint32 de tamaño n
         """
-        return [int(low + (high - low + 1) * self.siguiente()) for _ in range(size)]
+        n = self._validar_tamano(n)
+        if self._solo_escalar():
+            return self._palabras_desde_uniformes(self.bloque(n))
+        pendientes = self._palabras_desde_uniformes(self._tomar_del_buffer(n))
+        if len(pendientes) == n:
+            return pendientes
+        return np.concatenate([pendientes, self._generar_palabras(n - len(pendientes))])
     
-    def eleccion(self, secuencia: List, size: int = 1) -> List:
+    def llenar(self, out: np.ndarray) -> np.ndarray:
         """
-        Elige elementos aleatorios de una secuencia
+        Llena un arreglo existente con números del flujo
+        
+        Si el arreglo es de tipo entero sin signo de 32 bits se llena con
+        palabras; en cualquier otro caso se llena con uniformes en [0, 1).
         
         Args:
-            secuencia: Secuencia de elementos
-            size: Número de elecciones
+            out: Arreglo destino (se modifica in-place)
             
         Returns:
-            Lista de elementos elegidos
+            El mismo arreglo out
         """
-        if not secuencia:
-            raise ValueError("La secuencia no puede estar vacía")
-        
-        indices = self.enteros(0, len(secuencia) - 1, size)
-        return [secuencia[i] for i in indices]
+        if out.dtype == np.uint32:
+            out[...] = self.bloque_palabras(out.size).reshape(out.shape)
+        else:
+            out[...] = self.bloque(out.size).reshape(out.shape)
+        return out
     
-    def shuffle(self, secuencia: List) -> List:
+    def saltar(self, k: int):
         """
-        Mezcla una secuencia in-place usando Fisher-Yates
+        Avanza el generador k posiciones sin producir los números intermedios
+        
+        Usa exponenciación del mapa afín (a^k mod m y su término c), por lo que
+        el costo es O(log k). Tras saltar(k), siguiente() devuelve el mismo valor
+        que la llamada número k+1 de un generador idéntico sin saltos.
         
         Args:
-            secuencia: Secuencia a mezclar
-            
-        Returns:
-            Secuencia mezclada
+            k: Número de posiciones a avanzar
         """
-        n = len(secuencia)
-        for i in range(n-1, 0, -1):
-            j = self.enteros(0, i)[0]
-            secuencia[i], secuencia[j] = secuencia[j], secuencia[i]
-        return secuencia
+        k = self._validar_tamano(k)
+        k -= len(self._tomar_del_buffer(k))
+        if k > 0:
+            self._descartar_buffer()
+            self._saltar_motor(k)
     
-    def reset(self, semilla: Optional[int] = None):
+    def _saltar_motor(self, k: int):
+        """Salto afín del motor LCG, sin pasar por el buffer"""
+        # Una subclase que redefine el motor sin declarar sus coeficientes
+        # no garantiza una recurrencia afín: se avanza paso a paso
+        if type(self)._coeficientes is GeneradorPseudoaleatorio._coeficientes:
+            if self._solo_escalar():
+                for _ in range(k):
+                    self.siguiente()
+                return
+            if self._motor_escalar():
+                for _ in range(k):
+                    self._siguiente_motor()
+                return
+        
+        a, c, m = self._coeficientes()
+        A, C = _potencia_afin(a, c, m, k)
+        self._estado = (A * self._estado + C) % m
+        if k > 0:
+            self.historial.agregar(self._estado)
+    
+    def _coeficientes(self) -> Tuple[int, int, int]:
+        """Devuelve los coeficientes (a, c, m) de la recurrencia del generador"""
+        return self.a, self.c, self.m
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Avanza el LCG n pasos en bloque y devuelve las palabras mezcladas"""
+        a, c, m = self._coeficientes()
+        if self._motor_escalar() or m > 2**32:
+            return self._palabras_desde_uniformes(self._generar_bloque_escalar(n))
+        
+        estados = self._avanzar_estados(n)
+        if m == 2**32:
+            return _xorshift_bloque(estados)
+        # Misma conversión que siguiente(): int((estado / m) * 2**32)
+        return _xorshift_bloque((estados / m * 2**32).astype(np.uint64))
+    
+    def _avanzar_estados(self, n: int) -> np.ndarray:
         """
-        Reinicia el generador con nueva semilla
+        Avanza la recurrencia afín n pasos en bloque
+        
+        Cada tramo se obtiene como A[j] * x0 + C[j] (mod m) con las tablas de
+        _tabla_afin. El estado se reduce antes módulo m (la semilla puede ser
+        cualquier entero, incluso negativo), así que con m <= 2**32 ambos
+        factores son menores que 2**32 y los productos caben en uint64.
         
         Args:
-            semilla: Nueva semilla (opcional)
+            n: Número de pasos
+            
+        Returns:
+            Arreglo con los n estados siguientes (uint32 si m = 2**32, si no uint64)
         """
-        if semilla is not None:
-            self.semilla = semilla
-        self.estado = self.semilla
-        self._inicializar_mt()
-        self.historial = [self.semilla]
-
-
-class GeneradorCongruencialMultiplicativo(GeneradorPseudoaleatorio):
-    """
-    Generador Congruencial Multiplicativo (GCM)
+        a, c, m = self._coeficientes()
+        A, C = _tabla_afin(a, c, m, TAM_TABLA_AFIN)
+        if m == 2**32:
+            # Con m = 2**32 la aritmética uint32 de NumPy ya reduce módulo m
+            A, C, tipo = A.astype(np.uint32), C.astype(np.uint32), np.uint32
+        else:
+            tipo = np.uint64
+        m64 = np.uint64(m)
+        estados = np.empty(n, dtype=tipo)
+        # Equivalente en la recurrencia y siempre en [0, m)
+        estado = self._estado % m
+        for inicio in range(0, n, TAM_TABLA_AFIN):
+            k = min(TAM_TABLA_AFIN, n - inicio)
+            tramo = estados[inicio:inicio + k]
+            np.multiply(A[:k], tipo(estado), out=tramo)
+            if tipo is np.uint64:
+                _reducir_modulo(tramo, m64)
+            if c % m:
+                tramo += C[:k]
+                if tipo is np.uint64:
+                    _reducir_modulo(tramo, m64)
+            estado = int(tramo[-1])
+        if n > 0:
+            self._estado = estado
+            self.historial.agregar_bloque(estados)
+        return estados
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes en bloque a partir de las palabras del LCG"""
+        if self._motor_escalar():
+            return self._generar_bloque_escalar(n)
+        return self._generar_palabras(n) / 2**32
+    
+    def _generar_bloque_escalar(self, n: int) -> np.ndarray:
+        """Genera n uniformes llamando n veces al motor escalar"""
+        return np.fromiter((self._siguiente_motor() for _ in range(n)), dtype=np.float64, count=n)
+    
+    def _registra_historial(self) -> bool:
+        """Indica si la política de historial conserva estados"""
+        return type(self.historial) is not HistorialNulo
+    
+    def _solo_escalar(self) -> bool:
+        """Indica si una subclase redefinió siguiente() sin dar una versión en bloque"""
+        clase = type(self)
+        return (clase.siguiente is not GeneradorPseudoaleatorio.siguiente and
+                clase._generar_bloque is GeneradorPseudoaleatorio._generar_bloque)
+    
+    def _motor_escalar(self) -> bool:
+        """Indica si una subclase redefinió el motor escalar sin dar una versión en bloque"""
+        clase = type(self)
+        return (clase._siguiente_motor is not GeneradorPseudoaleatorio._siguiente_motor and
+                clase._generar_bloque is GeneradorPseudoaleatorio._generar_bloque)
+    
+    @staticmethod
+    def _palabras_desde_uniformes(u: np.ndarray) -> np.ndarray:
+        """Convierte uniformes en [0, 1) a palabras de 32 bits"""
+        return np.minimum(np.floor(u * 2**32), 2**32 - 1).astype(np.uint32)
+    
+    @staticmethod
+    def _validar_tamano(n: int) -> int:
+        """Valida el tamaño de un bloque"""
+        n = int(n)
+        if n < 0:
+            raise ValueError("El tamaño del bloque no puede ser negativo")
+        return n
+    
+    def uniform(self, low: float = 0.0, high: float = 1.0, size: int = 1) -> List[float]:
+        """
+        Genera números uniformes en el rango [low, high]
+        
+        Args:
+            low: Límite inferior
+            high: Límite superior
+            size: Número de muestras
+            
+        Returns:
+            Lista de números uniformes
+        """
+        return (low + (high - low) * self.bloque(size)).tolist()
+    
+    def enteros(self, low: int, high: int, size: int = 1) -> List[int]:
+        """
+        Genera enteros uniformes en [low, high] inclusive
+        
+        Args:
+            low: Límite inferior
+            high: Límite superior
+            size: Número de muestras
+            
+        Returns:
+            Lista de enteros
+        """
+        return self.enteros_bloque(low, high, size).tolist()
+    
+    def enteros_bloque(self, low: int, high: int, size: int = 1) -> np.ndarray:
+        """
+        Genera enteros uniformes en [low, high] sin sesgo, en bloque
+        
+        Usa el método de multiplicación y desplazamiento de Lemire con rechazo:
+        solo se vuelven a sortear las posiciones rechazadas, que en promedio
+        son menos de una por cada 2^32 / (high - low + 1) muestras.
+        
+        Args:
+            low: Límite inferior
+            high: Límite superior
+            size: Número de muestras
+            
+        Returns:
+            Arreglo int64 de enteros
+        """
+        rango = high - low + 1
+        if rango <= 0:
+            raise ValueError("high debe ser mayor o igual que low")
+        if rango > 2**64:
+            raise ValueError("El rango no puede superar 2^64 valores")
+        size = self._validar_tamano(size)
+        if rango <= 2**32:
+            desplazamientos = self._lemire32(rango, size)
+        else:
+            desplazamientos = self._lemire64(rango, size)
+        if -2**63 <= low and high < 2**63:
+            return np.int64(low) + desplazamientos.astype(np.int64)
+        return np.array([low + int(d) for d in desplazamientos], dtype=object)
+    
+    def _palabras64(self, n: int) -> np.ndarray:
+        """Palabras de 64 bits formadas con dos palabras consecutivas de 32 bits"""
+        w = self.bloque_palabras(2 * n).astype(np.uint64)
+        return (w[0::2] << np.uint64(32)) | w[1::2]
+    
+    def _lemire32(self, rango: Union[int, np.ndarray], size: int) -> np.ndarray:
+        """
+        Enteros uniformes en [0, rango) con rango <= 2^32 (Lemire, 2019)
+        
+        Args:
+            rango: Tamaño del rango, escalar o arreglo uint64 de longitud size
+            size: Número de muestras
+            
+        Returns:
+            Arreglo uint64 con los enteros
+        """
+        s = np.asarray(rango, dtype=np.uint64)
+        producto = self.bloque_palabras(size).astype(np.uint64)
+        producto *= s
+        bajo = producto & np.uint64(0xFFFFFFFF)
+        producto >>= np.uint64(32)
+        # Solo las posiciones con parte baja < s pueden requerir rechazo
+        dudosos = np.flatnonzero(bajo < s)
+        if len(dudosos) == 0:
+            return producto
+        s_d = s[dudosos] if s.ndim else s
+        umbral = (np.uint64(2**32) - s_d) % s_d
+        pendientes = dudosos[bajo[dudosos] < umbral]
+        while len(pendientes) > 0:
+            s_p = s[pendientes] if s.ndim else s
+            umbral_p = (np.uint64(2**32) - s_p) % s_p
+            x = self.bloque_palabras(len(pendientes)).astype(np.uint64) * s_p
+            aceptado = (x & np.uint64(0xFFFFFFFF)) >= umbral_p
+            producto[pendientes[aceptado]] = x[aceptado] >> np.uint64(32)
+            pendientes = pendientes[~aceptado]
+        return producto
+    
+    def _lemire64(self, rango: int, size: int) -> np.ndarray:
+        """Enteros uniformes en [0, rango) con 2^32 < rango <= 2^64"""
+        if rango == 2**64:
+            return self._palabras64(size)
+        s = np.uint64(rango)
+        umbral = np.uint64((2**64 - rango) % rango)
+        resultado = np.empty(size, dtype=np.uint64)
+        pendientes = np.arange(size)
+        while len(pendientes) > 0:
+            x = self._palabras64(len(pendientes))
+            aceptado = x * s >= umbral
+            resultado[pendientes[aceptado]] = _mulhi64(x[aceptado], s)
+            pendientes = pendientes[~aceptado]
+        return resultado
+    
+    def eleccion(self, secuencia: Sequence, size: int = 1,
+                 pesos: Union[Sequence[float], 'TablaAlias', None] = None) -> List:
+        """
+        Elige elementos aleatorios de una secuencia, con o sin pesos
+        
+        Con pesos se usa una tabla de alias (Walker/Vose): O(k) para construirla
+        y O(1) por elección. Para repetir elecciones con los mismos pesos
+        conviene pasar directamente una TablaAlias ya construida.
+        
+        Args:
+            secuencia: Secuencia de elementos
+            size: Número de elecciones
+            pesos: Pesos no negativos de cada elemento o una TablaAlias
+            
+        Returns:
+            Lista de elementos elegidos (arreglo si secuencia es un ndarray)
+        """
+        if len(secuencia) == 0:
+            raise ValueError("La secuencia no puede estar vacía")
+        
+        if pesos is None:
+            indices = self.enteros_bloque(0, len(secuencia) - 1, size)
+        else:
+            tabla = pesos if isinstance(pesos, TablaAlias) else TablaAlias(pesos)
+            if tabla.k != len(secuencia):
+                raise ValueError("La cantidad de pesos debe coincidir con la secuencia")
+            indices = tabla.muestrear(size, self)
+        
+        if isinstance(secuencia, np.ndarray):
+            return secuencia[indices]
+        return [secuencia[i] for i in indices]
+    
+    def permutacion(self, n: Union[int, np.ndarray]) -> np.ndarray:
+        """
+        Permutación aleatoria uniforme de range(n) o copia permutada de un arreglo
+        
+        En lugar de n intercambios secuenciales, cada posición recibe una clave
+        aleatoria de 32 bits empaquetada junto a su índice en una palabra de
+        64 bits; un único np.sort de esas palabras da el orden. Los empates de
+        clave se resuelven mezclando cada grupo empatado, de modo que la
+        permutación resultante es exactamente uniforme.
+        
+        Args:
+            n: Longitud de la permutación o arreglo a permutar (eje 0)
+            
+        Returns:
+            Arreglo permutado
+        """
+        if isinstance(n, (int, np.integer)):
+            return self._indices_permutacion(self._validar_tamano(n))
+        arreglo = np.asarray(n)
+        if arreglo.ndim == 0:
+            raise ValueError("Se requiere un entero o un arreglo de al menos una dimensión")
+        return arreglo[self._indices_permutacion(len(arreglo))]
+    
+    def _indices_permutacion(self, n: int) -> np.ndarray:
+        """Permutación uniforme de range(n) como arreglo int64"""
+        if n <= 1:
+            return np.arange(n, dtype=np.int64)
+        if n > 2**32:
+            raise ValueError("La permutación no puede superar 2^32 elementos")
+        palabras = self.bloque_palabras(n).astype(np.uint64)
+        palabras <<= np.uint64(32)
+        palabras |= np.arange(n, dtype=np.uint64)
+        palabras.sort()
+        indices = (palabras & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        
+        claves = palabras >> np.uint64(32)
+        empates = np.flatnonzero(claves[1:] == claves[:-1])
+        if len(empates) == 0:
+            return indices
+        # Grupos de posiciones consecutivas con la misma clave
+        cortes = np.flatnonzero(np.diff(empates) != 1) + 1
+        inicios = empates[np.r_[0, cortes]]
+        largos = np.diff(np.r_[0, cortes, len(empates)]) + 1
+        # Los pares (casi todos los grupos) se intercambian con probabilidad 1/2
+        pares = inicios[largos == 2]
+        pares = pares[(self.bloque_palabras(len(pares)) & 1).astype(bool)]
+        indices[pares], indices[pares + 1] = indices[pares + 1], indices[pares].copy()
+        for inicio, largo in zip(inicios[largos > 2], largos[largos > 2]):
+            fin = inicio + largo
+            indices[inicio:fin] = indices[inicio:fin][self._indices_permutacion(int(largo))]
+        return indices
+    
+    def shuffle(self, secuencia: Union[List, np.ndarray]) -> Union[List, np.ndarray]:
+        """
+        Mezcla una secuencia in-place
+        
+        Todas las posiciones se sortean en un solo bloque (ver permutacion);
+        los arreglos de NumPy se reordenan a lo largo del eje 0.
+        
+        Args:
+            secuencia: Lista o arreglo a mezclar
+            
+        Returns:
+            Secuencia mezclada
+        """
+        indices = self._indices_permutacion(len(secuencia))
+        if isinstance(secuencia, np.ndarray):
+            secuencia[...] = secuencia[indices]
+        else:
+            secuencia[:] = [secuencia[i] for i in indices]
+        return secuencia
+    
+    def reset(self, semilla: Optional[int] = None):
+        """
+        Reinicia el generador con nueva semilla
+        
+        Args:
+            semilla: Nueva semilla (opcional)
+        """
+        if semilla is not None:
+            self.semilla = semilla
+        self._descartar_buffer()
+        self._estado = self.semilla
+        self._inicializar_motor()
+        self.historial.reiniciar(self.semilla)
+
+
+class GeneradorCongruencialMultiplicativo(GeneradorPseudoaleatorio):
+    """
+    Generador Congruencial Multiplicativo (GCM)
     Variante del LCG sin término constante
     """
     
-    def __init__(self, semilla: Optional[int] = None, a: int = 48271, m: int = 2**31 - 1):
+    def __init__(self, semilla: Optional[int] = None, a: int = 48271, m: int = 2**31 - 1,
+                 **opciones):
         """
         Inicializa el GCM
         
@@ -184,89 +1354,1901 @@ class GeneradorCongruencialMultiplicativo(GeneradorPseudoaleatorio):
             semilla: Semilla inicial
             a: Multiplicador
             m: Módulo (preferiblemente primo)
+            **opciones: historial, capacidad_historial, ruta_historial y
+                tam_buffer (ver GeneradorPseudoaleatorio)
         """
-        super().__init__(semilla)
+        super().__init__(semilla, **opciones)
         self.a = a
         self.m = m
         # Asegurar que la semilla sea impar y positiva
-        if self.estado % 2 == 0:
-            self.estado = (self.estado + 1) % self.m
+        if self._estado % 2 == 0:
+            self._estado = (self._estado + 1) % self.m
     
-    def siguiente(self) -> float:
+    def _coeficientes(self) -> Tuple[int, int, int]:
+        """El GCM no tiene término constante"""
+        return self.a, 0, self.m
+    
+    def _siguiente_motor(self) -> float:
         """Genera siguiente número con GCM"""
-        self.estado = (self.a * self.estado) % self.m
-        self.historial.append(self.estado)
-        return self.estado / self.m
+        self._estado = (self.a * self._estado) % self.m
+        self.historial.agregar(self._estado)
+        return self._estado / self.m
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """
+        Genera n números del GCM en bloque
+        
+        Usa multiplicadores precalculados a^j mod m en uint64: con m < 2^32 el
+        producto a^j * x0 nunca desborda, por lo que no hace falta la
+        descomposición de Schrage. Coincide exactamente con siguiente().
+        """
+        if self.m > 2**32:
+            return self._generar_bloque_escalar(n)
+        return self._avanzar_estados(n) / self.m
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Palabras de 32 bits derivadas de los uniformes del GCM"""
+        return self._palabras_desde_uniformes(self._generar_bloque(n))
 
 
-class PruebasAleatoriedad:
+class GeneradorMersenneTwister(GeneradorPseudoaleatorio):
     """
-    Clase para realizar pruebas de aleatoriedad en los generadores
+    Generador Mersenne Twister MT19937 (periodo 2^19937 - 1)
+    La torsión del estado y el templado se calculan en bloque con NumPy
     """
     
-    @staticmethod
-    def prueba_chisquare(datos: List[float], bins: int = 10) -> dict:
+    def _inicializar_mt(self):
+        """Carga el estado inicial (en caché por semilla) y fuerza una torsión"""
+        self._mt = _estado_inicial_mt(self.semilla).copy()
+        self.mt_index = MT_N
+    
+    @property
+    def mt_state(self) -> np.ndarray:
+        """Generación actual de 624 palabras del MT19937"""
+        return self._mt
+    
+    def _capturar_motor(self):
+        return self._mt.copy(), self.mt_index
+    
+    def _restaurar_motor(self, captura):
+        mt, self.mt_index = captura
+        self._mt = mt.copy()
+    
+    def _empaquetar_motor(self) -> bytes:
+        return struct.pack('<H', self.mt_index) + self._mt.astype('<u4').tobytes()
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        (self.mt_index,) = struct.unpack_from('<H', datos)
+        self._mt = np.frombuffer(datos[2:2 + 4 * MT_N], dtype='<u4').astype(np.uint32)
+    
+    def _siguiente_motor(self) -> float:
         """
-        Prueba de chi-cuadrado para uniformidad
+        Genera el siguiente número pseudoaleatorio entre 0 y 1
+        
+        Returns:
+            Número pseudoaleatorio en [0, 1)
+        """
+        if self.mt_index >= MT_N:
+            self._mt = _torcer_mt(self._mt, 1)
+            self.mt_index = 0
+        y = int(self._mt[self.mt_index])
+        self.mt_index += 1
+        self.historial.agregar(y)
+        
+        # Templado
+        y ^= y >> 11
+        y ^= (y << 7) & 0x9D2C5680
+        y ^= (y << 15) & 0xEFC60000
+        y ^= y >> 18
+        return y / 2**32
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Genera n palabras de 32 bits torciendo generaciones completas en bloque"""
+        partes = []
+        disponibles = min(n, MT_N - self.mt_index)
+        if disponibles > 0:
+            partes.append(self._mt[self.mt_index:self.mt_index + disponibles])
+            self.mt_index += disponibles
+        
+        restantes = n - disponibles
+        # Se procesa por tramos para acotar la memoria temporal
+        max_generaciones = 1024
+        while restantes > 0:
+            generaciones = min(-(-restantes // MT_N), max_generaciones)
+            crudo = _torcer_mt(self._mt, generaciones)
+            self._mt = crudo[-MT_N:].copy()
+            tomar = min(restantes, len(crudo))
+            partes.append(crudo[:tomar])
+            self.mt_index = tomar - MT_N * (generaciones - 1)
+            restantes -= tomar
+        
+        if not partes:
+            return np.empty(0, dtype=np.uint32)
+        crudas = np.concatenate(partes)
+        self.historial.agregar_bloque(crudas)
+        return _templar_mt(crudas)
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes en bloque a partir de las palabras templadas"""
+        return self._generar_palabras(n) / 2**32
+    
+    def _saltar_motor(self, k: int):
+        """
+        Avanza el generador k posiciones descartando la salida
+        
+        MT19937 no admite un salto algebraico barato, así que se avanza por
+        bloques vectorizados (O(k), sin ciclos por número).
         
         Args:
-            datos: Lista de números aleatorios
-            bins: Número de intervalos
+            k: Número de posiciones a avanzar
+        """
+        k = self._validar_tamano(k)
+        # Como en el LCG, el salto registra una sola entrada en el historial
+        historial, self.historial = self.historial, HistorialNulo()
+        try:
+            while k > 0:
+                tramo = min(k, MT_N * 1024)
+                self._generar_palabras(tramo)
+                k -= tramo
+        finally:
+            self.historial = historial
+        if self.mt_index > 0:
+            self.historial.agregar(int(self._mt[self.mt_index - 1]))
+
+
+class GeneradorPhilox(GeneradorPseudoaleatorio):
+    """
+    Generador basado en contador Philox4x32-10
+    
+    La palabra número i del flujo es una función pura de (clave, flujo, i):
+    cualquier proceso puede calcular cualquier tramo sin estado compartido
+    ni dependencia secuencial, lo que permite repartir réplicas entre
+    procesos manteniendo la reproducibilidad desde una sola semilla.
+    """
+    
+    def __init__(self, semilla: Optional[int] = None, flujo: int = 0, **opciones):
+        """
+        Inicializa el generador Philox
+        
+        Args:
+            semilla: Semilla de hasta 64 bits (se usa como clave)
+            flujo: Identificador de subflujo de 64 bits (palabras altas del contador)
+            **opciones: historial, capacidad_historial, ruta_historial y
+                tam_buffer (ver GeneradorPseudoaleatorio)
+        """
+        if not 0 <= flujo < 2**64:
+            raise ValueError("El flujo debe estar en [0, 2^64)")
+        self.flujo = flujo
+        super().__init__(semilla, **opciones)
+    
+    def _inicializar_motor(self):
+        """Vuelve al inicio del flujo"""
+        self.contador = 0
+    
+    def _capturar_motor(self):
+        return self.contador
+    
+    def _restaurar_motor(self, captura):
+        self.contador = captura
+    
+    def _empaquetar_motor(self) -> bytes:
+        return _empaquetar_enteros(self.contador, self.flujo)
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        (self.contador, self.flujo), _ = _desempaquetar_enteros(datos, 2)
+    
+    @property
+    def clave(self) -> Tuple[int, int]:
+        """Clave de 64 bits derivada de la semilla, como dos palabras de 32 bits"""
+        return self.semilla & 0xFFFFFFFF, (self.semilla >> 32) & 0xFFFFFFFF
+    
+    def palabras_en(self, inicio: int, n: int) -> np.ndarray:
+        """
+        Calcula las palabras [inicio, inicio + n) del flujo sin modificar el estado
+        
+        Args:
+            inicio: Posición de la primera palabra
+            n: Cantidad de palabras
             
         Returns:
-            Diccionario con resultados de la prueba
+            Arreglo uint32 de tamaño n
+        """
+        n = self._validar_tamano(n)
+        if n == 0:
+            return np.empty(0, dtype=np.uint32)
+        primer_bloque = inicio // 4
+        n_bloques = (inicio + n - 1) // 4 - primer_bloque + 1
+        indices = np.arange(n_bloques, dtype=np.uint64) + np.uint64(primer_bloque)
+        contadores = np.empty((n_bloques, 4), dtype=np.uint64)
+        contadores[:, 0] = indices & np.uint64(0xFFFFFFFF)
+        contadores[:, 1] = indices >> np.uint64(32)
+        contadores[:, 2] = self.flujo & 0xFFFFFFFF
+        contadores[:, 3] = self.flujo >> 32
+        # Por tramos, para que los temporales de cada ronda quepan en caché
+        palabras = np.empty((n_bloques, 4), dtype=np.uint32)
+        for i in range(0, n_bloques, _PHILOX_TRAMO):
+            palabras[i:i + _PHILOX_TRAMO] = _philox4x32(contadores[i:i + _PHILOX_TRAMO], self.clave)
+        palabras = palabras.ravel()
+        desplazamiento = inicio - primer_bloque * 4
+        return palabras[desplazamiento:desplazamiento + n]
+    
+    def _siguiente_motor(self) -> float:
         """
-        n = len(datos)
-        esperado = n / bins
-        observado, _ = np.histogram(datos, bins=bins, range=(0, 1))
+        Genera el siguiente número pseudoaleatorio entre 0 y 1
         
-        chi2 = np.sum((observado - esperado)**2 / esperado)
-        grados_libertad = bins - 1
+        Returns:
+            Número pseudoaleatorio en [0, 1)
+        """
+        return int(self._generar_palabras(1)[0]) / 2**32
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Calcula las siguientes n palabras del flujo y avanza el contador"""
+        palabras = self.palabras_en(self.contador, n)
+        if self._registra_historial():
+            # Una entrada por palabra: la posición del contador tras entregarla
+            self.historial.agregar_bloque(
+                np.arange(self.contador + 1, self.contador + n + 1, dtype=np.uint64))
+        self.contador += n
+        return palabras
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes en bloque a partir de las palabras de Philox"""
+        return self._generar_palabras(n) / 2**32
+    
+    def _saltar_motor(self, k: int):
+        """
+        Avanza el generador k posiciones en O(1)
         
-        return {
-            'estadistico': chi2,
-            'grados_libertad': grados_libertad,
-            'p_valor': 1 - float(self._chi2_cdf(chi2, grados_libertad)),
-            'uniforme': chi2 < 3 * grados_libertad  # Regla práctica
-        }
+        Args:
+            k: Número de posiciones a avanzar
+        """
+        self.contador += self._validar_tamano(k)
+        self.historial.agregar(self.contador)
+
+
+class GeneradorPCG64(GeneradorPseudoaleatorio):
+    """
+    Generador PCG64 (LCG de 128 bits con salida XSL-RR de 64 bits)
     
-    @staticmethod
-    def _chi2_cdf(x: float, k: int) -> float:
-        """Función de distribución chi-cuadrado aproximada"""
-        from math import gamma
-        if x <= 0:
-            return 0.0
-        # Aproximación simple
-        return 1 - np.exp(-x/2) * (x/2)**(k/2) / gamma(k/2 + 1)
+    Periodo 2^128. Cada número se forma con los 53 bits altos de la salida,
+    como en numpy.random.PCG64. La generación en bloque usa aritmética uint64
+    de NumPy sobre las palabras altas y bajas del estado.
+    El historial no registra estados (no caben en 64 bits).
+    """
     
-    @staticmethod
-    def prueba_corridas(datos: List[float]) -> dict:
+    MULTIPLICADOR = 0x2360ED051FC65DA44385DF649FCCF645
+    
+    def __init__(self, semilla: Optional[int] = None, flujo: int = 0, **opciones):
         """
-        Prueba de corridas arriba/abajo de la media
+        Inicializa el generador PCG64
         
         Args:
-            datos: Lista de números aleatorios
+            semilla: Semilla inicial (initstate)
+            flujo: Selector de secuencia (initseq); define el incremento impar
+            **opciones: historial, capacidad_historial, ruta_historial y
+                tam_buffer (ver GeneradorPseudoaleatorio)
+        """
+        self.flujo = flujo
+        super().__init__(semilla, **opciones)
+    
+    def _inicializar_motor(self):
+        """Siembra el estado como pcg_setseq_128_srandom_r"""
+        self.a = self.MULTIPLICADOR
+        self.c = ((self.flujo << 1) | 1) % 2**128
+        self.m = 2**128
+        estado = (self.c) % self.m
+        estado = (estado + self.semilla) % self.m
+        self._estado = (self.a * estado + self.c) % self.m
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        super()._desempaquetar_motor(datos)
+        self.flujo = self.c >> 1
+    
+    def _siguiente_motor(self) -> float:
+        """
+        Genera el siguiente número pseudoaleatorio entre 0 y 1
+        
+        Returns:
+            Número pseudoaleatorio en [0, 1) con 53 bits de precisión
+        """
+        self._estado = (self.a * self._estado + self.c) % self.m
+        alto, bajo = self._estado >> 64, self._estado & _MASCARA_64
+        x = alto ^ bajo
+        rotacion = alto >> 58
+        salida = ((x >> rotacion) | (x << ((64 - rotacion) & 63))) & _MASCARA_64
+        return (salida >> 11) / 2**53
+    
+    def _generar_salidas64(self, n: int) -> np.ndarray:
+        """Avanza el LCG de 128 bits n pasos en bloque y devuelve las salidas XSL-RR"""
+        A_alto, A_bajo, C_alto, C_bajo = _tabla_afin_128(self.a, self.c, TAM_TABLA_AFIN)
+        salidas = np.empty(n, dtype=np.uint64)
+        estado = self._estado
+        for inicio in range(0, n, TAM_TABLA_AFIN):
+            k = min(TAM_TABLA_AFIN, n - inicio)
+            s_alto, s_bajo = np.uint64(estado >> 64), np.uint64(estado & _MASCARA_64)
+            # (A * s + C) mod 2^128 con palabras de 64 bits
+            bajo = A_bajo[:k] * s_bajo
+            alto = _mulhi64(A_bajo[:k], s_bajo) + A_bajo[:k] * s_alto + A_alto[:k] * s_bajo
+            nuevo_bajo = bajo + C_bajo[:k]
+            alto = alto + C_alto[:k] + (nuevo_bajo < bajo).astype(np.uint64)
+            estado = (int(alto[-1]) << 64) | int(nuevo_bajo[-1])
             
+            x = alto ^ nuevo_bajo
+            rotacion = alto >> np.uint64(58)
+            salidas[inicio:inicio + k] = ((x >> rotacion) |
+                                          (x << ((np.uint64(64) - rotacion) & np.uint64(63))))
+        if n > 0:
+            self._estado = estado
+        return salidas
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Palabras de 32 bits: la mitad alta de cada salida de 64 bits"""
+        return (self._generar_salidas64(n) >> np.uint64(32)).astype(np.uint32)
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes con 53 bits de precisión"""
+        return (self._generar_salidas64(n) >> np.uint64(11)) / 2**53
+    
+    def _saltar_motor(self, k: int):
+        """
+        Avanza el generador k posiciones en O(log k)
+        
+        Args:
+            k: Número de posiciones a avanzar
+        """
+        A, C = _potencia_afin(self.a, self.c, self.m, self._validar_tamano(k))
+        self._estado = (A * self._estado + C) % self.m
+
+
+class GeneradorXoshiro256(GeneradorPseudoaleatorio):
+    """
+    Generador xoshiro256** (periodo 2^256 - 1) con carriles intercalados
+    
+    El estado del carril 0 se siembra con SplitMix64 a partir de la semilla y
+    el carril j es ese estado tras j llamadas a jump() (2^128 pasos cada una),
+    de modo que los carriles nunca se solapan. El flujo entrega, paso a paso,
+    la salida de todos los carriles en orden; así cada operación NumPy produce
+    'carriles' números. Con carriles=1 coincide con la referencia escalar.
+    El historial no registra estados (no caben en 64 bits).
+    """
+    
+    def __init__(self, semilla: Optional[int] = None, carriles: int = 1024,
+                 **opciones):
+        """
+        Inicializa el generador xoshiro256**
+        
+        Args:
+            semilla: Semilla inicial (se expande con SplitMix64)
+            carriles: Número de subflujos intercalados que avanzan en paralelo
+            **opciones: historial, capacidad_historial, ruta_historial y
+                tam_buffer (ver GeneradorPseudoaleatorio)
+        """
+        if carriles <= 0:
+            raise ValueError("El número de carriles debe ser positivo")
+        self.carriles = carriles
+        super().__init__(semilla, **opciones)
+    
+    def _inicializar_motor(self):
+        """Siembra los carriles y vacía la salida pendiente"""
+        estado = _splitmix64(np.arange(1, 5), self.semilla)
+        self.estado_xoshiro = _estados_carriles_xoshiro(estado, self.carriles)
+        self._salida = np.empty(0, dtype=np.uint64)
+        self._posicion = 0
+    
+    def _capturar_motor(self):
+        return self.estado_xoshiro.copy(), self._salida, self._posicion
+    
+    def _restaurar_motor(self, captura):
+        estado, self._salida, self._posicion = captura
+        self.estado_xoshiro = estado.copy()
+    
+    def _empaquetar_motor(self) -> bytes:
+        pendiente = self._salida[self._posicion:]
+        return (struct.pack('<II', self.carriles, len(pendiente)) +
+                self.estado_xoshiro.astype('<u8').tobytes() + pendiente.astype('<u8').tobytes())
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        self.carriles, n_pendiente = struct.unpack_from('<II', datos)
+        palabras = np.frombuffer(datos[8:], dtype='<u8').astype(np.uint64)
+        self.estado_xoshiro = palabras[:4 * self.carriles].reshape(4, self.carriles).copy()
+        self._salida = palabras[4 * self.carriles:4 * self.carriles + n_pendiente]
+        self._posicion = 0
+    
+    def _generar_salidas64(self, n: int) -> np.ndarray:
+        """Devuelve las siguientes n salidas de 64 bits del flujo intercalado"""
+        partes = []
+        pendientes = min(n, len(self._salida) - self._posicion)
+        if pendientes > 0:
+            partes.append(self._salida[self._posicion:self._posicion + pendientes])
+            self._posicion += pendientes
+        
+        restantes = n - pendientes
+        if restantes > 0:
+            pasos = -(-restantes // self.carriles)
+            salida = np.empty((pasos, self.carriles), dtype=np.uint64)
+            s0, s1, s2, s3 = self.estado_xoshiro
+            for paso in range(pasos):
+                salida[paso] = _paso_xoshiro(s0, s1, s2, s3)
+            salida = salida.ravel()
+            partes.append(salida[:restantes])
+            # El último paso puede quedar consumido solo en parte
+            self._salida = salida[(pasos - 1) * self.carriles:]
+            self._posicion = restantes - (pasos - 1) * self.carriles
+        
+        if not partes:
+            return np.empty(0, dtype=np.uint64)
+        return np.concatenate(partes)
+    
+    def _siguiente_motor(self) -> float:
+        """
+        Genera el siguiente número pseudoaleatorio entre 0 y 1
+        
         Returns:
-            Diccionario con resultados
+            Número pseudoaleatorio en [0, 1) con 53 bits de precisión
+        """
+        return int(self._generar_salidas64(1)[0] >> np.uint64(11)) / 2**53
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Palabras de 32 bits: la mitad alta de cada salida de 64 bits"""
+        return (self._generar_salidas64(n) >> np.uint64(32)).astype(np.uint32)
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes con 53 bits de precisión"""
+        return (self._generar_salidas64(n) >> np.uint64(11)) / 2**53
+    
+    def _saltar_motor(self, k: int):
         """
-        media = np.mean(datos)
-        secuencia = ['+' if x > media else '-' for x in datos]
+        Avanza el generador k posiciones descartando la salida (por bloques)
         
-        corridas = 1
-        for i in range(1, len(secuencia)):
-            if secuencia[i] != secuencia[i-1]:
-                corridas += 1
+        Args:
+            k: Número de posiciones a avanzar
+        """
+        k = self._validar_tamano(k)
+        while k > 0:
+            tramo = min(k, self.carriles * 1024)
+            self._generar_salidas64(tramo)
+            k -= tramo
+
+
+class GeneradorNumpy(GeneradorPseudoaleatorio):
+    """
+    Adaptador de numpy.random.Generator a la interfaz de GeneradorPseudoaleatorio
+    
+    Permite correr las distribuciones y simulaciones del proyecto sobre los
+    motores compilados de NumPy (modo producción) sin cambiar el código que
+    las llama.
+    """
+    
+    # Campos de bit_generator.state por BitGenerator: (ruta, tipo del arreglo
+    # o None si es un entero). Los arreglos se guardan en little-endian.
+    _CAMPOS_ESTADO = {
+        'PCG64': (('state.state', None), ('state.inc', None),
+                  ('has_uint32', None), ('uinteger', None)),
+        'PCG64DXSM': (('state.state', None), ('state.inc', None),
+                      ('has_uint32', None), ('uinteger', None)),
+        'Philox': (('state.counter', np.uint64), ('state.key', np.uint64), ('buffer', np.uint64),
+                   ('buffer_pos', None), ('has_uint32', None), ('uinteger', None)),
+        'SFC64': (('state.state', np.uint64), ('has_uint32', None), ('uinteger', None)),
+        'MT19937': (('state.key', np.uint32), ('state.pos', None)),
+    }
+    
+    def __init__(self, semilla: Optional[int] = None, bit_generator: str = 'PCG64',
+                 **opciones):
+        """
+        Inicializa el adaptador
         
-        n = len(datos)
-        esperado = (2 * n - 1) / 3
-        varianza = (16 * n - 29) / 90
+        Args:
+            semilla: Semilla inicial
+            bit_generator: Nombre del BitGenerator de numpy.random
+                ('PCG64', 'PCG64DXSM', 'Philox', 'SFC64', 'MT19937')
+            **opciones: historial, capacidad_historial, ruta_historial y
+                tam_buffer (ver GeneradorPseudoaleatorio)
+        """
+        if not hasattr(np.random, bit_generator):
+            raise ValueError(f"BitGenerator '{bit_generator}' no disponible en numpy.random")
+        self.bit_generator = bit_generator
+        super().__init__(semilla, **opciones)
+    
+    def _inicializar_motor(self):
+        """Crea el numpy.random.Generator a partir de la semilla"""
+        self.rng = np.random.Generator(getattr(np.random, self.bit_generator)(self.semilla))
+    
+    def _capturar_motor(self):
+        return self.rng.bit_generator.state
+    
+    def _restaurar_motor(self, captura):
+        self.rng.bit_generator.state = captura
+    
+    def _empaquetar_motor(self) -> bytes:
+        """
+        Codifica bit_generator.state campo a campo (sin pickle)
         
-        z = (corridas - esperado) / np.sqrt(varianza)
+        El nombre del BitGenerator va primero; luego cada campo de
+        _CAMPOS_ESTADO como entero o como arreglo (longitud, palabras).
+        """
+        if self.bit_generator not in self._CAMPOS_ESTADO:
+            raise ValueError(f"No se puede serializar el estado de '{self.bit_generator}'")
+        estado = self.rng.bit_generator.state
+        nombre = self.bit_generator.encode('ascii')
+        partes = [struct.pack('<B', len(nombre)), nombre]
+        for ruta, tipo in self._CAMPOS_ESTADO[self.bit_generator]:
+            valor = estado
+            for clave in ruta.split('.'):
+                valor = valor[clave]
+            if tipo is None:
+                partes.append(_empaquetar_enteros(int(valor)))
+            else:
+                arreglo = np.asarray(valor).astype(np.dtype(tipo).newbyteorder('<'))
+                partes.append(struct.pack('<I', arreglo.size) + arreglo.tobytes())
+        return b''.join(partes)
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        """Decodifica el estado escrito por _empaquetar_motor()"""
+        (largo,) = struct.unpack_from('<B', datos)
+        nombre = datos[1:1 + largo].decode('ascii')
+        if nombre not in self._CAMPOS_ESTADO:
+            raise ValueError(f"BitGenerator '{nombre}' desconocido en el estado")
+        datos = datos[1 + largo:]
+        estado = {'bit_generator': nombre}
+        for ruta, tipo in self._CAMPOS_ESTADO[nombre]:
+            if tipo is None:
+                (valor,), datos = _desempaquetar_enteros(datos, 1)
+            else:
+                (cantidad,) = struct.unpack_from('<I', datos)
+                fin = 4 + cantidad * np.dtype(tipo).itemsize
+                valor = np.frombuffer(datos[4:fin], dtype=np.dtype(tipo).newbyteorder('<')).astype(tipo)
+                datos = datos[fin:]
+            destino = estado
+            *padres, clave = ruta.split('.')
+            for padre in padres:
+                destino = destino.setdefault(padre, {})
+            destino[clave] = valor
+        if nombre != self.bit_generator:
+            self.bit_generator = nombre
+            self._inicializar_motor()
+        self.rng.bit_generator.state = estado
+    
+    def _siguiente_motor(self) -> float:
+        """
+        Genera el siguiente número pseudoaleatorio entre 0 y 1
         
-        return {
-            'corridas_observadas': corridas,
-            'corridas_esperadas': esperado,
+        Returns:
+            Número pseudoaleatorio en [0, 1)
+        """
+        return float(self.rng.random())
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        """Genera n uniformes con numpy.random.Generator.random"""
+        return self.rng.random(n)
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        """Palabras de 32 bits tomadas de los mismos uniformes que siguiente()"""
+        return self._palabras_desde_uniformes(self.rng.random(n))
+    
+    def _saltar_motor(self, k: int):
+        """
+        Avanza el generador k posiciones
+        
+        Solo en PCG64 y PCG64DXSM advance(k) avanza exactamente k salidas de
+        64 bits (una por uniforme); Philox, por ejemplo, avanza en bloques de
+        cuatro. Los demás BitGenerator descartan k uniformes.
+        
+        Args:
+            k: Número de posiciones a avanzar
+        """
+        k = self._validar_tamano(k)
+        if self.bit_generator in ('PCG64', 'PCG64DXSM'):
+            self.rng.bit_generator.advance(k)
+        else:
+            while k > 0:
+                tramo = min(k, 1 << 20)
+                self.rng.random(tramo)
+                k -= tramo
+
+
+class GeneradorAntitetico(GeneradorPseudoaleatorio):
+    """
+    Vista antitética de otro generador
+    
+    Entrega U' = (1 - 2^-53) - U por cada uniforme U del generador base, de
+    modo que U' sigue en [0, 1) y U + U' es constante. Las palabras se derivan
+    de esos mismos uniformes reflejados (floor(U' * 2^32)), que es el
+    complemento de bits de la palabra base: los métodos que leen palabras
+    (Ziggurat, enteros de Lemire, tabla de alias) reciben así el par
+    antitético de lo que recibe el generador base. Con métodos de rechazo los
+    dos flujos se desalinean después del primer rechazo de distinta longitud.
+    Consume el flujo del generador base.
+    """
+    
+    # Mayor double menor que 1: 1 - U queda en [0, 1) y la resta es exacta
+    _UNO = float(np.nextafter(1.0, 0.0))
+    
+    def __init__(self, base: GeneradorPseudoaleatorio):
+        """
+        Inicializa la vista antitética
+        
+        Args:
+            base: Generador cuyo flujo se refleja
+        """
+        self.base = base
+        # Sin buffer propio: el generador base ya precalcula sus números
+        super().__init__(base.semilla, tam_buffer=0)
+    
+    def _siguiente_motor(self) -> float:
+        return self._UNO - self.base.siguiente()
+    
+    def _generar_bloque(self, n: int) -> np.ndarray:
+        return self._UNO - self.base.bloque(n)
+    
+    def _generar_palabras(self, n: int) -> np.ndarray:
+        return self._palabras_desde_uniformes(self._generar_bloque(n))
+    
+    def _saltar_motor(self, k: int):
+        self.base.saltar(k)
+    
+    def sincronizar(self):
+        self.base.sincronizar()
+    
+    def _empaquetar_motor(self) -> bytes:
+        return self.base.obtener_estado()
+    
+    def _desempaquetar_motor(self, datos: bytes):
+        self.base.restaurar_estado(datos)
+    
+    def reset(self, semilla: Optional[int] = None):
+        self.base.reset(semilla)
+        self.semilla = self.base.semilla
+
+
+class TablaAlias:
+    """
+    Tabla de alias de Walker (construcción de Vose) para distribuciones discretas
+    
+    Se construye en O(k) a partir de k pesos y permite muestrear índices en
+    O(1) por elemento, de forma vectorizada: un índice uniforme y una
+    comparación con su probabilidad de corte.
+    """
+    
+    def __init__(self, pesos: Sequence[float]):
+        """
+        Construye la tabla
+        
+        Args:
+            pesos: Pesos no negativos (no necesitan sumar 1)
+        """
+        pesos = np.asarray(pesos, dtype=np.float64)
+        if pesos.ndim != 1 or len(pesos) == 0:
+            raise ValueError("Los pesos deben ser un vector no vacío")
+        if np.any(pesos < 0) or not np.all(np.isfinite(pesos)):
+            raise ValueError("Los pesos deben ser finitos y no negativos")
+        total = pesos.sum()
+        if total <= 0:
+            raise ValueError("La suma de los pesos debe ser positiva")
+        
+        self.k = len(pesos)
+        self.probabilidades = pesos / total
+        escalados = self.probabilidades * self.k
+        self.corte = np.ones(self.k)
+        self.alias = np.arange(self.k)
+        
+        pequenos = list(np.flatnonzero(escalados < 1))
+        grandes = list(np.flatnonzero(escalados >= 1))
+        while pequenos and grandes:
+            menor = pequenos.pop()
+            mayor = grandes[-1]
+            self.corte[menor] = escalados[menor]
+            self.alias[menor] = mayor
+            escalados[mayor] -= 1 - escalados[menor]
+            if escalados[mayor] < 1:
+                pequenos.append(grandes.pop())
+        # Los restantes quedan con corte 1 (errores de redondeo)
+    
+    def muestrear(self, size: int, generador: GeneradorPseudoaleatorio) -> np.ndarray:
+        """
+        Muestrea índices según los pesos de la tabla
+        
+        Args:
+            size: Número de muestras
+            generador: Generador pseudoaleatorio
+            
+        Returns:
+            Arreglo int64 de índices en [0, k)
+        """
+        columnas = generador.enteros_bloque(0, self.k - 1, size)
+        u = generador.bloque(size)
+        return np.where(u < self.corte[columnas], columnas, self.alias[columnas])
+
+
+# =============================================================================
+# REGISTRO DE MOTORES
+# =============================================================================
+
+MOTORES: Dict[str, Callable[..., GeneradorPseudoaleatorio]] = {
+    'lcg': GeneradorPseudoaleatorio,
+    'gcm': GeneradorCongruencialMultiplicativo,
+    'mt19937': GeneradorMersenneTwister,
+    'philox': GeneradorPhilox,
+    'pcg64': GeneradorPCG64,
+    'xoshiro256': GeneradorXoshiro256,
+    'numpy': GeneradorNumpy,
+}
+
+_motor_por_defecto = 'lcg'
+
+
+def registrar_motor(nombre: str, fabrica: Callable[..., GeneradorPseudoaleatorio]):
+    """
+    Registra un motor de generación bajo un nombre
+    
+    Args:
+        nombre: Nombre del motor
+        fabrica: Clase o función que recibe (semilla, **opciones) y devuelve
+            un GeneradorPseudoaleatorio
+    """
+    MOTORES[nombre] = fabrica
+
+
+def establecer_motor_por_defecto(nombre: str):
+    """
+    Cambia el motor usado cuando no se indica uno explícitamente
+    
+    Args:
+        nombre: Nombre de un motor registrado
+    """
+    global _motor_por_defecto
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor '{nombre}' no registrado")
+    _motor_por_defecto = nombre
+
+
+def crear_generador(motor: Optional[str] = None, semilla: Optional[int] = None,
+                    **opciones) -> GeneradorPseudoaleatorio:
+    """
+    Crea un generador a partir del registro de motores
+    
+    Args:
+        motor: Nombre del motor (None usa el motor por defecto)
+        semilla: Semilla inicial
+        **opciones: Argumentos adicionales del constructor del motor
+        
+    Returns:
+        Generador listo para usar
+    """
+    nombre = motor or _motor_por_defecto
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor '{nombre}' no registrado. Disponibles: {sorted(MOTORES)}")
+    return MOTORES[nombre](semilla, **opciones)
+
+
+def obtener_generador(generador: Union[GeneradorPseudoaleatorio, str, None]) -> GeneradorPseudoaleatorio:
+    """
+    Resuelve el argumento 'generador' de las distribuciones y simulaciones
+    
+    Args:
+        generador: Un generador, el nombre de un motor registrado o None
+            (motor por defecto)
+        
+    Returns:
+        Generador listo para usar
+    """
+    if generador is None or isinstance(generador, str):
+        return crear_generador(generador)
+    return generador
+
+
+class GestorFlujos:
+    """
+    Reparte subflujos reproducibles por réplica entre escenarios
+    
+    La réplica i recibe siempre el mismo subflujo (números aleatorios comunes):
+    al comparar escenarios con el mismo gestor, las diferencias se deben a los
+    parámetros y no al ruido de muestreo. Con antiteticas=True las réplicas
+    2k y 2k+1 comparten subflujo y la segunda usa 1 - U (GeneradorAntitetico).
+    """
+    
+    def __init__(self, semilla: Optional[int] = None, motor: str = 'philox',
+                 antiteticas: bool = False, **opciones):
+        """
+        Inicializa el gestor
+        
+        Args:
+            semilla: Semilla común a todos los subflujos
+            motor: Motor registrado que acepte el argumento 'flujo'
+                ('philox' o 'pcg64')
+            antiteticas: Si True, las réplicas se agrupan en pares antitéticos
+            **opciones: Opciones adicionales del constructor del motor
+        """
+        try:
+            base = crear_generador(motor, semilla, flujo=0, **opciones)
+        except TypeError:
+            raise ValueError(f"El motor '{motor}' no admite subflujos (argumento 'flujo')")
+        self.semilla = base.semilla
+        self.motor = motor
+        self.antiteticas = antiteticas
+        self.opciones = opciones
+    
+    def generador(self, replica: int) -> GeneradorPseudoaleatorio:
+        """
+        Devuelve un generador nuevo, al inicio del subflujo de la réplica
+        
+        Args:
+            replica: Índice de la réplica (desde 0)
+            
+        Returns:
+            Generador del subflujo (antitético en las réplicas impares si
+            antiteticas=True)
+        """
+        if replica < 0:
+            raise ValueError("El índice de réplica no puede ser negativo")
+        flujo = replica // 2 if self.antiteticas else replica
+        generador = crear_generador(self.motor, self.semilla, flujo=flujo, **self.opciones)
+        if self.antiteticas and replica % 2:
+            return GeneradorAntitetico(generador)
+        return generador
+    
+    def replicas(self, n: int) -> Iterator[GeneradorPseudoaleatorio]:
+        """
+        Itera los generadores de las réplicas 0..n-1
+        
+        Args:
+            n: Número de réplicas
+        """
+        for replica in range(n):
+            yield self.generador(replica)
+
+
+# =============================================================================
+# SECUENCIAS CUASIALEATORIAS
+# =============================================================================
+
+@lru_cache(maxsize=8)
+def _numeros_direccion_sobol(dimension: int) -> np.ndarray:
+    """
+    Números de dirección de Sobol escalados a 32 bits
+    
+    Args:
+        dimension: Número de dimensiones (1 a 32)
+        
+    Returns:
+        Arreglo uint32 de forma (_SOBOL_BITS, dimension); la fila k es v_k
+    """
+    V = np.empty((_SOBOL_BITS, dimension), dtype=np.uint64)
+    V[:, 0] = [1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]
+    for j in range(1, dimension):
+        poly, m = _SOBOL_DIRECCIONES[j - 1]
+        grado = len(m)
+        v = [m[k] << (_SOBOL_BITS - 1 - k) for k in range(grado)]
+        for k in range(grado, _SOBOL_BITS):
+            x = v[k - grado] ^ (v[k - grado] >> grado)
+            for i in range(1, grado):
+                if (poly >> (grado - i)) & 1:
+                    x ^= v[k - i]
+            v.append(x)
+        V[:, j] = v
+    V = V.astype(np.uint32)
+    V.flags.writeable = False
+    return V
+
+
+@lru_cache(maxsize=64)
+def _inverso_radical(base: int) -> np.ndarray:
+    """
+    Inverso radical en la base dada de 0..B-1, con B la mayor potencia de base <= 2^16
+    
+    Args:
+        base: Base de numeración
+        
+    Returns:
+        Arreglo float64 de tamaño B
+    """
+    digitos = max(1, int(16 // math.log2(base)))
+    indices = np.arange(base ** digitos)
+    tabla = np.zeros(len(indices))
+    factor = 1.0 / base
+    for _ in range(digitos):
+        indices, restos = np.divmod(indices, base)
+        tabla += restos * factor
+        factor /= base
+    tabla.flags.writeable = False
+    return tabla
+
+
+def _primos(n: int) -> List[int]:
+    """Primeros n números primos"""
+    primos = []
+    candidato = 2
+    while len(primos) < n:
+        if all(candidato % p for p in primos if p * p <= candidato):
+            primos.append(candidato)
+        candidato += 1
+    return primos
+
+
+class SecuenciaCuasialeatoria(ABC):
+    """
+    Base de las secuencias de baja discrepancia (cuasi-Monte Carlo)
+    
+    A diferencia de GeneradorPseudoaleatorio, entrega puntos de un hipercubo
+    [0, 1)^dimension que cubren el espacio de forma uniforme; el error de
+    integración baja aproximadamente como O(log(n)^d / n) en lugar de
+    O(1/sqrt(n)). La aleatorización opcional permite repetir la estimación con
+    réplicas independientes y calcular un error estándar.
+    """
+    
+    ALEATORIZACIONES: Tuple[Optional[str], ...] = (None, 'desplazamiento')
+    
+    def __init__(self, dimension: int, aleatorizacion: Optional[str] = None,
+                 generador: Union[GeneradorPseudoaleatorio, str, None] = None):
+        """
+        Inicializa la secuencia
+        
+        Args:
+            dimension: Dimensión de los puntos
+            aleatorizacion: Tipo de aleatorización (None para la secuencia pura)
+            generador: Generador usado para aleatorizar (o nombre de un motor)
+        """
+        if dimension < 1:
+            raise ValueError("La dimensión debe ser al menos 1")
+        if aleatorizacion not in self.ALEATORIZACIONES:
+            raise ValueError(f"Aleatorización '{aleatorizacion}' no soportada. "
+                             f"Opciones: {self.ALEATORIZACIONES}")
+        self.dimension = dimension
+        self.aleatorizacion = aleatorizacion
+        self.generador = obtener_generador(generador) if aleatorizacion else None
+        self.indice = 0
+        self.realeatorizar()
+    
+    def realeatorizar(self):
+        """Sortea una nueva aleatorización (réplica independiente) y vuelve al inicio"""
+        self.indice = 0
+    
+    def puntos(self, n: int) -> np.ndarray:
+        """
+        Devuelve los siguientes n puntos de la secuencia
+        
+        Args:
+            n: Número de puntos
+            
+        Returns:
+            Arreglo float64 de forma (n, dimension)
+        """
+        puntos = self.puntos_en(self.indice, n)
+        self.indice += n
+        return puntos
+    
+    @abstractmethod
+    def puntos_en(self, inicio: int, n: int) -> np.ndarray:
+        """
+        Calcula los puntos [inicio, inicio + n) sin modificar la posición
+        
+        Args:
+            inicio: Índice del primer punto
+            n: Número de puntos
+            
+        Returns:
+            Arreglo float64 de forma (n, dimension)
+        """
+    
+    def saltar(self, k: int):
+        """
+        Avanza k puntos sin calcularlos
+        
+        Args:
+            k: Número de puntos a saltar
+        """
+        self.indice += GeneradorPseudoaleatorio._validar_tamano(k)
+    
+    def reset(self):
+        """Vuelve al primer punto conservando la aleatorización"""
+        self.indice = 0
+
+
+class SecuenciaSobol(SecuenciaCuasialeatoria):
+    """
+    Secuencia de Sobol con números de dirección de Joe y Kuo (hasta 32 dimensiones)
+    
+    Los puntos se calculan en orden de código Gray: el punto i+1 es el i
+    con un XOR del número de dirección v_c, donde c es la cantidad de ceros
+    finales de i+1. Un tramo completo se obtiene así con un XOR acumulado.
+    
+    Aleatorizaciones: 'desplazamiento' (desplazamiento digital, XOR con una
+    palabra aleatoria por dimensión) y 'matricial' (matrices triangulares
+    aleatorias de Matoušek más desplazamiento digital, una aproximación
+    barata al scrambling de Owen). Ambas conservan la propiedad de red (t, m, s).
+    """
+    
+    ALEATORIZACIONES = (None, 'desplazamiento', 'matricial')
+    MAX_DIMENSION = len(_SOBOL_DIRECCIONES) + 1
+    
+    def __init__(self, dimension: int, aleatorizacion: Optional[str] = None,
+                 generador: Union[GeneradorPseudoaleatorio, str, None] = None):
+        """
+        Inicializa la secuencia de Sobol
+        
+        Args:
+            dimension: Dimensión de los puntos (1 a MAX_DIMENSION)
+            aleatorizacion: None, 'desplazamiento' o 'matricial'
+            generador: Generador usado para aleatorizar (o nombre de un motor)
+        """
+        if not 1 <= dimension <= self.MAX_DIMENSION:
+            raise ValueError(f"La dimensión debe estar entre 1 y {self.MAX_DIMENSION}")
+        super().__init__(dimension, aleatorizacion, generador)
+    
+    def realeatorizar(self):
+        """Sortea nuevas matrices y desplazamientos digitales y vuelve al inicio"""
+        super().realeatorizar()
+        V = _numeros_direccion_sobol(self.dimension)
+        self.desplazamiento = np.zeros(self.dimension, dtype=np.uint32)
+        if self.aleatorizacion is None:
+            self.direcciones = V
+            return
+        if self.aleatorizacion == 'matricial':
+            V = self._mezclar_direcciones(V)
+        self.direcciones = V
+        self.desplazamiento = self.generador.bloque_palabras(self.dimension)
+    
+    def _mezclar_direcciones(self, V: np.ndarray) -> np.ndarray:
+        """Aplica una matriz triangular inferior aleatoria (diagonal 1) por dimensión"""
+        corrimientos = np.arange(_SOBOL_BITS - 1, -1, -1, dtype=np.uint64)
+        # bits[k, j, t]: dígito t (desde el más significativo) de v_k en la dimensión j
+        bits = (V[:, :, None].astype(np.uint64) >> corrimientos) & np.uint64(1)
+        L = self.generador.enteros_bloque(0, 1, self.dimension * _SOBOL_BITS**2)
+        L = np.tril(L.reshape(self.dimension, _SOBOL_BITS, _SOBOL_BITS), -1)
+        L[:, np.arange(_SOBOL_BITS), np.arange(_SOBOL_BITS)] = 1
+        # Dígito i mezclado = XOR_t L[j, i, t] * dígito t
+        mezclados = np.einsum('jit,kjt->kji', L, bits.astype(np.int64)) & 1
+        return (mezclados.astype(np.uint64) << corrimientos).sum(axis=2).astype(np.uint32)
+    
+    def puntos_en(self, inicio: int, n: int) -> np.ndarray:
+        """
+        Calcula los puntos [inicio, inicio + n) sin modificar la posición
+        
+        Args:
+            inicio: Índice del primer punto
+            n: Número de puntos
+            
+        Returns:
+            Arreglo float64 de forma (n, dimension)
+        """
+        n = GeneradorPseudoaleatorio._validar_tamano(n)
+        if inicio + n > 2**_SOBOL_BITS:
+            raise ValueError(f"La secuencia de Sobol admite hasta 2^{_SOBOL_BITS} puntos")
+        enteros = np.empty((n, self.dimension), dtype=np.uint32)
+        if n == 0:
+            return enteros.astype(np.float64)
+        # Primer punto directamente desde el código Gray de inicio
+        gray = inicio ^ (inicio >> 1)
+        primero = self.desplazamiento.copy()
+        for k in range(_SOBOL_BITS):
+            if (gray >> k) & 1:
+                primero ^= self.direcciones[k]
+        enteros[0] = primero
+        # Los siguientes: XOR acumulado de v_c con c = ceros finales del índice
+        indices = np.arange(inicio + 1, inicio + n, dtype=np.int64)
+        ceros_finales = np.log2(indices & -indices).astype(np.int64)
+        enteros[1:] = self.direcciones[ceros_finales]
+        np.bitwise_xor.accumulate(enteros, axis=0, out=enteros)
+        return enteros / 2**_SOBOL_BITS
+
+
+class SecuenciaHalton(SecuenciaCuasialeatoria):
+    """
+    Secuencia de Halton: inverso radical en la base del j-ésimo primo por dimensión
+    
+    Con aleatorizacion='desplazamiento' se aplica la rotación de
+    Cranley-Patterson, (x + U) mod 1 con un U aleatorio por dimensión.
+    Conviene para dimensiones bajas; en dimensiones altas las bases grandes
+    generan correlaciones entre coordenadas.
+    """
+    
+    def realeatorizar(self):
+        """Sortea una nueva rotación y vuelve al inicio"""
+        super().realeatorizar()
+        self.bases = _primos(self.dimension)
+        if self.aleatorizacion == 'desplazamiento':
+            self.desplazamiento = self.generador.bloque(self.dimension)
+        else:
+            self.desplazamiento = np.zeros(self.dimension)
+    
+    def puntos_en(self, inicio: int, n: int) -> np.ndarray:
+        """
+        Calcula los puntos [inicio, inicio + n) sin modificar la posición
+        
+        Args:
+            inicio: Índice del primer punto
+            n: Número de puntos
+            
+        Returns:
+            Arreglo float64 de forma (n, dimension)
+        """
+        n = GeneradorPseudoaleatorio._validar_tamano(n)
+        puntos = np.zeros((n, self.dimension))
+        for j, base in enumerate(self.bases):
+            # Varios dígitos por pasada: tabla del inverso radical de 0..B-1
+            tabla = _inverso_radical(base)
+            bloque = len(tabla)
+            indices = np.arange(inicio, inicio + n, dtype=np.int64)
+            factor = 1.0
+            columna = puntos[:, j]
+            while indices.size and indices.max() > 0:
+                indices, restos = np.divmod(indices, bloque)
+                columna += tabla[restos] * factor
+                factor /= bloque
+        if self.aleatorizacion == 'desplazamiento':
+            puntos += self.desplazamiento
+            puntos %= 1.0
+        return puntos
+
+
+class PoolGeneradores:
+    """
+    Conjunto de generadores independientes derivados de una semilla maestra
+    
+    El generador i usa el subflujo i de Philox (contador con la clave de la
+    semilla y el flujo i en las palabras altas), por lo que los flujos de
+    distintos generadores nunca se solapan. Construirlos no requiere
+    inicialización costosa y se pueden enviar a otros procesos con pickle.
+    Cada hilo o proceso debe usar su propio generador.
+    """
+    
+    def __init__(self, n: int, semilla: Optional[int] = None, motor: str = 'philox',
+                 **opciones):
+        """
+        Inicializa el pool
+        
+        Args:
+            n: Número de generadores
+            semilla: Semilla maestra
+            motor: Motor registrado que acepte el argumento 'flujo'
+                ('philox' o 'pcg64')
+            **opciones: Opciones adicionales del constructor del motor
+        """
+        if n < 1:
+            raise ValueError("El pool debe tener al menos un generador")
+        self._flujos = GestorFlujos(semilla, motor, **opciones)
+        self.semilla = self._flujos.semilla
+        self._generadores: List[Optional[GeneradorPseudoaleatorio]] = [None] * n
+    
+    def __len__(self) -> int:
+        return len(self._generadores)
+    
+    def __getitem__(self, indice: int) -> GeneradorPseudoaleatorio:
+        """Devuelve el generador número indice (se crea en el primer acceso)"""
+        if not -len(self) <= indice < len(self):
+            raise IndexError("Índice fuera del pool")
+        indice %= len(self)
+        if self._generadores[indice] is None:
+            self._generadores[indice] = self._flujos.generador(indice)
+        return self._generadores[indice]
+    
+    def __iter__(self) -> Iterator[GeneradorPseudoaleatorio]:
+        for indice in range(len(self)):
+            yield self[indice]
+
+
+@lru_cache(maxsize=1)
+def _bits_encendidos_16() -> np.ndarray:
+    """Tabla con la cantidad de bits en 1 de cada entero de 16 bits"""
+    tabla = np.zeros(1 << 16, dtype=np.intp)
+    for bit in range(16):
+        tabla += (np.arange(1 << 16) >> bit) & 1
+    return tabla
+
+
+def _celdas(u: np.ndarray, k: int) -> np.ndarray:
+    """Índice de celda floor(u * k), acotado a [0, k)"""
+    return np.minimum((u * k).astype(np.intp), k - 1)
+
+
+def _prueba_chi2(observado: np.ndarray, probabilidades: np.ndarray, alpha: float) -> dict:
+    """Estadístico chi-cuadrado de conteos contra probabilidades teóricas"""
+    esperado = observado.sum() * np.asarray(probabilidades, dtype=np.float64)
+    chi2 = float(np.sum((observado - esperado)**2 / esperado))
+    grados_libertad = len(observado) - 1
+    p_valor = float(stats.chi2.sf(chi2, grados_libertad))
+    return {
+        'estadistico': chi2,
+        'grados_libertad': grados_libertad,
+        'p_valor': p_valor,
+        'aleatorio': p_valor >= alpha
+    }
+
+
+class AcumuladorPrueba(ABC):
+    """
+    Base de los acumuladores de las pruebas de aleatoriedad
+    
+    Un acumulador resume un segmento del flujo en memoria constante:
+    actualizar() agrega el tramo siguiente, fusionar() agrega el resumen de
+    otro acumulador que cubre el segmento inmediatamente posterior, y
+    resultado() calcula el p-valor con lo acumulado hasta el momento.
+    """
+    
+    def __init__(self):
+        self.n = 0
+    
+    @abstractmethod
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorPrueba':
+        """
+        Agrega el tramo siguiente del flujo
+        
+        Args:
+            tramo: Uniformes en [0, 1)
+        
+        Returns:
+            El mismo acumulador
+        """
+    
+    @abstractmethod
+    def fusionar(self, otro: 'AcumuladorPrueba') -> 'AcumuladorPrueba':
+        """
+        Agrega el resumen del segmento que sigue al de este acumulador
+        
+        Args:
+            otro: Acumulador del mismo tipo y parámetros
+        
+        Returns:
+            El mismo acumulador
+        """
+    
+    @abstractmethod
+    def resultado(self, alpha: float = 0.05) -> dict:
+        """
+        Calcula la prueba con los datos acumulados
+        
+        Args:
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+    
+    def _validar_fusion(self, otro: 'AcumuladorPrueba', *atributos: str):
+        """Verifica que otro acumulador sea compatible con este"""
+        if type(otro) is not type(self):
+            raise ValueError(f"No se puede fusionar {type(otro).__name__} con {type(self).__name__}")
+        for atributo in atributos:
+            if getattr(otro, atributo) != getattr(self, atributo):
+                raise ValueError(f"Los acumuladores difieren en '{atributo}'")
+        if len(getattr(self, 'pendiente', ())):
+            raise ValueError("El segmento previo tiene valores sin procesar; su longitud debe "
+                             "ser múltiplo del tamaño de grupo de la prueba")
+
+
+class AcumuladorChiCuadrado(AcumuladorPrueba):
+    """Conteos por intervalo para la prueba de chi-cuadrado de uniformidad"""
+    
+    def __init__(self, bins: int = 10):
+        super().__init__()
+        self.bins = bins
+        self.conteos = np.zeros(bins, dtype=np.int64)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorChiCuadrado':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        self.conteos += np.bincount(_celdas(tramo, self.bins), minlength=self.bins)
+        self.n += len(tramo)
+        return self
+    
+    def fusionar(self, otro: 'AcumuladorChiCuadrado') -> 'AcumuladorChiCuadrado':
+        self._validar_fusion(otro, 'bins')
+        self.conteos += otro.conteos
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        resultado = _prueba_chi2(self.conteos, np.full(self.bins, 1 / self.bins), alpha)
+        resultado['uniforme'] = resultado.pop('aleatorio')
+        return resultado
+
+
+class AcumuladorCorridas(AcumuladorPrueba):
+    """
+    Cambios de dirección para la prueba de corridas ascendentes y descendentes
+    
+    Guarda los dos primeros y los dos últimos valores del segmento para
+    contar los cambios que cruzan el borde al fusionar.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.cambios = 0
+        self.cabeza = np.empty(0)
+        self.cola = np.empty(0)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorCorridas':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        segmento = AcumuladorCorridas()
+        sube = tramo[1:] > tramo[:-1]
+        segmento.cambios = int(np.count_nonzero(sube[1:] != sube[:-1]))
+        segmento.cabeza = tramo[:2].copy()
+        segmento.cola = tramo[-2:].copy()
+        segmento.n = len(tramo)
+        return self.fusionar(segmento)
+    
+    def fusionar(self, otro: 'AcumuladorCorridas') -> 'AcumuladorCorridas':
+        self._validar_fusion(otro)
+        # Toda terna contenida en cola + cabeza cruza el borde entre segmentos
+        borde = np.concatenate([self.cola, otro.cabeza])
+        sube = borde[1:] > borde[:-1]
+        self.cambios += otro.cambios + int(np.count_nonzero(sube[1:] != sube[:-1]))
+        self.cabeza = np.concatenate([self.cabeza, otro.cabeza])[:2]
+        self.cola = np.concatenate([self.cola, otro.cola])[-2:]
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        n = self.n
+        corridas = self.cambios + 1
+        esperado = (2 * n - 1) / 3
+        varianza = (16 * n - 29) / 90
+        
+        z = (corridas - esperado) / np.sqrt(varianza)
+        p_valor = float(2 * stats.norm.sf(abs(z)))
+        
+        return {
+            'corridas_observadas': corridas,
+            'corridas_esperadas': esperado,
             'z_score': z,
-            'aleatorio': abs(z) < 1.96  # 95% confianza
-        }
\ No newline at end of file
+            'p_valor': p_valor,
+            'aleatorio': p_valor >= alpha
+        }
+
+
+class AcumuladorHuecos(AcumuladorPrueba):
+    """
+    Histograma de longitudes de hueco entre valores en [a, b)
+    
+    Guarda la posición de la primera y la última marca del segmento para
+    completar el hueco que cruza el borde al fusionar.
+    """
+    
+    def __init__(self, a: float = 0.0, b: float = 0.5, max_hueco: int = 10):
+        if not 0 <= a < b <= 1:
+            raise ValueError("Se requiere 0 <= a < b <= 1")
+        super().__init__()
+        self.a, self.b, self.max_hueco = a, b, max_hueco
+        self.conteos = np.zeros(max_hueco + 1, dtype=np.int64)
+        self.primera: Optional[int] = None
+        self.ultima: Optional[int] = None
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorHuecos':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        segmento = AcumuladorHuecos(self.a, self.b, self.max_hueco)
+        marcas = np.flatnonzero((tramo >= self.a) & (tramo < self.b))
+        if len(marcas):
+            huecos = np.minimum(np.diff(marcas) - 1, self.max_hueco)
+            segmento.conteos += np.bincount(huecos, minlength=self.max_hueco + 1)
+            segmento.primera, segmento.ultima = int(marcas[0]), int(marcas[-1])
+        segmento.n = len(tramo)
+        return self.fusionar(segmento)
+    
+    def fusionar(self, otro: 'AcumuladorHuecos') -> 'AcumuladorHuecos':
+        self._validar_fusion(otro, 'a', 'b', 'max_hueco')
+        self.conteos += otro.conteos
+        if self.ultima is not None and otro.primera is not None:
+            hueco = (self.n - 1 - self.ultima) + otro.primera
+            self.conteos[min(hueco, self.max_hueco)] += 1
+        if self.primera is None and otro.primera is not None:
+            self.primera = otro.primera + self.n
+        if otro.ultima is not None:
+            self.ultima = otro.ultima + self.n
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        if self.conteos.sum() == 0:
+            raise ValueError("No hay suficientes valores en [a, b) para la prueba")
+        p = self.b - self.a
+        probabilidades = p * (1 - p) ** np.arange(self.max_hueco + 1)
+        probabilidades[-1] = (1 - p) ** self.max_hueco
+        resultado = _prueba_chi2(self.conteos, probabilidades, alpha)
+        resultado['huecos'] = int(self.conteos.sum())
+        return resultado
+
+
+class AcumuladorPoker(AcumuladorPrueba):
+    """
+    Conteo de manos por cantidad de dígitos distintos (prueba de póker)
+    
+    Los valores que no completan una mano quedan pendientes para el tramo
+    siguiente.
+    """
+    
+    def __init__(self, digitos: int = 10, tam_mano: int = 5):
+        super().__init__()
+        self.digitos, self.tam_mano = digitos, tam_mano
+        self.conteos = np.zeros(tam_mano + 1, dtype=np.int64)
+        self.pendiente = np.empty(0)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorPoker':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        self.n += len(tramo)
+        if len(self.pendiente):
+            tramo = np.concatenate([self.pendiente, tramo])
+        completas = len(tramo) // self.tam_mano * self.tam_mano
+        self.pendiente = tramo[completas:].copy()
+        mano = _celdas(tramo[:completas], self.digitos).reshape(-1, self.tam_mano)
+        if self.digitos <= 16:
+            # Conjunto de dígitos de cada mano como máscara de bits
+            mascara = np.bitwise_or.reduce(np.left_shift(np.uint16(1), mano.astype(np.uint16)),
+                                           axis=1)
+            distintos = _bits_encendidos_16()[mascara]
+        else:
+            mano.sort(axis=1)
+            distintos = 1 + np.count_nonzero(np.diff(mano, axis=1), axis=1)
+        self.conteos += np.bincount(distintos, minlength=self.tam_mano + 1)
+        return self
+    
+    def fusionar(self, otro: 'AcumuladorPoker') -> 'AcumuladorPoker':
+        self._validar_fusion(otro, 'digitos', 'tam_mano')
+        self.conteos += otro.conteos
+        self.pendiente = otro.pendiente.copy()
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        manos = int(self.conteos.sum())
+        if manos == 0:
+            raise ValueError("No hay datos suficientes para formar una mano")
+        
+        # P(r distintos) = d (d-1) ... (d-r+1) S(k, r) / d^k, con S de Stirling de 2a especie
+        k = self.tam_mano
+        stirling = np.zeros((k + 1, k + 1))
+        stirling[0, 0] = 1
+        for i in range(1, k + 1):
+            for r in range(1, i + 1):
+                stirling[i, r] = r * stirling[i - 1, r] + stirling[i - 1, r - 1]
+        probabilidades = np.array([
+            math.perm(self.digitos, r) * stirling[k, r] / self.digitos**k
+            for r in range(k + 1)
+        ])
+        
+        # Agrupar clases con esperanza baja (las de pocos dígitos distintos)
+        validas = probabilidades > 0
+        observado, probabilidades = self.conteos[validas], probabilidades[validas]
+        while len(probabilidades) > 2 and probabilidades[0] * manos < 5:
+            observado = np.concatenate([[observado[0] + observado[1]], observado[2:]])
+            probabilidades = np.concatenate([[probabilidades[0] + probabilidades[1]],
+                                             probabilidades[2:]])
+        resultado = _prueba_chi2(observado, probabilidades, alpha)
+        resultado['manos'] = manos
+        return resultado
+
+
+class AcumuladorSerial(AcumuladorPrueba):
+    """Conteos de pares consecutivos no solapados en una grilla de celdas x celdas"""
+    
+    def __init__(self, celdas: int = 8):
+        super().__init__()
+        self.celdas = celdas
+        self.conteos = np.zeros(celdas * celdas, dtype=np.int64)
+        self.pendiente = np.empty(0)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorSerial':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        self.n += len(tramo)
+        if len(self.pendiente):
+            tramo = np.concatenate([self.pendiente, tramo])
+        completos = len(tramo) - len(tramo) % 2
+        self.pendiente = tramo[completos:].copy()
+        indices = (_celdas(tramo[0:completos:2], self.celdas) * self.celdas +
+                   _celdas(tramo[1:completos:2], self.celdas))
+        self.conteos += np.bincount(indices, minlength=self.celdas * self.celdas)
+        return self
+    
+    def fusionar(self, otro: 'AcumuladorSerial') -> 'AcumuladorSerial':
+        self._validar_fusion(otro, 'celdas')
+        self.conteos += otro.conteos
+        self.pendiente = otro.pendiente.copy()
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        k = self.celdas * self.celdas
+        resultado = _prueba_chi2(self.conteos, np.full(k, 1 / k), alpha)
+        resultado['pares'] = int(self.conteos.sum())
+        return resultado
+
+
+class AcumuladorAutocorrelacion(AcumuladorPrueba):
+    """
+    Sumas de productos retardados para la prueba de autocorrelación
+    
+    Guarda los primeros y últimos max(retardos) valores del segmento para
+    sumar los productos que cruzan el borde al fusionar.
+    """
+    
+    def __init__(self, retardos: Union[int, Sequence[int]] = 1):
+        super().__init__()
+        if isinstance(retardos, (int, np.integer)):
+            retardos = [retardos]
+        if min(retardos) < 1:
+            raise ValueError("Los retardos deben ser positivos")
+        self.retardos = tuple(int(L) for L in retardos)
+        self.sumas = np.zeros(len(self.retardos))
+        self.pares = np.zeros(len(self.retardos), dtype=np.int64)
+        self.cabeza = np.empty(0)
+        self.cola = np.empty(0)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorAutocorrelacion':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        segmento = AcumuladorAutocorrelacion(self.retardos)
+        # El tramo se centra una sola vez y sirve para todos los retardos
+        centrado = tramo - 0.5
+        for i, L in enumerate(self.retardos):
+            if len(tramo) > L:
+                segmento.sumas[i] = np.dot(centrado[:-L], centrado[L:])
+                segmento.pares[i] = len(tramo) - L
+        maximo = max(self.retardos)
+        segmento.cabeza = tramo[:maximo].copy()
+        segmento.cola = tramo[-maximo:].copy()
+        segmento.n = len(tramo)
+        return self.fusionar(segmento)
+    
+    def fusionar(self, otro: 'AcumuladorAutocorrelacion') -> 'AcumuladorAutocorrelacion':
+        self._validar_fusion(otro, 'retardos')
+        self.sumas += otro.sumas
+        self.pares += otro.pares
+        # Productos (i, i + L) con i en la cola de este segmento e i + L en el otro
+        borde = np.concatenate([self.cola, otro.cabeza]) - 0.5
+        corte = len(self.cola)
+        for i, L in enumerate(self.retardos):
+            inicio = max(0, corte - L)
+            fin = min(corte, len(borde) - L)
+            if fin > inicio:
+                self.sumas[i] += np.dot(borde[inicio:fin], borde[inicio + L:fin + L])
+                self.pares[i] += fin - inicio
+        maximo = max(self.retardos)
+        self.cabeza = np.concatenate([self.cabeza, otro.cabeza])[:maximo]
+        self.cola = np.concatenate([self.cola, otro.cola])[-maximo:]
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        resultados = {}
+        for L, suma, pares in zip(self.retardos, self.sumas, self.pares):
+            if pares == 0:
+                raise ValueError(f"No hay datos suficientes para el retardo {L}")
+            r = 12 * float(suma) / pares
+            z = r * math.sqrt(pares)
+            p_valor = float(2 * stats.norm.sf(abs(z)))
+            resultados[L] = {
+                'autocorrelacion': r,
+                'z_score': z,
+                'p_valor': p_valor,
+                'aleatorio': p_valor >= alpha
+            }
+        return {
+            'retardos': resultados,
+            'aleatorio': all(r['aleatorio'] for r in resultados.values())
+        }
+
+
+class AcumuladorEspectral(AcumuladorPrueba):
+    """
+    Picos bajo el umbral por bloque para la prueba espectral (DFT de NIST)
+    
+    Los valores que no completan un bloque quedan pendientes para el tramo
+    siguiente.
+    """
+    
+    def __init__(self, tam_bloque: int = 1 << 20):
+        super().__init__()
+        self.tam_bloque = tam_bloque
+        self.umbral = math.sqrt(math.log(1 / 0.05) * tam_bloque)
+        self.bajo_umbral = 0
+        self.bloques = 0
+        self.pendiente = np.empty(0)
+    
+    def actualizar(self, tramo: np.ndarray) -> 'AcumuladorEspectral':
+        tramo = np.asarray(tramo, dtype=np.float64)
+        self.n += len(tramo)
+        if len(self.pendiente):
+            tramo = np.concatenate([self.pendiente, tramo])
+        tam = self.tam_bloque
+        completos = len(tramo) // tam * tam
+        self.pendiente = tramo[completos:].copy()
+        for inicio in range(0, completos, tam):
+            x = np.where(tramo[inicio:inicio + tam] >= 0.5, 1.0, -1.0)
+            modulos = np.abs(np.fft.rfft(x)[:tam // 2])
+            self.bajo_umbral += int(np.count_nonzero(modulos < self.umbral))
+            self.bloques += 1
+        return self
+    
+    def fusionar(self, otro: 'AcumuladorEspectral') -> 'AcumuladorEspectral':
+        self._validar_fusion(otro, 'tam_bloque')
+        self.bajo_umbral += otro.bajo_umbral
+        self.bloques += otro.bloques
+        self.pendiente = otro.pendiente.copy()
+        self.n += otro.n
+        return self
+    
+    def resultado(self, alpha: float = 0.05) -> dict:
+        if self.bloques == 0:
+            raise ValueError(f"Se requieren al menos {self.tam_bloque} datos")
+        tam = self.tam_bloque
+        esperado = 0.95 * self.bloques * (tam // 2)
+        d = (self.bajo_umbral - esperado) / math.sqrt(self.bloques * tam * 0.95 * 0.05 / 4)
+        p_valor = float(math.erfc(abs(d) / math.sqrt(2)))
+        return {
+            'picos_bajo_umbral': self.bajo_umbral,
+            'picos_esperados': esperado,
+            'estadistico': d,
+            'p_valor': p_valor,
+            'bloques': self.bloques,
+            'aleatorio': p_valor >= alpha
+        }
+
+
+class PruebasAleatoriedad:
+    """
+    Batería de pruebas de aleatoriedad para uniformes en [0, 1)
+    
+    Todas las pruebas trabajan sobre arreglos de NumPy por tramos de
+    _TRAMO_PRUEBAS elementos (memoria acotada) en O(n) u O(n log n), y
+    devuelven p-valores exactos o asintóticos calculados con scipy.stats.
+    Cada prueba se apoya en un acumulador (AcumuladorPrueba), lo que permite
+    además probar flujos que no caben en memoria con bateria_flujo().
+    """
+    
+    @staticmethod
+    def _como_arreglo(datos: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Convierte los datos a un arreglo float64 unidimensional sin copiar si es posible"""
+        datos = np.asarray(datos, dtype=np.float64).ravel()
+        if len(datos) < 2:
+            raise ValueError("Se requieren al menos 2 datos")
+        return datos
+    
+    @staticmethod
+    def _acumular(datos: Union[List[float], np.ndarray], acumulador: AcumuladorPrueba,
+                  alpha: float) -> dict:
+        """Pasa los datos por tramos al acumulador y devuelve su resultado"""
+        datos = PruebasAleatoriedad._como_arreglo(datos)
+        for inicio in range(0, len(datos), _TRAMO_PRUEBAS):
+            acumulador.actualizar(datos[inicio:inicio + _TRAMO_PRUEBAS])
+        return acumulador.resultado(alpha)
+    
+    @staticmethod
+    def prueba_chisquare(datos: Union[List[float], np.ndarray], bins: int = 10,
+                         alpha: float = 0.05) -> dict:
+        """
+        Prueba de chi-cuadrado para uniformidad
+        
+        Args:
+            datos: Números aleatorios
+            bins: Número de intervalos
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        return PruebasAleatoriedad._acumular(datos, AcumuladorChiCuadrado(bins), alpha)
+    
+    @staticmethod
+    def prueba_corridas(datos: Union[List[float], np.ndarray], alpha: float = 0.05) -> dict:
+        """
+        Prueba de corridas ascendentes y descendentes
+        
+        Args:
+            datos: Números aleatorios
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados
+        """
+        return PruebasAleatoriedad._acumular(datos, AcumuladorCorridas(), alpha)
+    
+    @staticmethod
+    def prueba_huecos(datos: Union[List[float], np.ndarray], a: float = 0.0, b: float = 0.5,
+                      max_hueco: int = 10, alpha: float = 0.05) -> dict:
+        """
+        Prueba de huecos: longitudes entre apariciones sucesivas en [a, b)
+        
+        Args:
+            datos: Números aleatorios
+            a: Límite inferior del intervalo marcado
+            b: Límite superior del intervalo marcado
+            max_hueco: Los huecos de longitud >= max_hueco se agrupan en una clase
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        return PruebasAleatoriedad._acumular(datos, AcumuladorHuecos(a, b, max_hueco), alpha)
+    
+    @staticmethod
+    def prueba_poker(datos: Union[List[float], np.ndarray], digitos: int = 10,
+                     tam_mano: int = 5, alpha: float = 0.05) -> dict:
+        """
+        Prueba de póker: cantidad de dígitos distintos en manos de tam_mano números
+        
+        Cada número aporta un dígito floor(u * digitos); las clases con menos de
+        5 observaciones esperadas se agrupan con la clase vecina.
+        
+        Args:
+            datos: Números aleatorios
+            digitos: Cantidad de dígitos posibles
+            tam_mano: Números por mano
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        return PruebasAleatoriedad._acumular(datos, AcumuladorPoker(digitos, tam_mano), alpha)
+    
+    @staticmethod
+    def prueba_serial(datos: Union[List[float], np.ndarray], celdas: int = 8,
+                      alpha: float = 0.05) -> dict:
+        """
+        Prueba serial: uniformidad de pares consecutivos no solapados en [0, 1)^2
+        
+        Args:
+            datos: Números aleatorios
+            celdas: Divisiones por eje (celdas^2 clases)
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        return PruebasAleatoriedad._acumular(datos, AcumuladorSerial(celdas), alpha)
+    
+    @staticmethod
+    def prueba_autocorrelacion(datos: Union[List[float], np.ndarray],
+                               retardos: Union[int, Sequence[int]] = 1,
+                               alpha: float = 0.05) -> dict:
+        """
+        Prueba de autocorrelación con retardo L
+        
+        Usa r_L = 12/(n-L) * sum((u_i - 1/2)(u_{i+L} - 1/2)), que bajo la hipótesis
+        de uniformes independientes tiene media 0 y varianza 1/(n-L).
+        
+        Args:
+            datos: Números aleatorios
+            retardos: Un retardo o una secuencia de retardos
+            alpha: Nivel de significancia (por retardo)
+        
+        Returns:
+            Diccionario con un resultado por retardo y el veredicto global
+        """
+        datos = PruebasAleatoriedad._como_arreglo(datos)
+        acumulador = AcumuladorAutocorrelacion(retardos)
+        if max(acumulador.retardos) >= len(datos):
+            raise ValueError(f"El retardo debe estar en [1, {len(datos)})")
+        return PruebasAleatoriedad._acumular(datos, acumulador, alpha)
+    
+    @staticmethod
+    def prueba_espectral(datos: Union[List[float], np.ndarray], tam_bloque: int = 1 << 20,
+                         alpha: float = 0.05) -> dict:
+        """
+        Prueba espectral (DFT de NIST SP 800-22) sobre los bits u >= 1/2
+        
+        Cuenta los picos de |FFT| por debajo del umbral sqrt(ln(1/0.05) n) en
+        bloques de tam_bloque bits; bajo aleatoriedad se espera el 95%.
+        Detecta patrones periódicos en el flujo.
+        
+        Args:
+            datos: Números aleatorios
+            tam_bloque: Bits por transformada (el resto final se descarta)
+            alpha: Nivel de significancia
+        
+        Returns:
+            Diccionario con resultados de la prueba
+        """
+        datos = PruebasAleatoriedad._como_arreglo(datos)
+        acumulador = AcumuladorEspectral(min(tam_bloque, len(datos)))
+        return PruebasAleatoriedad._acumular(datos, acumulador, alpha)
+    
+    @staticmethod
+    def _acumuladores_bateria() -> Dict[str, AcumuladorPrueba]:
+        """Acumuladores de todas las pruebas con sus parámetros por defecto"""
+        return {
+            'chisquare': AcumuladorChiCuadrado(),
+            'corridas': AcumuladorCorridas(),
+            'huecos': AcumuladorHuecos(),
+            'poker': AcumuladorPoker(),
+            'serial': AcumuladorSerial(),
+            'autocorrelacion': AcumuladorAutocorrelacion((1, 2, 5, 10)),
+            'espectral': AcumuladorEspectral(),
+        }
+    
+    @staticmethod
+    def _resumir_bateria(acumuladores: Dict[str, AcumuladorPrueba], alpha: float) -> dict:
+        """Resultado de cada acumulador y total de pruebas aprobadas"""
+        resultados = {nombre: acumulador.resultado(alpha)
+                      for nombre, acumulador in acumuladores.items()}
+        aprobadas = sum(bool(r.get('aleatorio', r.get('uniforme'))) for r in resultados.values())
+        return {
+            'pruebas': resultados,
+            'aprobadas': aprobadas,
+            'total': len(resultados)
+        }
+    
+    @staticmethod
+    def _p_valor(resultado: dict) -> float:
+        """p-valor de una prueba (el menor entre retardos para la autocorrelación)"""
+        if 'retardos' in resultado:
+            return min(r['p_valor'] for r in resultado['retardos'].values())
+        return resultado['p_valor']
+    
+    @staticmethod
+    def bateria(datos: Union[List[float], np.ndarray], alpha: float = 0.05) -> dict:
+        """
+        Ejecuta todas las pruebas con sus parámetros por defecto
+        
+        Si los datos son menos que un bloque espectral (2^20), la prueba
+        espectral usa un único bloque con todos los datos.
+        
+        Args:
+            datos: Números aleatorios (por ejemplo, generador.bloque(10**8))
+            alpha: Nivel de significancia de cada prueba
+        
+        Returns:
+            Diccionario con el resultado de cada prueba y el total de aprobadas
+        """
+        datos = PruebasAleatoriedad._como_arreglo(datos)
+        acumuladores = PruebasAleatoriedad._acumuladores_bateria()
+        if len(datos) < acumuladores['espectral'].tam_bloque:
+            acumuladores['espectral'] = AcumuladorEspectral(len(datos))
+        for inicio in range(0, len(datos), _TRAMO_PRUEBAS):
+            tramo = datos[inicio:inicio + _TRAMO_PRUEBAS]
+            for acumulador in acumuladores.values():
+                acumulador.actualizar(tramo)
+        return PruebasAleatoriedad._resumir_bateria(acumuladores, alpha)
+    
+    @staticmethod
+    def bateria_flujo(generador: GeneradorPseudoaleatorio, n: int,
+                      tam_bloque: int = _TRAMO_PRUEBAS, puntos_control: int = 10,
+                      alpha: float = 0.05,
+                      informe: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Ejecuta la batería sobre n números pedidos al generador por bloques
+        
+        La memoria es constante (un bloque más los acumuladores), por lo que
+        n puede ser mucho mayor que la RAM disponible (10^10 o más).
+        
+        Args:
+            generador: Generador a calificar
+            n: Cantidad total de números a probar
+            tam_bloque: Números pedidos al generador en cada paso
+            puntos_control: Cantidad de puntos de control con p-valores parciales
+            alpha: Nivel de significancia de cada prueba
+            informe: Función que recibe cada punto de control a medida que se alcanza
+        
+        Returns:
+            Resultado de la batería con todos los datos y la lista 'puntos_control'
+            de p-valores parciales
+        """
+        n = generador._validar_tamano(n)
+        if n < 2 or tam_bloque < 1:
+            raise ValueError("Se requieren al menos 2 datos y un bloque positivo")
+        acumuladores = PruebasAleatoriedad._acumuladores_bateria()
+        if n < acumuladores['espectral'].tam_bloque:
+            acumuladores['espectral'] = AcumuladorEspectral(n)
+        
+        controles = []
+        paso_control = max(1, n // max(1, puntos_control))
+        siguiente_control = paso_control
+        procesados = 0
+        while procesados < n:
+            tramo = generador.bloque(min(tam_bloque, n - procesados))
+            for acumulador in acumuladores.values():
+                acumulador.actualizar(tramo)
+            procesados += len(tramo)
+            if procesados >= siguiente_control or procesados == n:
+                siguiente_control = (procesados // paso_control + 1) * paso_control
+                try:
+                    p_valores = {nombre: PruebasAleatoriedad._p_valor(a.resultado(alpha))
+                                 for nombre, a in acumuladores.items()}
+                except ValueError:
+                    # Alguna prueba aún no tiene datos suficientes
+                    p_valores = None
+                if p_valores is not None:
+                    control = {'n': procesados, 'p_valores': p_valores}
+                    controles.append(control)
+                    if informe is not None:
+                        informe(control)
+        
+        resultado = PruebasAleatoriedad._resumir_bateria(acumuladores, alpha)
+        resultado['n'] = procesados
+        resultado['puntos_control'] = controles
+        return resultado
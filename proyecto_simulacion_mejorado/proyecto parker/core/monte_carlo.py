@@ -6,43 +6,57 @@ Fecha: Octubre 2024
 
 import numpy as np
 import math
-from typing import List, Dict, Tuple, Optional
-from .generadores import GeneradorPseudoaleatorio
+from typing import List, Dict, Tuple, Optional, Union
+from .generadores import GeneradorPseudoaleatorio, GestorFlujos, SecuenciaCuasialeatoria
+from .distribuciones import DistribucionDiscreta, DistribucionEmpirica
 
 
 class MonteCarlo:
     """Clase para implementar simulaciones de Monte Carlo"""
     
     @staticmethod
-    def estimar_pi(n_puntos: int, generador: GeneradorPseudoaleatorio) -> Dict:
+    def _puntos_uniformes(generador: Union[GeneradorPseudoaleatorio, SecuenciaCuasialeatoria],
+                          n: int, dimension: int) -> np.ndarray:
+        """
+        Obtiene n puntos uniformes en [0, 1)^dimension
+        
+        Con un generador pseudoaleatorio, las coordenadas de cada punto son
+        números consecutivos del flujo; con una secuencia cuasialeatoria se
+        usan sus primeras 'dimension' coordenadas.
+        
+        Returns:
+            Arreglo de forma (n, dimension)
+        """
+        if isinstance(generador, SecuenciaCuasialeatoria):
+            if generador.dimension < dimension:
+                raise ValueError(f"La secuencia debe tener al menos {dimension} dimensiones")
+            return generador.puntos(n)[:, :dimension]
+        return generador.bloque(n * dimension).reshape(n, dimension)
+    
+    @staticmethod
+    def estimar_pi(n_puntos: int,
+                   generador: Union[GeneradorPseudoaleatorio, SecuenciaCuasialeatoria]) -> Dict:
         """
         Estima el valor de π usando el método de Monte Carlo
         
         Args:
             n_puntos: Número de puntos a generar
-            generador: Generador pseudoaleatorio
+            generador: Generador pseudoaleatorio o secuencia cuasialeatoria de
+                al menos 2 dimensiones (cuasi-Monte Carlo)
             
         Returns:
             Diccionario con resultados de la estimación
         """
-        dentro_circulo = 0
-        puntos_x = []
-        puntos_y = []
-        colores = []
-        
-        for i in range(n_puntos):
-            x = generador.siguiente() * 2 - 1  # Rango [-1, 1]
-            y = generador.siguiente() * 2 - 1
-            
-            puntos_x.append(x)
-            puntos_y.append(y)
-            
-            distancia = x**2 + y**2
-            if distancia <= 1:
-                dentro_circulo += 1
-                colores.append('#00a8ff')  # Azul para puntos dentro
-            else:
-                colores.append('#ff4757')  # Rojo para puntos fuera
+        u = MonteCarlo._puntos_uniformes(generador, n_puntos, 2)
+        x = u[:, 0] * 2 - 1  # Rango [-1, 1]
+        y = u[:, 1] * 2 - 1
+        
+        dentro = x**2 + y**2 <= 1
+        dentro_circulo = int(np.count_nonzero(dentro))
+        puntos_x = x.tolist()
+        puntos_y = y.tolist()
+        # Azul para puntos dentro, rojo para puntos fuera
+        colores = np.where(dentro, '#00a8ff', '#ff4757').tolist()
         
         pi_estimado = 4 * dentro_circulo / n_puntos
         error_absoluto = abs(pi_estimado - math.pi)
@@ -67,12 +81,14 @@ class MonteCarlo:
             'puntos_y': puntos_y,
             'colores': colores,
             'intervalo_confianza': (ic_inferior, ic_superior),
-            'margen_error': margen_error * 4
+            'margen_error': margen_error * 4,
+            'cuasi_montecarlo': isinstance(generador, SecuenciaCuasialeatoria)
         }
     
     @staticmethod
     def ruina_jugador(capital_inicial: int, objetivo: int, prob_ganar: float,
-                     n_simulaciones: int, generador: GeneradorPseudoaleatorio) -> Dict:
+                     n_simulaciones: int, generador: Optional[GeneradorPseudoaleatorio] = None,
+                     flujos: Optional[GestorFlujos] = None) -> Dict:
         """
         Simula el problema de la ruina del jugador
         
@@ -82,6 +98,8 @@ class MonteCarlo:
             prob_ganar: Probabilidad de ganar cada apuesta
             n_simulaciones: Número de simulaciones a ejecutar
             generador: Generador pseudoaleatorio
+            flujos: Gestor de subflujos; si se indica, la simulación i usa
+                flujos.generador(i) en lugar de generador (números comunes)
             
         Returns:
             Diccionario con resultados de la simulación
@@ -92,19 +110,22 @@ class MonteCarlo:
             raise ValueError("El objetivo debe ser mayor al capital inicial")
         if not 0 <= prob_ganar <= 1:
             raise ValueError("La probabilidad debe estar entre 0 y 1")
+        if generador is None and flujos is None:
+            raise ValueError("Se requiere un generador o un gestor de flujos")
         
         ruinas = 0
         exitos = 0
         duraciones = []
         trayectorias = []
         
-        for _ in range(n_simulaciones):
+        for i in range(n_simulaciones):
+            generador_i = flujos.generador(i) if flujos is not None else generador
             capital = capital_inicial
             pasos = 0
             trayectoria = [capital]
             
             while capital > 0 and capital < objetivo:
-                if generador.siguiente() < prob_ganar:
+                if generador_i.siguiente() < prob_ganar:
                     capital += 1
                 else:
                     capital -= 1
@@ -146,17 +167,22 @@ class MonteCarlo:
         }
     
     @staticmethod
-    def integracion_montecarlo(funcion, a: float, b: float, 
-                              n_puntos: int, generador: GeneradorPseudoaleatorio) -> Dict:
+    def integracion_montecarlo(funcion, a: float, b: float, n_puntos: int,
+                              generador: Union[GeneradorPseudoaleatorio, SecuenciaCuasialeatoria]) -> Dict:
         """
         Calcula integral definida usando Monte Carlo
         
+        Con una secuencia cuasialeatoria el error baja aproximadamente como
+        O(1/n); el error estándar reportado sigue la fórmula de Monte Carlo y
+        es una cota conservadora (para un error fiable, repetir con varias
+        aleatorizaciones de la secuencia).
+        
         Args:
             funcion: Función a integrar
             a: Límite inferior
             b: Límite superior
             n_puntos: Número de puntos
-            generador: Generador pseudoaleatorio
+            generador: Generador pseudoaleatorio o secuencia cuasialeatoria
             
         Returns:
             Diccionario con resultados de la integración
@@ -165,7 +191,7 @@ class MonteCarlo:
             raise ValueError("El límite inferior debe ser menor al superior")
         
         # Método de muestreo uniforme
-        puntos_x = generador.uniform(a, b, n_puntos)
+        puntos_x = (a + (b - a) * MonteCarlo._puntos_uniformes(generador, n_puntos, 1)[:, 0]).tolist()
         valores_y = [funcion(x) for x in puntos_x]
         
         integral_estimada = (b - a) * np.mean(valores_y)
@@ -185,19 +211,24 @@ class MonteCarlo:
             'puntos_x': puntos_x,
             'valores_y': valores_y,
             'n_puntos': n_puntos,
-            'rango': (a, b)
+            'rango': (a, b),
+            'cuasi_montecarlo': isinstance(generador, SecuenciaCuasialeatoria)
         }
     
     @staticmethod
     def simulacion_inventarios(demanda_media: float, tiempo_entrega: float,
                               punto_reorden: float, cantidad_pedido: float,
                               costo_almacenamiento: float, costo_escasez: float,
-                              n_dias: int, generador: GeneradorPseudoaleatorio) -> Dict:
+                              n_dias: int, generador: GeneradorPseudoaleatorio,
+                              distribucion_demanda: Optional[DistribucionEmpirica] = None) -> Dict:
         """
         Simula sistema de inventarios con política (s, Q)
         
+        La demanda diaria es Poisson(demanda_media), salvo que se indique una
+        distribución empírica de demanda.
+        
         Args:
-            demanda_media: Demanda promedio por día
+            demanda_media: Demanda promedio por día (demanda Poisson)
             tiempo_entrega: Tiempo de entrega en días
             punto_reorden: Punto de reorden (s)
             cantidad_pedido: Cantidad a pedir (Q)
@@ -205,6 +236,7 @@ class MonteCarlo:
             costo_escasez: Costo por unidad en escasez
             n_dias: Días a simular
             generador: Generador pseudoaleatorio
+            distribucion_demanda: Distribución empírica de la demanda diaria (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
@@ -219,9 +251,14 @@ class MonteCarlo:
         historial_inventario = []
         historial_costos = []
         
+        # Demandas diarias generadas de una vez
+        if distribucion_demanda is not None:
+            demandas = distribucion_demanda.muestrear(n_dias, generador).tolist()
+        else:
+            demandas = DistribucionDiscreta.poisson(demanda_media, n_dias, generador).tolist()
+        
         for dia in range(n_dias):
-            # Generar demanda del día (Poisson)
-            demanda = MonteCarlo._generar_demanda_poisson(demanda_media, generador)
+            demanda = demandas[dia]
             
             # Satisfacer demanda
             if inventario >= demanda:
@@ -270,30 +307,37 @@ class MonteCarlo:
     @staticmethod
     def _generar_demanda_poisson(media: float, generador: GeneradorPseudoaleatorio) -> int:
         """Genera demanda con distribución Poisson"""
-        L = math.exp(-media)
-        k = 0
-        p = 1.0
-        while p > L:
-            k += 1
-            p *= generador.siguiente()
-        return k - 1
+        return int(DistribucionDiscreta.poisson(media, 1, generador)[0])
     
     @staticmethod
     def analisis_sensibilidad(parametros_base: Dict, variacion: float,
-                             n_simulaciones: int, generador: GeneradorPseudoaleatorio) -> Dict:
+                             n_simulaciones: int, generador: GeneradorPseudoaleatorio,
+                             numeros_comunes: bool = True,
+                             antiteticas: bool = False) -> Dict:
         """
         Realiza análisis de sensibilidad para simulaciones Monte Carlo
         
+        Con numeros_comunes=True los escenarios base, +δ y −δ reciben los mismos
+        subflujos por réplica (GestorFlujos sembrado desde generador), de modo
+        que la diferencia finita no queda dominada por el ruido de muestreo.
+        
         Args:
             parametros_base: Parámetros base de la simulación
             variacion: Porcentaje de variación (±)
             n_simulaciones: Número de simulaciones por escenario
             generador: Generador pseudoaleatorio
+            numeros_comunes: Usar números aleatorios comunes entre escenarios
+            antiteticas: Agrupar las réplicas en pares antitéticos (requiere
+                numeros_comunes)
             
         Returns:
             Diccionario con resultados del análisis de sensibilidad
         """
         resultados = {}
+        flujos = None
+        if numeros_comunes:
+            semilla = int(generador.enteros_bloque(0, 2**63 - 1, 1)[0])
+            flujos = GestorFlujos(semilla, antiteticas=antiteticas)
         
         for param_name, param_value in parametros_base.items():
             if isinstance(param_value, (int, float)):
@@ -311,13 +355,16 @@ class MonteCarlo:
                 try:
                     resultado_base = MonteCarlo.ruina_jugador(**parametros_base, 
                                                              n_simulaciones=n_simulaciones,
-                                                             generador=generador)
+                                                             generador=generador,
+                                                             flujos=flujos)
                     resultado_pos = MonteCarlo.ruina_jugador(**parametros_pos, 
                                                            n_simulaciones=n_simulaciones,
-                                                           generador=generador)
+                                                           generador=generador,
+                                                           flujos=flujos)
                     resultado_neg = MonteCarlo.ruina_jugador(**parametros_neg, 
                                                            n_simulaciones=n_simulaciones,
-                                                           generador=generador)
+                                                           generador=generador,
+                                                           flujos=flujos)
                     
                     sensibilidad = (resultado_pos['prob_ruina'] - resultado_neg['prob_ruina']) / (2 * variacion * param_value)
                     
@@ -341,5 +388,6 @@ class MonteCarlo:
         return {
             'resultados': resultados_ordenados,
             'parametro_mas_sensible': next(iter(resultados_ordenados)) if resultados_ordenados else None,
-            'variacion_utilizada': variacion
+            'variacion_utilizada': variacion,
+            'numeros_comunes': numeros_comunes
         }
\ No newline at end of file
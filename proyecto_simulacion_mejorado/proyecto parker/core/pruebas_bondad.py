@@ -13,6 +13,13 @@ import math
 class PruebasBondad:
     """Clase para realizar pruebas de bondad de ajuste estadístico"""
     
+    # Familias de scipy.stats que aceptan las pruebas (params = (loc, scale))
+    FAMILIAS = {
+        'normal': stats.norm,
+        'exponencial': stats.expon,
+        'uniforme': stats.uniform,
+    }
+    
     @staticmethod
     def chi_cuadrado(datos: List[float], distribucion: str, params: Tuple, 
                     bins: int = 10, alpha: float = 0.05) -> Dict:
@@ -160,41 +167,25 @@ class PruebasBondad:
             'n': n
         }
     
+    @staticmethod
+    def _familia(distribucion: str):
+        """Devuelve la familia de scipy.stats correspondiente a un nombre"""
+        if distribucion not in PruebasBondad.FAMILIAS:
+            raise ValueError(f"Distribución {distribucion} no soportada")
+        return PruebasBondad.FAMILIAS[distribucion]
+    
     @staticmethod
     def _calcular_frecuencias_esperadas(distribucion: str, params: Tuple, 
                                        bordes: np.ndarray, n: int) -> np.ndarray:
         """Calcula frecuencias esperadas para Chi-cuadrado"""
-        esperado = []
-        
-        for i in range(len(bordes) - 1):
-            if distribucion == 'normal':
-                prob = (stats.norm.cdf(bordes[i+1], *params) - 
-                       stats.norm.cdf(bordes[i], *params))
-            elif distribucion == 'exponencial':
-                prob = (stats.expon.cdf(bordes[i+1], *params) - 
-                       stats.expon.cdf(bordes[i], *params))
-            elif distribucion == 'uniforme':
-                prob = (stats.uniform.cdf(bordes[i+1], *params) - 
-                       stats.uniform.cdf(bordes[i], *params))
-            else:
-                raise ValueError(f"Distribución {distribucion} no soportada")
-            
-            esperado.append(n * prob)
-        
-        return np.array(esperado)
+        cdf = PruebasBondad._familia(distribucion).cdf(bordes, *params)
+        return n * np.diff(cdf)
     
     @staticmethod
     def _calcular_cdf_teorica(distribucion: str, params: Tuple, 
                              datos: np.ndarray) -> np.ndarray:
         """Calcula CDF teórica para KS"""
-        if distribucion == 'normal':
-            return stats.norm.cdf(datos, *params)
-        elif distribucion == 'exponencial':
-            return stats.expon.cdf(datos, *params)
-        elif distribucion == 'uniforme':
-            return stats.uniform.cdf(datos, *params)
-        else:
-            raise ValueError(f"Distribución {distribucion} no soportada")
+        return PruebasBondad._familia(distribucion).cdf(datos, *params)
     
     @staticmethod
     def _valor_critico_ks(alpha: float, n: int) -> float:
@@ -0,0 +1,279 @@
+"""
+Pruebas de bondad de ajuste (humo) de los muestreadores de distribuciones
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from core.distribuciones import (DistribucionContinua, DistribucionDiscreta, DistribucionEmpirica,
+                                 _tabla_inversa)
+from core.generadores import crear_generador
+from core.monte_carlo import MonteCarlo
+
+# Umbral de los p-valores: con semillas fijas las pruebas son deterministas y
+# un muestreador incorrecto da p-valores mucho menores con estos tamaños
+P_MINIMO = 1e-4
+N = 50000
+
+
+def _ks_discreta(muestra: np.ndarray, distribucion) -> float:
+    """
+    p-valor de KS de una muestra entera contra una distribución discreta
+    
+    Usa la transformada integral de probabilidad aleatorizada:
+    F(x - 1) + V·f(x), con V uniforme independiente, es Uniforme(0, 1)
+    exactamente cuando x sigue la distribución, sea cual sea su soporte.
+    """
+    v = crear_generador('pcg64', semilla=999).bloque(len(muestra))
+    u = distribucion.cdf(muestra - 1) + v * distribucion.pmf(muestra)
+    return stats.kstest(u, 'uniform').pvalue
+
+
+CONTINUAS = [
+    ('uniforme', lambda n, g, out=None: DistribucionContinua.uniforme(2.0, 5.0, n, g, out),
+     stats.uniform(2.0, 3.0)),
+    ('exponencial', lambda n, g, out=None: DistribucionContinua.exponencial(1.5, n, g, out),
+     stats.expon(scale=1 / 1.5)),
+    ('normal_box_muller', lambda n, g, out=None: DistribucionContinua.normal_box_muller(
+        1.0, 2.0, n, g, out), stats.norm(1.0, 2.0)),
+    ('normal_polar', lambda n, g, out=None: DistribucionContinua.normal_polar(
+        -1.0, 0.5, n, g, out), stats.norm(-1.0, 0.5)),
+    ('lognormal', lambda n, g, out=None: DistribucionContinua.lognormal(0.3, 0.8, n, g, out),
+     stats.lognorm(0.8, scale=np.exp(0.3))),
+    ('weibull', lambda n, g, out=None: DistribucionContinua.weibull(1.7, 2.5, n, g, out),
+     stats.weibull_min(1.7, scale=2.5)),
+]
+
+
+@pytest.mark.parametrize('nombre, muestrear, distribucion', CONTINUAS)
+@pytest.mark.parametrize('motor', ['philox', 'pcg64'])
+def test_continuas_ks(nombre, muestrear, distribucion, motor):
+    """Kolmogorov-Smirnov contra la distribución de scipy.stats"""
+    muestra = muestrear(N, crear_generador(motor, semilla=31))
+    assert muestra.shape == (N,)
+    assert stats.kstest(muestra, distribucion.cdf).pvalue > P_MINIMO
+
+
+@pytest.mark.parametrize('nombre, muestrear, distribucion', CONTINUAS)
+def test_continuas_out(nombre, muestrear, distribucion):
+    """out= escribe en el arreglo dado (con su forma) los mismos valores que size"""
+    esperado = muestrear(600, crear_generador('philox', semilla=32))
+    destino = np.empty((20, 30))
+    resultado = muestrear(None, crear_generador('philox', semilla=32), out=destino)
+    assert resultado is destino
+    assert np.array_equal(destino.ravel(), esperado)
+    with pytest.raises(ValueError):
+        muestrear(10, crear_generador('philox', semilla=32), out=np.empty(10, dtype=np.float32))
+
+
+def test_parametros_por_posicion():
+    """Parámetros en arreglo: cada posición usa su propio valor"""
+    tasas = np.repeat([0.5, 4.0], N // 2)
+    muestra = DistribucionContinua.exponencial(tasas, N, crear_generador('philox', semilla=33))
+    assert stats.kstest(muestra[:N // 2], stats.expon(scale=2.0).cdf).pvalue > P_MINIMO
+    assert stats.kstest(muestra[N // 2:], stats.expon(scale=0.25).cdf).pvalue > P_MINIMO
+
+
+@pytest.mark.parametrize('n, p', [(1, 0.3), (20, 0.2), (1000, 0.003), (50, 0.5),
+                                  (1000, 0.3), (10**9, 0.7), (200, 0.97)])
+def test_binomial_ks(n, p):
+    """Inversión (n·q < 10) y BTRS (n·q >= 10), con el reflejo p > 1/2"""
+    muestra = DistribucionDiscreta.binomial(n, p, N, crear_generador('philox', semilla=34))
+    assert muestra.dtype == np.int64
+    assert muestra.min() >= 0 and muestra.max() <= n
+    assert _ks_discreta(muestra, stats.binom(n, p)) > P_MINIMO
+
+
+def test_binomial_casos_borde():
+    """p = 0 y p = 1 son deterministas; parámetros inválidos se rechazan"""
+    generador = crear_generador('philox', semilla=35)
+    assert np.all(DistribucionDiscreta.binomial(7, 0.0, 100, generador) == 0)
+    assert np.all(DistribucionDiscreta.binomial(7, 1.0, 100, generador) == 7)
+    with pytest.raises(ValueError):
+        DistribucionDiscreta.binomial(0, 0.5, 10, generador)
+    with pytest.raises(ValueError):
+        DistribucionDiscreta.binomial(10, 1.5, 10, generador)
+
+
+@pytest.mark.parametrize('lam', [0.05, 3.0, 9.99, 10.0, 57.3, 1000.0, 1e7])
+def test_poisson_ks(lam):
+    """Inversión (λ < 10) y PTRS (λ >= 10), sin subdesbordar exp(-λ)"""
+    muestra = DistribucionDiscreta.poisson(lam, N, crear_generador('philox', semilla=36))
+    assert muestra.dtype == np.int64 and muestra.min() >= 0
+    assert _ks_discreta(muestra, stats.poisson(lam)) > P_MINIMO
+
+
+def test_poisson_lambda_por_posicion():
+    """λ en arreglo mezcla ambos métodos y respeta el λ de cada posición"""
+    lam = np.tile([0.5, 4.0, 12.0, 800.0], N // 4)
+    muestra = DistribucionDiscreta.poisson(lam, N, crear_generador('pcg64', semilla=37))
+    assert _ks_discreta(muestra, stats.poisson(lam)) > P_MINIMO
+    for valor in (0.5, 800.0):
+        assert _ks_discreta(muestra[lam == valor], stats.poisson(valor)) > P_MINIMO
+    with pytest.raises(ValueError):
+        DistribucionDiscreta.poisson(np.array([1.0, 0.0]), 2, crear_generador('pcg64', semilla=1))
+
+
+@pytest.mark.parametrize('motor', ['lcg', 'mt19937', 'philox', 'pcg64', 'xoshiro256', 'numpy'])
+def test_normal_ziggurat_ks(motor):
+    """Ziggurat: KS contra la normal con cualquier motor"""
+    muestra = DistribucionContinua.normal(2.0, 3.0, N, crear_generador(motor, semilla=38))
+    assert stats.kstest(muestra, stats.norm(2.0, 3.0).cdf).pvalue > P_MINIMO
+
+
+def test_normal_ziggurat_colas():
+    """La cola más allá de la base del Ziggurat (r ≈ 3.654) tiene la masa correcta"""
+    n = 10**6
+    muestra = DistribucionContinua.normal(0.0, 1.0, n, crear_generador('philox', semilla=39))
+    for umbral in (3.0, 3.654, 4.5):
+        esperados = n * 2 * stats.norm.sf(umbral)
+        observados = np.count_nonzero(np.abs(muestra) > umbral)
+        assert abs(observados - esperados) < 5 * np.sqrt(esperados) + 1
+    colas = np.abs(muestra[np.abs(muestra) > 3.0])
+    condicional = lambda x: 1 - stats.norm.sf(x) / stats.norm.sf(3.0)
+    assert stats.kstest(colas, condicional).pvalue > P_MINIMO
+
+
+def test_normal_parametros_en_arreglo():
+    """μ y σ por posición, con out="""
+    mu = np.repeat([-5.0, 5.0], N // 2)
+    sigma = np.repeat([0.5, 2.0], N // 2)
+    destino = np.empty(N)
+    DistribucionContinua.normal(mu, sigma, None, crear_generador('pcg64', semilla=40), out=destino)
+    assert stats.kstest(destino[:N // 2], stats.norm(-5.0, 0.5).cdf).pvalue > P_MINIMO
+    assert stats.kstest(destino[N // 2:], stats.norm(5.0, 2.0).cdf).pvalue > P_MINIMO
+
+
+@pytest.mark.parametrize('alpha', [0.05, 0.7, 1.0, 2.5, 40.0, 1e5])
+def test_gamma_ks(alpha):
+    """Marsaglia-Tsang (y U^(1/α) para α < 1); el resultado se divide por β"""
+    muestra = DistribucionContinua.gamma(alpha, 2.0, N, crear_generador('philox', semilla=41))
+    assert np.all(muestra >= 0)
+    assert stats.kstest(muestra, stats.gamma(alpha, scale=1 / 2.0).cdf).pvalue > P_MINIMO
+
+
+def test_gamma_alpha_por_posicion():
+    """α en arreglo: posiciones por debajo y por encima de 1 en un mismo lote"""
+    alpha = np.tile([0.3, 1.0, 7.5], N // 3 + 1)[:N]
+    destino = np.empty(N)
+    DistribucionContinua.gamma(alpha, 1.0, N, crear_generador('pcg64', semilla=42), out=destino)
+    for valor in (0.3, 1.0, 7.5):
+        assert stats.kstest(destino[alpha == valor], stats.gamma(valor).cdf).pvalue > P_MINIMO
+    with pytest.raises(ValueError):
+        DistribucionContinua.gamma(np.array([1.0, -1.0]), 1.0, 2, crear_generador('pcg64', semilla=1))
+
+
+def test_empirica_chi_cuadrado():
+    """El muestreo por alias respeta probabilidades irregulares; peso cero no aparece"""
+    valores = np.array([-2.5, 0.0, 1.0, 7.0, 100.0])
+    pesos = np.array([3.0, 0.0, 1.0, 10.0, 0.25])
+    distribucion = DistribucionEmpirica(valores, pesos)
+    muestra = distribucion.muestrear(N, crear_generador('philox', semilla=43))
+    frecuencias = np.array([np.count_nonzero(muestra == v) for v in valores])
+    assert frecuencias[1] == 0 and frecuencias.sum() == N
+    esperadas = N * pesos / pesos.sum()
+    assert stats.chisquare(frecuencias[pesos > 0], esperadas[pesos > 0]).pvalue > P_MINIMO
+    assert distribucion.media() == pytest.approx(np.dot(pesos, valores) / pesos.sum())
+    assert muestra.mean() == pytest.approx(distribucion.media(),
+                                           abs=5 * np.sqrt(distribucion.varianza() / N))
+
+
+def test_empirica_desde_datos():
+    """desde_datos() usa las frecuencias relativas observadas"""
+    distribucion = DistribucionEmpirica.desde_datos([3, 1, 3, 3, 2, 1])
+    assert distribucion.valores.tolist() == [1, 2, 3]
+    np.testing.assert_allclose(distribucion.probabilidades, [2 / 6, 1 / 6, 3 / 6])
+    assert distribucion.varianza() == pytest.approx(np.var([3, 1, 3, 3, 2, 1]))
+    with pytest.raises(ValueError):
+        DistribucionEmpirica([1, 2], [1.0])
+
+
+def test_inventarios_con_demanda_empirica():
+    """simulacion_inventarios() toma la demanda diaria de la distribución dada"""
+    parametros = dict(demanda_media=20, tiempo_entrega=2, punto_reorden=5, cantidad_pedido=50,
+                      costo_almacenamiento=1, costo_escasez=10, n_dias=200)
+    sin_demanda = MonteCarlo.simulacion_inventarios(
+        **parametros, generador=crear_generador('philox', semilla=44),
+        distribucion_demanda=DistribucionEmpirica([0]))
+    assert sin_demanda['dias_escasez'] == 0
+    assert sin_demanda['inventario_promedio'] == 50
+    
+    demanda = DistribucionEmpirica([0, 10, 60], [0.5, 0.3, 0.2])
+    resultado = MonteCarlo.simulacion_inventarios(
+        **parametros, generador=crear_generador('philox', semilla=44),
+        distribucion_demanda=demanda)
+    esperado = demanda.muestrear(200, crear_generador('philox', semilla=44))
+    # El inventario nunca supera s + Q = 55, así que una demanda de 60 es escasez
+    assert resultado['dias_escasez'] >= np.count_nonzero(esperado == 60)
+
+
+@pytest.mark.parametrize('p', [1e-6, 0.01, 0.3, 0.9])
+def test_geometrica_ks(p):
+    """Inversión en forma cerrada: ensayos hasta el primer éxito (soporte desde 1)"""
+    muestra = DistribucionDiscreta.geometrica(p, N, crear_generador('philox', semilla=45))
+    assert muestra.dtype == np.int64 and muestra.min() >= 1
+    assert _ks_discreta(muestra, stats.geom(p)) > P_MINIMO
+
+
+@pytest.mark.parametrize('r, p', [(1, 0.4), (5, 0.05), (30, 0.7), (1000, 0.5)])
+def test_binomial_negativa_ks(r, p):
+    """Mezcla Gamma-Poisson: los ensayos menos r siguen nbinom(r, p) de scipy"""
+    muestra = DistribucionDiscreta.binomial_negativa(r, p, N, crear_generador('pcg64', semilla=46))
+    assert muestra.dtype == np.int64 and muestra.min() >= r
+    assert _ks_discreta(muestra - r, stats.nbinom(r, p)) > P_MINIMO
+
+
+def test_geometrica_binomial_negativa_p_uno():
+    """Con p = 1 el resultado es determinista; p fuera de (0, 1] se rechaza"""
+    generador = crear_generador('philox', semilla=47)
+    assert np.all(DistribucionDiscreta.geometrica(1.0, 50, generador) == 1)
+    assert np.all(DistribucionDiscreta.binomial_negativa(4, 1.0, 50, generador) == 4)
+    with pytest.raises(ValueError):
+        DistribucionDiscreta.geometrica(0.0, 10, generador)
+    with pytest.raises(ValueError):
+        DistribucionDiscreta.binomial_negativa(3, 1.2, 10, generador)
+
+
+TABULADAS = [
+    ('normal', (1.0, 2.0), stats.norm(1.0, 2.0)),
+    ('exponencial', (0.0, 2.0), stats.expon(0.0, 2.0)),
+    ('gamma', (2.5, 0.0, 1.5), stats.gamma(2.5, 0.0, 1.5)),
+    ('beta', (0.5, 0.5), stats.beta(0.5, 0.5)),
+    ('weibull_min', (0.7,), stats.weibull_min(0.7)),
+]
+
+
+@pytest.mark.parametrize('tolerancia', [1e-10, 1e-6])
+@pytest.mark.parametrize('nombre, params, distribucion', TABULADAS)
+def test_inversa_tabulada_error_en_u(nombre, params, distribucion, tolerancia):
+    """F(x̂(u)) difiere de u a lo sumo en la tolerancia pedida (con margen 2x)"""
+    muestra = DistribucionContinua.inversa_tabulada(
+        nombre, params, N, crear_generador('philox', semilla=48), tolerancia=tolerancia)
+    u = crear_generador('philox', semilla=48).bloque(N)
+    assert np.max(np.abs(distribucion.cdf(muestra) - u)) <= 2 * tolerancia
+    assert stats.kstest(muestra, distribucion.cdf).pvalue > P_MINIMO
+
+
+def test_inversa_tabulada_cache_y_out():
+    """La tabla se construye una vez por parámetros; out= recibe la muestra"""
+    generador = crear_generador('pcg64', semilla=49)
+    DistribucionContinua.inversa_tabulada('lognorm', (0.6,), 10, generador)
+    aciertos = _tabla_inversa.cache_info().hits
+    destino = np.empty((100, 50))
+    resultado = DistribucionContinua.inversa_tabulada('lognorm', (0.6,), None, generador,
+                                                      out=destino)
+    assert resultado is destino
+    assert _tabla_inversa.cache_info().hits == aciertos + 1
+    assert stats.kstest(destino.ravel(), stats.lognorm(0.6).cdf).pvalue > P_MINIMO
+
+
+def test_inversa_tabulada_argumentos_invalidos():
+    """Familias discretas o desconocidas y tolerancias fuera de rango se rechazan"""
+    generador = crear_generador('pcg64', semilla=50)
+    with pytest.raises(ValueError):
+        DistribucionContinua.inversa_tabulada('poisson', (3.0,), 10, generador)
+    with pytest.raises(ValueError):
+        DistribucionContinua.inversa_tabulada('no_existe', (), 10, generador)
+    with pytest.raises(ValueError):
+        DistribucionContinua.inversa_tabulada('normal', (0, 1), 10, generador, tolerancia=0.1)
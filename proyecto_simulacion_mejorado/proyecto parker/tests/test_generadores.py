@@ -0,0 +1,480 @@
+"""
+Pruebas de los generadores pseudoaleatorios
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+from scipy import stats
+from scipy.stats import qmc
+
+from core.distribuciones import DistribucionContinua
+from core.generadores import (MOTORES, AcumuladorAutocorrelacion, AcumuladorChiCuadrado,
+                              AcumuladorCorridas, AcumuladorEspectral, AcumuladorHuecos,
+                              AcumuladorPoker, AcumuladorPrueba, AcumuladorSerial,
+                              GeneradorAntitetico, GestorFlujos, PruebasAleatoriedad,
+                              SecuenciaCuasialeatoria, SecuenciaHalton, SecuenciaSobol,
+                              TablaAlias, _tabla_potencias_128, crear_generador)
+
+
+MOTORES_CON_HISTORIAL = ['lcg', 'gcm', 'mt19937', 'philox']
+
+
+@pytest.mark.parametrize('motor', MOTORES_CON_HISTORIAL)
+def test_historial_una_entrada_por_numero(motor):
+    """La semilla, una entrada por número entregado y una por salto"""
+    generador = crear_generador(motor, semilla=3, historial='completo', tam_buffer=0)
+    generador.siguiente()
+    generador.bloque(700)
+    generador.saltar(1000)
+    generador.siguiente()
+    assert len(generador.historial) == 1 + 1 + 700 + 1 + 1
+
+
+@pytest.mark.parametrize('motor', MOTORES_CON_HISTORIAL)
+def test_historial_salto_igual_al_ultimo_saltado(motor):
+    """saltar(k) registra la misma entrada que el número k entregado"""
+    con_salto = crear_generador(motor, semilla=3, historial='completo', tam_buffer=0)
+    con_salto.saltar(1500)
+    sin_salto = crear_generador(motor, semilla=3, historial='completo', tam_buffer=0)
+    sin_salto.bloque(1500)
+    assert con_salto.historial[-1] == sin_salto.historial[-1]
+
+
+def _recorrido(generador) -> list:
+    """Mezcla siguiente(), sincronizaciones, saltos, bloques y estados serializados"""
+    valores = [generador.siguiente() for _ in range(5)]
+    generador.estado
+    valores += [generador.siguiente() for _ in range(3)]
+    blob = generador.obtener_estado()
+    valores += [generador.siguiente() for _ in range(4)]
+    generador.restaurar_estado(blob)
+    valores += [generador.siguiente() for _ in range(2)]
+    generador.saltar(7)
+    valores += [generador.siguiente() for _ in range(2)]
+    valores += generador.bloque(10).tolist()
+    valores += pickle.loads(pickle.dumps(generador)).bloque(3).tolist()
+    return valores
+
+
+CONFIGURACIONES = [(motor, {}) for motor in MOTORES] + [
+    ('numpy', {'bit_generator': nombre})
+    for nombre in ('PCG64', 'PCG64DXSM', 'Philox', 'SFC64', 'MT19937')]
+
+
+@pytest.mark.parametrize('motor, opciones', CONFIGURACIONES)
+def test_flujo_con_y_sin_buffer(motor, opciones):
+    """El buffer de siguiente() no cambia el flujo entregado"""
+    con_buffer = crear_generador(motor, semilla=11, tam_buffer=4096, **opciones)
+    sin_buffer = crear_generador(motor, semilla=11, tam_buffer=0, **opciones)
+    assert _recorrido(con_buffer) == _recorrido(sin_buffer)
+
+
+
+@pytest.mark.parametrize('tam_buffer', [1, 3, 4096])
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_buffer_intercalado_con_bloques(motor, tam_buffer):
+    """bloque(), bloque_palabras() y llenar() continúan tras lo ya entregado"""
+    def recorrido(generador):
+        valores = [generador.siguiente() for _ in range(5)]
+        valores += generador.bloque(4).tolist()
+        valores.append(generador.siguiente())
+        valores += (generador.bloque_palabras(6) / 2**32).tolist()
+        valores.append(generador.siguiente())
+        destino = np.empty((2, 3))
+        valores += generador.llenar(destino).ravel().tolist()
+        valores += [generador.siguiente() for _ in range(2)]
+        return valores
+    
+    con_buffer = recorrido(crear_generador(motor, semilla=21, tam_buffer=tam_buffer))
+    sin_buffer = recorrido(crear_generador(motor, semilla=21, tam_buffer=0))
+    assert con_buffer == sin_buffer
+
+@pytest.mark.parametrize('politica', ['completo', 'anillo', 'disco'])
+@pytest.mark.parametrize('motor', MOTORES_CON_HISTORIAL)
+def test_historial_con_y_sin_buffer(motor, politica):
+    """El buffer no registra en el historial estados que no se entregaron"""
+    historiales = []
+    for tam_buffer in (4096, 0):
+        generador = crear_generador(motor, semilla=1, historial=politica, tam_buffer=tam_buffer)
+        generador.siguiente()
+        generador.estado
+        generador.siguiente()
+        generador.bloque(5)
+        historiales.append(generador.historial.valores().tolist())
+    assert historiales[0] == historiales[1]
+    assert len(historiales[0]) == 1 + 2 + 5
+
+
+def test_historial_lcg_sin_estados_futuros():
+    """siguiente(), estado, siguiente() deja solo la semilla y dos estados"""
+    generador = crear_generador('lcg', semilla=1, historial='completo')
+    generador.siguiente()
+    generador.estado
+    generador.siguiente()
+    assert list(generador.historial) == [1, 1015568748, 1586005467]
+
+
+@pytest.mark.parametrize('antitetico', [False, True])
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_palabras_corresponden_a_uniformes(motor, antitetico):
+    """Cada palabra es floor(U * 2^32) del uniforme en la misma posición"""
+    def nuevo():
+        generador = crear_generador(motor, semilla=5)
+        return GeneradorAntitetico(generador) if antitetico else generador
+    
+    palabras = nuevo().bloque_palabras(1000)
+    uniformes = nuevo().bloque(1000)
+    assert np.array_equal(palabras, np.floor(uniformes * 2**32).astype(np.uint32))
+
+
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_antitetico_normal_correlacion_negativa(motor):
+    """normal() (Ziggurat, lee palabras) queda correlacionada negativamente"""
+    base = DistribucionContinua.normal(0, 1, 100000, crear_generador(motor, semilla=5))
+    espejo = DistribucionContinua.normal(
+        0, 1, 100000, GeneradorAntitetico(crear_generador(motor, semilla=5)))
+    assert np.corrcoef(base, espejo)[0, 1] < -0.3
+
+
+SEMILLAS = [0, 12345, 2**32 + 5, -5, 2**63 + 1, 2**70 + 1]
+
+
+@pytest.mark.parametrize('semilla', SEMILLAS)
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_escalar_igual_a_bloque(motor, semilla):
+    """siguiente() sin buffer, bloque() y llenar() entregan el mismo flujo"""
+    if motor == 'numpy' and semilla < 0:
+        pytest.skip("numpy.random no acepta semillas negativas")
+    escalar = crear_generador(motor, semilla=semilla, tam_buffer=0)
+    valores = np.array([escalar.siguiente() for _ in range(3000)])
+    assert np.array_equal(crear_generador(motor, semilla=semilla).bloque(3000), valores)
+    destino = np.empty((30, 100))
+    crear_generador(motor, semilla=semilla).llenar(destino)
+    assert np.array_equal(destino.ravel(), valores)
+    assert np.all((valores >= 0) & (valores < 1))
+
+
+@pytest.mark.parametrize('semilla', [2**40 + 1, 2**62 + 1, 2**63 + 1, 2**70 + 1, -7])
+def test_gcm_semillas_grandes_en_bloque(semilla):
+    """La rama uint64 del GCM no se desvía ni desborda con semillas >= 2**32"""
+    escalar = crear_generador('gcm', semilla=semilla, tam_buffer=0)
+    valores = np.array([escalar.siguiente() for _ in range(5000)])
+    bloque = crear_generador('gcm', semilla=semilla).bloque(5000)
+    assert np.array_equal(bloque, valores)
+    assert np.all((bloque > 0) & (bloque < 1))
+    assert len(np.unique(bloque)) == len(bloque)
+
+
+@pytest.mark.parametrize('k', [0, 1, 7, 1000, 4097])
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_saltar_igual_a_k_extracciones(motor, k):
+    """saltar(k) deja el generador donde lo dejarían k llamadas a siguiente()"""
+    saltado = crear_generador(motor, semilla=2**40 + 3)
+    saltado.saltar(k)
+    recorrido = crear_generador(motor, semilla=2**40 + 3, tam_buffer=0)
+    for _ in range(k):
+        recorrido.siguiente()
+    assert np.array_equal(saltado.bloque(50), recorrido.bloque(50))
+
+
+@pytest.mark.parametrize('motor', ['lcg', 'gcm'])
+def test_saltar_afin_compuesto(motor):
+    """Saltos grandes en O(log k) se componen: saltar(a) + saltar(b) == saltar(a + b)"""
+    por_partes = crear_generador(motor, semilla=9)
+    por_partes.saltar(10**12)
+    por_partes.saltar(3 * 10**11 + 5)
+    directo = crear_generador(motor, semilla=9)
+    directo.saltar(13 * 10**11 + 5)
+    assert por_partes.siguiente() == directo.siguiente()
+
+
+@pytest.mark.parametrize('flujo', [0, 1, 77, 2**100 + 3])
+def test_pcg64_flujos_bloque_igual_a_escalar(flujo):
+    """Las tablas afines derivadas por flujo reproducen la recurrencia escalar"""
+    escalar = crear_generador('pcg64', semilla=2**90 + 1, flujo=flujo, tam_buffer=0)
+    valores = np.array([escalar.siguiente() for _ in range(3000)])
+    assert np.array_equal(
+        crear_generador('pcg64', semilla=2**90 + 1, flujo=flujo).bloque(3000), valores)
+
+
+def test_pcg64_flujo_nuevo_no_reconstruye_potencias():
+    """Un flujo nuevo solo deriva C = c * S; las potencias se construyen una vez"""
+    GestorFlujos(1, motor='pcg64').generador(0).bloque(10)
+    antes = _tabla_potencias_128.cache_info().misses
+    gestor = GestorFlujos(1, motor='pcg64')
+    for replica in range(50):
+        gestor.generador(replica).bloque(10)
+    assert _tabla_potencias_128.cache_info().misses == antes
+
+
+@pytest.mark.parametrize('motor, opciones', CONFIGURACIONES)
+def test_restaurar_en_instancia_nueva(motor, opciones):
+    """El estado binario continúa el flujo en una instancia recién creada"""
+    original = crear_generador(motor, semilla=2**40 + 17, **opciones)
+    original.bloque(1234)
+    original.siguiente()
+    blob = original.obtener_estado()
+    esperado = original.bloque(500)
+    
+    nuevo = crear_generador(motor, semilla=1)
+    nuevo.restaurar_estado(blob)
+    assert nuevo.semilla == 2**40 + 17
+    assert np.array_equal(nuevo.bloque(500), esperado)
+
+
+def test_estado_numpy_sin_pickle():
+    """El estado del adaptador de NumPy no se decodifica con pickle"""
+    generador = crear_generador('numpy', semilla=3, bit_generator='Philox')
+    blob = generador.obtener_estado()
+    assert b'Philox' in blob and b'numpy' not in blob
+    
+    falso = crear_generador('numpy', semilla=3)
+    datos = bytearray(falso._empaquetar_motor())
+    datos[1:1 + len('PCG64')] = b'XXXXX'
+    with pytest.raises(ValueError):
+        falso._desempaquetar_motor(bytes(datos))
+
+
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_enteros_bloque_uniformes(motor):
+    """Lemire: enteros dentro de [low, high] y frecuencias uniformes (chi²)"""
+    generador = crear_generador(motor, semilla=8)
+    muestra = generador.enteros_bloque(-3, 3, 70000)
+    assert muestra.dtype == np.int64
+    assert muestra.min() == -3 and muestra.max() == 3
+    frecuencias = np.bincount(muestra + 3, minlength=7)
+    assert stats.chisquare(frecuencias).pvalue > 1e-4
+
+
+@pytest.mark.parametrize('low, high', [(0, 2**32 - 1), (5, 2**40), (-2**63, 2**63 - 1),
+                                       (0, 2**64 - 1)])
+def test_enteros_bloque_rangos_amplios(low, high):
+    """Rangos de más de 32 bits: límites respetados y deciles uniformes"""
+    muestra = crear_generador('pcg64', semilla=4).enteros_bloque(low, high, 20000)
+    valores = np.array([int(v) for v in muestra], dtype=object)
+    assert valores.min() >= low and valores.max() <= high
+    deciles = np.array([(int(v) - low) * 10 // (high - low + 1) for v in valores])
+    assert stats.chisquare(np.bincount(deciles, minlength=10)).pvalue > 1e-4
+
+
+def test_enteros_bloque_rango_invalido():
+    """Rangos vacíos o de más de 2^64 valores se rechazan"""
+    generador = crear_generador('philox', semilla=1)
+    with pytest.raises(ValueError):
+        generador.enteros_bloque(5, 4, 10)
+    with pytest.raises(ValueError):
+        generador.enteros_bloque(0, 2**64, 10)
+
+
+def test_eleccion_con_pesos():
+    """eleccion() con pesos sigue las probabilidades; peso cero no se elige"""
+    pesos = [0.5, 0.0, 0.2, 0.3]
+    generador = crear_generador('philox', semilla=6)
+    elegidos = generador.eleccion(['a', 'b', 'c', 'd'], 50000, pesos=pesos)
+    frecuencias = np.array([elegidos.count(x) for x in 'abcd'])
+    assert frecuencias[1] == 0
+    esperadas = 50000 * np.array([0.5, 0.2, 0.3])
+    assert stats.chisquare(frecuencias[[0, 2, 3]], esperadas).pvalue > 1e-4
+    with pytest.raises(ValueError):
+        generador.eleccion(['a', 'b'], 3, pesos=pesos)
+
+
+def test_tabla_alias_chi_cuadrado():
+    """TablaAlias reproduce pesos irregulares con muchos valores"""
+    pesos = np.arange(1, 51) ** 2.0
+    tabla = TablaAlias(pesos)
+    indices = tabla.muestrear(200000, crear_generador('pcg64', semilla=12))
+    frecuencias = np.bincount(indices, minlength=50)
+    assert stats.chisquare(frecuencias, 200000 * tabla.probabilidades).pvalue > 1e-4
+    with pytest.raises(ValueError):
+        TablaAlias([1.0, -1.0])
+
+
+@pytest.mark.parametrize('motor', list(MOTORES))
+def test_permutacion_valida(motor):
+    """permutacion(n) contiene cada índice una vez; un arreglo se permuta sin alterarse"""
+    generador = crear_generador(motor, semilla=13)
+    indices = generador.permutacion(100000)
+    assert np.array_equal(np.sort(indices), np.arange(100000))
+    arreglo = np.arange(30).reshape(10, 3)
+    permutado = generador.permutacion(arreglo)
+    assert np.array_equal(permutado[np.argsort(permutado[:, 0])], arreglo)
+    assert np.array_equal(arreglo, np.arange(30).reshape(10, 3))
+
+
+def test_permutacion_uniforme():
+    """Las 24 permutaciones de 4 elementos son equiprobables (chi²)"""
+    generador = crear_generador('philox', semilla=14)
+    codigos = [tuple(generador.permutacion(4)) for _ in range(4800)]
+    _, frecuencias = np.unique(codigos, axis=0, return_counts=True)
+    assert len(frecuencias) == 24
+    assert stats.chisquare(frecuencias).pvalue > 1e-4
+
+
+def test_permutacion_empates_de_clave():
+    """Con n grande hay claves de 32 bits repetidas; la posición sigue uniforme"""
+    generador = crear_generador('pcg64', semilla=15)
+    posiciones = [int(np.flatnonzero(generador.permutacion(100000) == 0)[0]) * 5 // 100000
+                  for _ in range(150)]
+    assert stats.chisquare(np.bincount(posiciones, minlength=5)).pvalue > 1e-4
+
+
+def test_shuffle_in_place():
+    """shuffle() reordena listas y arreglos en el mismo objeto"""
+    generador = crear_generador('mt19937', semilla=16)
+    lista = list(range(50))
+    assert generador.shuffle(lista) is lista
+    assert sorted(lista) == list(range(50)) and lista != list(range(50))
+    arreglo = np.arange(40.0).reshape(20, 2)
+    assert generador.shuffle(arreglo) is arreglo
+    assert np.array_equal(np.sort(arreglo[:, 0]), np.arange(0.0, 40.0, 2))
+    assert np.all(arreglo[:, 1] == arreglo[:, 0] + 1)
+
+
+@pytest.mark.parametrize('dimension', [1, 5, 21])
+def test_sobol_igual_a_scipy(dimension):
+    """Sin aleatorizar, Sobol coincide con scipy.stats.qmc (Joe-Kuo, código Gray)"""
+    esperado = qmc.Sobol(dimension, scramble=False).random(4096)
+    assert np.array_equal(SecuenciaSobol(dimension).puntos(4096), esperado)
+
+
+@pytest.mark.parametrize('dimension', [1, 4, 10])
+def test_halton_igual_a_scipy(dimension):
+    """Sin aleatorizar, Halton coincide con scipy.stats.qmc"""
+    esperado = qmc.Halton(dimension, scramble=False).random(3000)
+    np.testing.assert_allclose(SecuenciaHalton(dimension).puntos(3000), esperado,
+                               rtol=0, atol=1e-15)
+
+
+@pytest.mark.parametrize('clase, aleatorizacion', [
+    (SecuenciaSobol, None), (SecuenciaSobol, 'desplazamiento'), (SecuenciaSobol, 'matricial'),
+    (SecuenciaHalton, None), (SecuenciaHalton, 'desplazamiento')])
+def test_secuencia_por_tramos_y_saltos(clase, aleatorizacion):
+    """puntos() por tramos y saltar() recorren los mismos puntos que puntos_en()"""
+    secuencia = clase(3, aleatorizacion, generador=crear_generador('philox', semilla=2))
+    completo = secuencia.puntos_en(0, 1000)
+    tramos = np.vstack([secuencia.puntos(300), secuencia.puntos(200)])
+    secuencia.saltar(100)
+    tramos = np.vstack([tramos, secuencia.puntos(400)])
+    assert np.array_equal(tramos[:500], completo[:500])
+    assert np.array_equal(tramos[500:], completo[600:])
+    assert np.all((completo >= 0) & (completo < 1))
+
+
+@pytest.mark.parametrize('aleatorizacion', ['desplazamiento', 'matricial'])
+def test_sobol_aleatorizado_insesgado(aleatorizacion):
+    """Las réplicas aleatorizadas estiman sin sesgo una integral conocida"""
+    secuencia = SecuenciaSobol(4, aleatorizacion, generador=crear_generador('pcg64', semilla=3))
+    estimaciones = []
+    for _ in range(20):
+        secuencia.realeatorizar()
+        estimaciones.append(np.prod(secuencia.puntos(1024), axis=1).mean())
+    # E[x1 x2 x3 x4] = 1/16; las réplicas difieren entre sí
+    assert abs(np.mean(estimaciones) - 1 / 16) < 1e-3
+    assert np.std(estimaciones) > 0
+
+
+def test_secuencia_base_abstracta():
+    """La base no se instancia sin puntos_en()"""
+    with pytest.raises(TypeError):
+        SecuenciaCuasialeatoria(2)
+
+
+def _comparar_resultados(a, b):
+    """Compara resultados de pruebas (diccionarios anidados) con tolerancia numérica"""
+    assert a.keys() == b.keys()
+    for clave in a:
+        if isinstance(a[clave], dict):
+            _comparar_resultados(a[clave], b[clave])
+        elif isinstance(a[clave], (bool, np.bool_, str)) or a[clave] is None:
+            assert a[clave] == b[clave], clave
+        else:
+            assert a[clave] == pytest.approx(b[clave], rel=1e-9, abs=1e-12), clave
+
+
+FABRICAS_ACUMULADORES = [
+    AcumuladorChiCuadrado, AcumuladorCorridas, AcumuladorHuecos, AcumuladorPoker,
+    AcumuladorSerial, lambda: AcumuladorAutocorrelacion((1, 2, 7)),
+    lambda: AcumuladorEspectral(1024)]
+
+
+@pytest.mark.parametrize('fabrica', FABRICAS_ACUMULADORES)
+def test_acumulador_fusionar_igual_a_un_solo_paso(fabrica):
+    """Tramos con actualizar() y segmentos con fusionar() dan el resultado de una pasada"""
+    datos = crear_generador('philox', semilla=17).bloque(102400)
+    completo = fabrica().actualizar(datos).resultado()
+    
+    por_tramos = fabrica()
+    for inicio in range(0, len(datos), 7000):
+        por_tramos.actualizar(datos[inicio:inicio + 7000])
+    _comparar_resultados(por_tramos.resultado(), completo)
+    
+    primero = fabrica().actualizar(datos[:51200])
+    segundo = fabrica().actualizar(datos[51200:])
+    _comparar_resultados(primero.fusionar(segundo).resultado(), completo)
+
+
+def test_acumulador_fusionar_incompatible():
+    """fusionar() rechaza acumuladores de otro tipo o con otros parámetros"""
+    with pytest.raises(ValueError):
+        AcumuladorChiCuadrado().fusionar(AcumuladorCorridas())
+    with pytest.raises(ValueError):
+        AcumuladorChiCuadrado(10).fusionar(AcumuladorChiCuadrado(20))
+
+
+def test_acumulador_base_abstracto():
+    """La base no se instancia sin actualizar(), fusionar() y resultado()"""
+    with pytest.raises(TypeError):
+        AcumuladorPrueba()
+
+
+def test_bateria_flujo_igual_a_bateria():
+    """bateria_flujo() por bloques coincide con bateria() sobre los mismos datos"""
+    n = 300000
+    datos = crear_generador('pcg64', semilla=18).bloque(n)
+    en_memoria = PruebasAleatoriedad.bateria(datos)
+    controles = []
+    flujo = PruebasAleatoriedad.bateria_flujo(crear_generador('pcg64', semilla=18), n,
+                                              tam_bloque=12345, puntos_control=3,
+                                              informe=controles.append)
+    _comparar_resultados(flujo['pruebas'], en_memoria['pruebas'])
+    assert flujo['aprobadas'] == en_memoria['aprobadas']
+    assert flujo['n'] == n
+    assert controles == flujo['puntos_control'] and controles[-1]['n'] == n
+
+
+def test_pruebas_vectorizadas_igual_a_referencia():
+    """Chi², corridas, serial y autocorrelación coinciden con su definición directa"""
+    datos = crear_generador('mt19937', semilla=19).bloque(20000)
+    
+    chi = PruebasAleatoriedad.prueba_chisquare(datos, bins=10)
+    frecuencias, _ = np.histogram(datos, bins=10, range=(0, 1))
+    assert chi['p_valor'] == pytest.approx(stats.chisquare(frecuencias).pvalue)
+    
+    cambios = sum((datos[i + 1] > datos[i]) != (datos[i + 2] > datos[i + 1])
+                  for i in range(len(datos) - 2))
+    assert PruebasAleatoriedad.prueba_corridas(datos)['corridas_observadas'] == cambios + 1
+    
+    celdas = (datos * 8).astype(int)
+    pares = np.bincount(celdas[0::2] * 8 + celdas[1::2], minlength=64)
+    serial = PruebasAleatoriedad.prueba_serial(datos, celdas=8)
+    assert serial['p_valor'] == pytest.approx(stats.chisquare(pares).pvalue)
+    
+    centrados = datos - 0.5
+    for retardo, r in PruebasAleatoriedad.prueba_autocorrelacion(datos, (1, 4))['retardos'].items():
+        esperado = 12 / (len(datos) - retardo) * np.sum(centrados[:-retardo] * centrados[retardo:])
+        assert r['autocorrelacion'] == pytest.approx(esperado)
+
+
+def test_pruebas_detectan_flujos_defectuosos():
+    """Cada prueba rechaza el defecto que busca"""
+    datos = crear_generador('philox', semilla=20).bloque(1 << 16)
+    P = PruebasAleatoriedad
+    assert P.prueba_chisquare(datos ** 1.1)['uniforme'] is False
+    assert P.prueba_corridas(np.sort(datos))['aleatorio'] is False
+    assert P.prueba_serial(np.repeat(datos[::2], 2))['aleatorio'] is False
+    assert P.prueba_autocorrelacion(np.repeat(datos[::2], 2))['aleatorio'] is False
+    assert P.prueba_espectral(np.tile(datos[:16], 4096))['aleatorio'] is False
+    assert P.bateria(datos)['aprobadas'] >= 6